@@ -0,0 +1,84 @@
+"""Compares deposit queries through account_helper and AccountIndex.
+
+Answers QUERIES maximum nominal for deposit queries, at deposits drawn from
+the sample page's minimum deposits, over the sample page's accounts
+repeated to each of COUNTS accounts: one at a time through account_helper
+and AccountIndex, and all at once through AccountIndex.indexes_for_deposits.
+Reports microseconds per query, and the one off cost of building the index.
+Then indexes TIED_COUNTS accounts all having the same nominal rate, each
+with its own min_deposit, and answers a deposit at every min_deposit at
+once, reporting the time and traced peak memory taken.
+Run from the repository root with
+
+    python -m benchmarks.bench_account_index
+
+@author Adrian Parker
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from src import account_helper
+from src.account_index import AccountIndex
+from src.call_account import CallAccount
+from src.data_provider import get_call_accounts
+
+COUNTS = (116, 1160, 11600)
+QUERIES = 2000
+TIED_COUNTS = (5000, 10000, 20000)
+
+
+def per_query(query, deposits):
+    start = time.perf_counter()
+    for deposit in deposits:
+        query(deposit)
+    return (time.perf_counter() - start) / len(deposits)
+
+
+def main():
+    sample = get_call_accounts()
+    generator = random.Random(0)
+    deposits = [generator.choice(sample).min_deposit for _ in range(QUERIES)]
+    print('%8s %14s %14s %14s %12s' % ('accounts', 'helper us/q',
+                                       'index us/q', 'batch us/q', 'build ms'))
+    for count in COUNTS:
+        accounts = sample * (count // len(sample))
+        start = time.perf_counter()
+        index = AccountIndex(accounts)
+        build = time.perf_counter() - start
+        helper = per_query(
+            lambda deposit:
+            account_helper.get_accounts_with_maximum_nominal_for_deposit(
+                accounts, deposit), deposits)
+        indexed = per_query(
+            index.get_accounts_with_maximum_nominal_for_deposit, deposits)
+        start = time.perf_counter()
+        index.indexes_for_deposits(deposits)
+        batch = (time.perf_counter() - start) / len(deposits)
+        print('%8d %14.1f %14.2f %14.3f %12.1f' % (
+            count, helper * 1e6, indexed * 1e6, batch * 1e6, build * 1e3))
+    print()
+    print('%8s %12s %12s %12s' % ('tied', 'build ms', 'batch ms', 'peak MB'))
+    for count in TIED_COUNTS:
+        accounts = [CallAccount(['Bank', 'A', 'Saver', float(i), 1.0])
+                    for i in range(count)]
+        tracemalloc.start()
+        start = time.perf_counter()
+        index = AccountIndex(accounts)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        index.indexes_for_deposits(np.arange(float(count)))
+        batch = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('%8d %12.1f %12.1f %12.1f' % (count, build * 1e3, batch * 1e3,
+                                            peak / 1e6))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Compares memory and construction cost of CallAccount representations.
+
+Builds the sample page's accounts repeated to COUNT accounts, each from
+newly created strings as a parser would, with the original dict based
+class, the slotted CallAccount from a data list and from fields, and
+FrozenCallAccount. Reports traced bytes retained per account, including
+its strings, and construction time. Run from the repository root with
+
+    python -m benchmarks.bench_call_account
+
+@author Adrian Parker
+"""
+
+import sys
+import time
+import tracemalloc
+
+from src.call_account import CallAccount
+from src.call_account import FrozenCallAccount
+from src.data_provider import get_call_accounts
+
+COUNT = 100000
+
+
+class DictCallAccount:
+    """The original CallAccount, storing fields in a per-instance dict."""
+
+    def __init__(self, data):
+        self.institution = data[0]
+        self.credit_rating = data[1]
+        self.name = data[2]
+        self.min_deposit = data[3]
+        self.nominal = data[4]
+
+
+def fresh(row):
+    # new string objects per row, as a parser would produce
+    return [''.join(row[0]), row[1] and ''.join(row[1]), ''.join(row[2]),
+            row[3], row[4], row[5]]
+
+
+def measure(create, rows):
+    tracemalloc.start()
+    accounts = [create(fresh(row)) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del accounts
+    rows = [fresh(row) for row in rows]
+    start = time.perf_counter()
+    accounts = [create(row) for row in rows]
+    return size / len(rows), (time.perf_counter() - start) / len(rows)
+
+
+def main():
+    sample = [account.to_row() for account in get_call_accounts()]
+    rows = sample * (COUNT // len(sample))
+    representations = [
+        ('dict class', DictCallAccount),
+        ('slots, list', CallAccount),
+        ('slots, fields', lambda row: CallAccount.from_fields(*row)),
+        ('frozen, fields', lambda row: FrozenCallAccount.from_fields(*row)),
+    ]
+    print('%-16s %14s %12s' % ('representation', 'bytes/account', 'ns/account'))
+    for name, create in representations:
+        size, seconds = measure(create, rows)
+        print('%-16s %14.0f %12.0f' % (name, size, seconds * 1e9))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Compares call account parsing throughput of each parser backend.
+
+Parses the embedded sample page, and a synthetic page with every account
+table scaled up 100x, reporting rows/sec for each backend. Run from the
+repository root with
+
+    python -m benchmarks.bench_parsers
+
+@author Adrian Parker
+"""
+
+import re
+import sys
+import time
+
+from src.data_provider import _get_call_account_html
+from src.data_provider import _lxml_available
+from src.data_provider import CallAccountPage
+from src.data_provider import LXML_PARSER
+from src.data_provider import PARSERS
+
+SCALE = 100
+
+
+def scale_page(html, scale):
+    """Returns given page with the rows of every table body repeated scale times."""
+    return re.sub(r'(<tbody>)(.*?)(</tbody>)',
+                  lambda m: m.group(1) + m.group(2) * scale + m.group(3),
+                  html, flags=re.DOTALL)
+
+
+def rows_per_second(html, parser, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = CallAccountPage(html, parser).rows
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(rows), len(rows) / best
+
+
+def main():
+    sample = _get_call_account_html(False)
+    pages = [('sample', sample, 20),
+             ('sample x' + str(SCALE), scale_page(sample, SCALE), 3)]
+    print('%-14s %-12s %8s %12s' % ('page', 'parser', 'rows', 'rows/sec'))
+    for page_name, html, repeat in pages:
+        for parser in PARSERS:
+            if parser == LXML_PARSER and not _lxml_available():
+                print('%-14s %-12s %8s %12s' %
+                      (page_name, parser, '-', 'not installed'))
+                continue
+            rows, rate = rows_per_second(html, parser, repeat)
+            print('%-14s %-12s %8d %12.0f' % (page_name, parser, rows, rate))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
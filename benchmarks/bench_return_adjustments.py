@@ -0,0 +1,48 @@
+"""Compares the per call cost of the return adjustment rounding modes.
+
+Times real_return_from_nominal for each of return_adjustments.MODES, one
+call at a time over COUNT (nominal, tax rate, inflation) combinations drawn
+from the sample page's nominal rates, then real_returns_from_nominal over
+the same combinations as arrays. Run from the repository root with
+
+    python -m benchmarks.bench_return_adjustments
+
+@author Adrian Parker
+"""
+
+import random
+import sys
+import time
+
+import numpy as np
+
+from src.data_provider import get_call_accounts
+from src.return_adjustments import MODES
+from src.return_adjustments import real_return_from_nominal
+from src.return_adjustments import real_returns_from_nominal
+
+COUNT = 200000
+TAX_RATES = (0.105, 0.175, 0.30, 0.33, 0.39)
+
+
+def main():
+    generator = random.Random(0)
+    nominals = [account.nominal / 100 for account in get_call_accounts()]
+    combinations = [(generator.choice(nominals), generator.choice(TAX_RATES),
+                     generator.uniform(-0.01, 0.05)) for _ in range(COUNT)]
+    arrays = [np.array(column) for column in zip(*combinations)]
+    print('%-10s %12s %12s' % ('mode', 'scalar ns', 'array ns'))
+    for mode in MODES:
+        start = time.perf_counter()
+        for nominal, tax_rate, inflation in combinations:
+            real_return_from_nominal(nominal, tax_rate, inflation, mode)
+        scalar = (time.perf_counter() - start) / COUNT
+        start = time.perf_counter()
+        real_returns_from_nominal(*arrays, mode=mode)
+        array = (time.perf_counter() - start) / COUNT
+        print('%-10s %12.0f %12.1f' % (mode, scalar * 1e9, array * 1e9))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Compares building the scenario grid with a loop of scalar calls.
+
+Times ScenarioGrid.real_returns over the sample page's accounts, the
+scenario_grid.NZ_TAX_RATES and INFLATIONS inflation rates, against calling
+real_return_from_nominal for every cell, then times the streamed best
+account per (tax rate, inflation) cell with a small chunk_bytes. Run from
+the repository root with
+
+    python -m benchmarks.bench_scenario_grid
+
+@author Adrian Parker
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from src.data_provider import get_call_accounts
+from src.return_adjustments import MODES
+from src.return_adjustments import real_return_from_nominal
+from src.scenario_grid import ACCOUNT_AXIS
+from src.scenario_grid import NZ_TAX_RATES
+from src.scenario_grid import ScenarioGrid
+
+INFLATIONS = tuple(np.linspace(-0.01, 0.05, 48))
+STREAM_CHUNK_BYTES = 256 * 1024
+
+
+def main():
+    accounts = get_call_accounts()
+    cells = len(accounts) * len(NZ_TAX_RATES) * len(INFLATIONS)
+    print('%d cells' % cells)
+    print('%-10s %12s %12s %12s' % ('mode', 'loop ms', 'grid ms', 'stream ms'))
+    for mode in MODES:
+        start = time.perf_counter()
+        for account in accounts:
+            for tax_rate in NZ_TAX_RATES:
+                for inflation in INFLATIONS:
+                    real_return_from_nominal(account.nominal / 100, tax_rate,
+                                             inflation, mode)
+        loop = time.perf_counter() - start
+        start = time.perf_counter()
+        ScenarioGrid(accounts, INFLATIONS, mode=mode).real_returns()
+        grid = time.perf_counter() - start
+        start = time.perf_counter()
+        ScenarioGrid(accounts, INFLATIONS, mode=mode,
+                     chunk_bytes=STREAM_CHUNK_BYTES).argmax(ACCOUNT_AXIS)
+        stream = time.perf_counter() - start
+        print('%-10s %12.1f %12.1f %12.1f' % (mode, loop * 1e3, grid * 1e3,
+                                              stream * 1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Measures the peak memory and time saved by table scoped parsing.
+
+Parses the embedded sample page into a full BeautifulSoup tree and into a
+tree restricted to the account tables, reporting peak traced memory and
+best parse time for each. Run from the repository root with
+
+    python -m benchmarks.bench_strainer
+
+@author Adrian Parker
+"""
+
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from src.data_provider import _ACCOUNT_TABLE_STRAINER
+from src.data_provider import _get_call_account_html
+from src.data_provider import SOUP_PARSER
+
+REPEAT = 20
+
+
+def measure(html, parse_only):
+    tracemalloc.start()
+    BeautifulSoup(html, SOUP_PARSER, parse_only=parse_only)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        BeautifulSoup(html, SOUP_PARSER, parse_only=parse_only)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return peak, best
+
+
+def main():
+    html = _get_call_account_html(False)
+    full_peak, full_time = measure(html, None)
+    table_peak, table_time = measure(html, _ACCOUNT_TABLE_STRAINER)
+    print('%-8s %12s %10s' % ('tree', 'peak KiB', 'ms'))
+    print('%-8s %12.0f %10.2f' % ('full', full_peak / 1024, full_time * 1000))
+    print('%-8s %12.0f %10.2f' % ('tables', table_peak / 1024, table_time * 1000))
+    print('saved    %11.0f%% %9.0f%%' % (100 * (1 - table_peak / full_peak),
+                                         100 * (1 - table_time / full_time)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
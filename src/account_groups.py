@@ -0,0 +1,134 @@
+"""Groups accounts by institution, credit rating and institution type.
+
+@author Adrian Parker
+"""
+
+from operator import attrgetter
+
+# fields AccountGroups indexes by default
+GROUP_FIELDS = ('institution', 'credit_rating', 'institution_type')
+
+
+class AccountGroups:
+    """Hash index of a snapshot of accounts, over several fields at once.
+
+    Built in one pass over the accounts, after which lookups by any indexed
+    field are O(1) dict lookups, rather than the scan of every account made
+    by account_helper.get_accounts_for_institution. A field may also be a
+    tuple of fields, indexing accounts by their combined values.
+
+    The index holds its own copy of the accounts, so later changes to the
+    list it was built from do not affect it. Results are new lists in the
+    order accounts were indexed. Accounts with no value for a field, such as
+    the None credit rating of many accounts, are grouped under None.
+    """
+
+    def __init__(self, accounts, fields=GROUP_FIELDS):
+        """Indexes given accounts.
+
+        Args:
+            accounts: iterable of accounts, read once
+            fields: sequence of str account fields, or tuples of them, to
+                index by. Default GROUP_FIELDS
+        """
+
+        self.fields = tuple(fields)
+        self._accounts = tuple(accounts)
+        self._groups = _group(self._accounts, self.fields)
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def get(self, field, value):
+        """Provides the accounts having given value of an indexed field.
+
+        Args:
+            field: str field, or tuple of fields, the index was built with
+            value: value of the field, or tuple of values, to look up
+        Returns:
+            array of 0..* accounts
+        Raises:
+            Exception if field is not indexed
+        """
+
+        return list(self._get_groups(field).get(value, ()))
+
+    def count(self, field, value):
+        """Provides the number of accounts having given value of an indexed field.
+
+        Raises:
+            Exception if field is not indexed
+        """
+
+        return len(self._get_groups(field).get(value, ()))
+
+    def groups(self, field):
+        """Provides all groups of accounts for an indexed field.
+
+        Args:
+            field: str field, or tuple of fields, the index was built with
+        Returns:
+            dict of field value to array of 1..* accounts, in the order each
+            value was first seen
+        Raises:
+            Exception if field is not indexed
+        """
+
+        return dict((value, list(accounts))
+                    for value, accounts in self._get_groups(field).items())
+
+    def for_institution(self, institution):
+        """Indexed version of account_helper.get_accounts_for_institution."""
+        return self.get('institution', institution)
+
+    def for_credit_rating(self, credit_rating):
+        """Provides the accounts having given credit rating, or None."""
+        return self.get('credit_rating', credit_rating)
+
+    def for_institution_type(self, institution_type):
+        """Indexed version of account_helper.get_accounts_for_institution_type."""
+        return self.get('institution_type', institution_type)
+
+    def _get_groups(self, field):
+        groups = self._groups.get(field)
+        if groups is None:
+            raise Exception('Accounts are not indexed by ' + repr(field))
+        return groups
+
+
+def group_accounts_by(accounts, field):
+    """Groups accounts by a field in one pass.
+
+    Args:
+        accounts: iterable of accounts, read once
+        field: str account field, or tuple of fields, to group by
+    Returns:
+        dict of field value, or tuple of values, to array of 1..* accounts,
+        in the order each value was first seen
+    """
+
+    return _group(accounts, (field,))[field]
+
+
+def _group(accounts, fields):
+    # one pass, appending each account to its group for every field
+    getters = [(_key_getter(field), {}) for field in fields]
+    for account in accounts:
+        for get_key, groups in getters:
+            key = get_key(account)
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [account]
+            else:
+                group.append(account)
+    return dict((field, groups) for field, (_, groups) in zip(fields, getters))
+
+
+def _key_getter(field):
+    if isinstance(field, tuple) and len(field) == 1:
+        # attrgetter of a single field would not give a tuple
+        get = attrgetter(field[0])
+        return lambda account: (get(account),)
+    if isinstance(field, tuple):
+        return attrgetter(*field)
+    return attrgetter(field)
@@ -3,12 +3,30 @@
 @author Adrian Parker
 """
 
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from operator import itemgetter
+
+from src.credit_rating import required_rating_ordinal
+from src.return_adjustments import real_return_from_nominal
+
+# directions of an objective of pareto_frontier
+MAXIMISE = 1
+MINIMISE = -1
+
+# the highest nominal rate, from the best rated institution, for the least
+# deposit
+PARETO_OBJECTIVES = (('nominal', MAXIMISE), ('rating_ordinal', MAXIMISE),
+                     ('min_deposit', MINIMISE))
+
 
 def get_accounts_for_institution(accounts, institution):
     """Provides the accounts available from the given institution.
 
     Args:
-        accounts: array of accounts to filter by institution
+        accounts: iterable of accounts to filter by institution
+        institution: str institution to filter by
     Returns:
         array of 0..* accounts provided by given institution
     """
@@ -20,29 +38,35 @@ def get_accounts_for_institution(accounts, institution):
     return institution_accounts
 
 
+def get_accounts_for_institution_type(accounts, institution_type):
+    """Provides the accounts listed under the given type of institution.
+
+    Args:
+        accounts: iterable of accounts to filter by institution type
+        institution_type: str page section title, e.g. 'Banks'
+    Returns:
+        array of 0..* accounts provided by given type of institution
+    """
+
+    return [account for account in accounts
+            if account.institution_type == institution_type]
+
+
 def get_accounts_with_maximum_nominal(accounts):
     """Provides the accounts that have maximum nominal interest.
 
     Args:
-        accounts: non empty array of accounts to find maximum nominal within
+        accounts: non empty iterable of accounts to find maximum nominal
+            within, read once
     Returns:
         array of 1..* accounts that have maximum nominal
     Raises:
-        Exception if null or empty array of accounts provided
+        Exception if null or empty iterable of accounts provided
     """
 
-    if not accounts or len(accounts) == 0:
+    accounts_seen, accounts_having_max_nominal = _get_maximum_nominal(accounts)
+    if accounts_seen == 0:
         raise Exception('Must provide array of accounts')
-    accounts_having_max_nominal = []
-    for account in accounts:
-        if len(accounts_having_max_nominal) == 0:
-            accounts_having_max_nominal.append(account)
-        else:
-            if account.nominal > accounts_having_max_nominal[0].nominal:
-                accounts_having_max_nominal.clear()
-                accounts_having_max_nominal.append(account)
-            elif account.nominal == accounts_having_max_nominal[0].nominal:
-                accounts_having_max_nominal.append(account)
     return accounts_having_max_nominal
 
 
@@ -50,20 +74,168 @@ def get_accounts_with_maximum_nominal_for_deposit(accounts, deposit=0):
     """Provides the accounts that have maximum nominal interest that are accessible with given deposit.
 
     Args:
-        accounts: array of accounts to find maximum nominal for given deposit within
+        accounts: iterable of accounts to find maximum nominal for given
+            deposit within, read once
         deposit: float of deposit the maximum account must accommodate, Default 0.
     Returns:
-        array of 1..* accounts that have maximum nominal and accommodate given deposit amount
+        array of 0..* accounts that have maximum nominal and accommodate given
+        deposit amount, empty if none accommodate it
+    Raises:
+        Exception if null or empty iterable of accounts provided
+    """
+
+    accounts_seen, accounts_having_max_nominal = _get_maximum_nominal(
+        accounts, deposit)
+    if accounts_seen == 0:
+        raise Exception('Must provide array of accounts')
+    return accounts_having_max_nominal
+
+
+def top_k_accounts(accounts, k, deposit=None, tax_rate=0, inflation=0,
+                   min_rating=None):
+    """Provides the k accounts with the highest real after tax return.
+
+    Accounts are filtered by deposit and credit rating first, so returns are
+    only calculated for those that qualify, and the best k are kept with a
+    bounded heap. Accounts with equal real return keep their given order.
+
+    Args:
+        accounts: iterable of accounts to rank, read once
+        k: int maximum number of accounts to provide
+        deposit: float of deposit the accounts must accommodate, Default
+            None, any.
+        tax_rate: float tax rate to adjust nominal rates for, Default 0.
+        inflation: float inflation rate to adjust by, Default 0.
+        min_rating: str lowest credit rating accepted, e.g. 'A-'. Default
+            None, any rating, including unrated accounts.
+    Returns:
+        array of 0..k (real return, account) tuples, highest real return
+        first. Real returns are fractions, as the nominal rates of accounts
+        are percentages
     Raises:
-        Exception if null or empty array of accounts provided
+        Exception if null accounts or unrecognised min_rating provided
+    """
+
+    if accounts is None:
+        raise Exception('Must provide array of accounts')
+    min_ordinal = None
+    if min_rating is not None:
+        min_ordinal = required_rating_ordinal(min_rating)
+    if k <= 0:
+        return []
+    # many accounts share a nominal rate, so each is only adjusted once
+    real_returns = {}
+
+    def ranked():
+        for account in accounts:
+            if deposit is not None and account.min_deposit > deposit:
+                continue
+            if min_ordinal is not None and account.rating_ordinal < min_ordinal:
+                continue
+            real = real_returns.get(account.nominal)
+            if real is None:
+                real = real_return_from_nominal(
+                    account.nominal / 100, tax_rate, inflation)
+                real_returns[account.nominal] = real
+            yield real, account
+
+    # nlargest is stable, keeping the first of equal returns first
+    return heapq.nlargest(k, ranked(), key=itemgetter(0))
+
+
+def pareto_frontier(accounts, objectives=PARETO_OBJECTIVES):
+    """Provides the accounts that no other account beats on every objective.
+
+    An account is beaten, or dominated, by another at least as good on every
+    objective and better on one. Uses a sort filter skyline: accounts sorted
+    best first on all objectives can only be dominated by those before them,
+    so each is compared with the frontier found so far rather than with
+    every other account.
+
+    Args:
+        accounts: iterable of accounts, read once
+        objectives: sequence of (str account field, MAXIMISE or MINIMISE)
+            tuples. Default PARETO_OBJECTIVES
+    Returns:
+        array of 0..* accounts on the frontier, in given order. Accounts
+        equal on every objective are all kept
     """
 
-    if not accounts or len(accounts) == 0:
+    accounts = list(accounts)
+    return [accounts[i] for i in _skyline(_objective_vectors(accounts, objectives))]
+
+
+def pareto_frontiers(snapshots, objectives=PARETO_OBJECTIVES, workers=None,
+                     chunksize=8):
+    """Provides the pareto_frontier of each of many snapshots, in parallel.
+
+    Only the objective values of each snapshot are sent to worker processes,
+    which return the positions of the accounts on its frontier.
+
+    Args:
+        snapshots: iterable of iterables of accounts, such as the snapshots
+            of a batch_ingest.BatchIngester
+        objectives: see pareto_frontier
+        workers: int worker processes. Default None, one per CPU.
+        chunksize: int snapshots handed to a worker at a time. Default 8.
+    Returns:
+        array with, for each snapshot, an array of the accounts on its
+        frontier, in given order
+    """
+
+    snapshots = [list(accounts) for accounts in snapshots]
+    vectors = [_objective_vectors(accounts, objectives) for accounts in snapshots]
+    with ProcessPoolExecutor(workers) as executor:
+        frontiers = executor.map(_skyline, vectors, chunksize=chunksize)
+        return [[accounts[i] for i in frontier]
+                for accounts, frontier in zip(snapshots, frontiers)]
+
+
+def _objective_vectors(accounts, objectives):
+    # tuples of objective values, negated where minimised so higher is better
+    getters = [(attrgetter(field), direction) for field, direction in objectives]
+    if all(direction == MAXIMISE for _, direction in getters):
+        return [tuple(get(account) for get, _ in getters) for account in accounts]
+    return [tuple(get(account) * direction for get, direction in getters)
+            for account in accounts]
+
+
+def _skyline(vectors):
+    # module level so it can run in a worker process; returns the positions
+    # of the undominated vectors in ascending order
+    order = sorted(range(len(vectors)), key=vectors.__getitem__, reverse=True)
+    frontier = []
+    positions = []
+    for i in order:
+        vector = vectors[i]
+        # in reverse order, every frontier vector is at least as good on the
+        # first objective, so dominates if as good on all the others
+        if not any(best != vector and all(
+                       b >= v for b, v in zip(best[1:], vector[1:]))
+                   for best in frontier):
+            frontier.append(vector)
+            positions.append(i)
+    positions.sort()
+    return positions
+
+
+def _get_maximum_nominal(accounts, deposit=None):
+    # single pass, so accounts may be a generator; returns the number of
+    # accounts seen along with those having maximum nominal
+    if accounts is None:
         raise Exception('Must provide array of accounts')
-    accounts_that_accommodate_deposit = []
+    accounts_seen = 0
+    accounts_having_max_nominal = []
     for account in accounts:
-        if account.min_deposit <= deposit:
-            accounts_that_accommodate_deposit.append(account)
-    if len(accounts_that_accommodate_deposit) > 0:
-        return get_accounts_with_maximum_nominal(accounts_that_accommodate_deposit)
-    return accounts_that_accommodate_deposit
+        accounts_seen += 1
+        if deposit is not None and account.min_deposit > deposit:
+            continue
+        if len(accounts_having_max_nominal) == 0:
+            accounts_having_max_nominal.append(account)
+        else:
+            if account.nominal > accounts_having_max_nominal[0].nominal:
+                accounts_having_max_nominal.clear()
+                accounts_having_max_nominal.append(account)
+            elif account.nominal == accounts_having_max_nominal[0].nominal:
+                accounts_having_max_nominal.append(account)
+    return accounts_seen, accounts_having_max_nominal
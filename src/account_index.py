@@ -0,0 +1,228 @@
+"""Answers maximum nominal queries over a fixed set of accounts in O(log n).
+
+@author Adrian Parker
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+
+import numpy as np
+
+# a prefix holding under 1/_SORT_FRACTION of a tie has its accounts sorted
+# directly, rather than filtered from the whole tie in original order
+_SORT_FRACTION = 8
+
+
+class AccountIndex:
+    """Accounts sorted once by min_deposit, with running maxima precomputed.
+
+    Accounts tied at each running maximum nominal, in min_deposit order,
+    are kept in one list per maximum, and every prefix of the accounts in
+    min_deposit order holds only its maximum's list and how many of its
+    accounts the prefix includes. A deposit query is then one binary search
+    for the accounts accommodating the deposit, giving results identical to
+    account_helper.get_accounts_with_maximum_nominal_for_deposit, ties
+    included. Each tie is ordered by original position once, when first
+    queried, and a prefix's accounts are read from it in O(tie) without
+    anything being kept per prefix. Many deposits can be answered at once
+    with indexes_for_deposits.
+
+    The accounts must not be changed while indexed.
+    """
+
+    def __init__(self, accounts):
+        """Indexes given accounts.
+
+        Args:
+            accounts: iterable of accounts, read once
+        """
+
+        self._accounts = accounts = list(accounts)
+        order = sorted(range(len(accounts)),
+                       key=lambda i: accounts[i].min_deposit)
+        self._min_deposits = [accounts[i].min_deposit for i in order]
+        # positions of the accounts tied at each running maximum, appended in
+        # min_deposit order, and for each prefix its maximum's list and the
+        # number of them in the prefix, so a tie copies nothing
+        self._tied = []
+        self._prefixes = []
+        maximum = None
+        for i in order:
+            nominal = accounts[i].nominal
+            if maximum is None or nominal > maximum:
+                maximum = nominal
+                self._tied.append([i])
+            elif nominal == maximum:
+                self._tied[-1].append(i)
+            self._prefixes.append((len(self._tied) - 1, len(self._tied[-1])))
+        # (positions in original order, their ranks in min_deposit order,
+        # their accounts), by tie, filled in when queried
+        self._by_position = [None] * len(self._tied)
+        self._min_deposit_array = np.array(self._min_deposits, dtype=np.float64)
+
+    def __len__(self):
+        return len(self._min_deposits)
+
+    def get_accounts_with_maximum_nominal(self):
+        """Provides the accounts that have maximum nominal interest.
+
+        Returns:
+            array of 1..* accounts that have maximum nominal, in the order
+            they were indexed
+        Raises:
+            Exception if no accounts were indexed
+        """
+
+        if not self._min_deposits:
+            raise Exception('Must provide array of accounts')
+        return self._get_accounts(len(self._min_deposits))
+
+    def get_accounts_with_maximum_nominal_for_deposit(self, deposit=0):
+        """Provides the accounts that have maximum nominal interest that are accessible with given deposit.
+
+        Args:
+            deposit: float of deposit the maximum account must accommodate, Default 0.
+        Returns:
+            array of 0..* accounts that have maximum nominal and accommodate
+            given deposit amount, in the order they were indexed
+        Raises:
+            Exception if no accounts were indexed
+        """
+
+        if not self._min_deposits:
+            raise Exception('Must provide array of accounts')
+        return self._get_accounts(bisect_right(self._min_deposits, deposit))
+
+    def indexes_for_deposits(self, deposits):
+        """Provides the accounts having maximum nominal for each of many deposits.
+
+        All deposits are located with a single numpy searchsorted. Answers
+        are TiedPositions, ordered only when read, and equal answers are the
+        same object, so the result takes O(deposits) time and memory however
+        many accounts are tied.
+
+        Args:
+            deposits: iterable or numpy array of float deposits
+        Returns:
+            array with, for each deposit, TiedPositions of the int positions,
+            in the order indexed, of the accounts having maximum nominal and
+            accommodating the deposit; empty if none accommodate it
+        Raises:
+            Exception if no accounts were indexed
+        """
+
+        if not self._min_deposits:
+            raise Exception('Must provide array of accounts')
+        deposits = np.asarray(
+            deposits if hasattr(deposits, '__len__') else list(deposits),
+            dtype=np.float64)
+        counts = np.searchsorted(self._min_deposit_array, deposits,
+                                 side='right')
+        answers = {}
+        result = []
+        for count in counts.tolist():
+            answer = answers.get(count)
+            if answer is None:
+                answer = answers[count] = TiedPositions(self, count)
+            result.append(answer)
+        return result
+
+    def _get_accounts(self, count):
+        if count == 0:
+            return []
+        tie, tied_count = self._prefixes[count - 1]
+        if tied_count == len(self._tied[tie]):
+            return list(self._get_by_position(tie)[2])
+        accounts = self._accounts
+        return [accounts[i] for i in self._get_positions(count)]
+
+    def _get_positions(self, count):
+        # positions, in original order, of the maxima of the first count
+        # accounts in min_deposit order
+        if count == 0:
+            return ()
+        tie, tied_count = self._prefixes[count - 1]
+        tied = self._tied[tie]
+        if tied_count * _SORT_FRACTION < len(tied):
+            return tuple(sorted(tied[:tied_count]))
+        positions, ranks, _ = self._get_by_position(tie)
+        if tied_count == len(tied):
+            return positions
+        return tuple(position for position, rank in zip(positions, ranks)
+                     if rank < tied_count)
+
+    def _get_by_position(self, tie):
+        by_position = self._by_position[tie]
+        if by_position is None:
+            tied = self._tied[tie]
+            ranks = sorted(range(len(tied)), key=tied.__getitem__)
+            positions = tuple(tied[rank] for rank in ranks)
+            accounts = self._accounts
+            by_position = (positions, ranks,
+                           tuple(accounts[i] for i in positions))
+            self._by_position[tie] = by_position
+        return by_position
+
+
+class TiedPositions(Sequence):
+    """Positions of the accounts answering a deposit, ordered when read.
+
+    Returned by AccountIndex.indexes_for_deposits. Holds only the index and
+    the number of accounts accommodating the deposit; the positions, in the
+    order accounts were indexed, are put in order on first read and kept by
+    this object alone. Compares equal to a tuple or list of the same
+    positions.
+    """
+
+    __slots__ = ('_index', '_count', '_positions')
+
+    def __init__(self, index, count):
+        self._index = index
+        self._count = count
+        self._positions = None
+
+    def __len__(self):
+        if self._count == 0:
+            return 0
+        return self._index._prefixes[self._count - 1][1]
+
+    def __getitem__(self, i):
+        return self._get()[i]
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __eq__(self, other):
+        if isinstance(other, (TiedPositions, tuple, list)):
+            return self._get() == tuple(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._get())
+
+    def __repr__(self):
+        return 'TiedPositions(' + repr(self._get()) + ')'
+
+    def _get(self):
+        if self._positions is None:
+            self._positions = self._index._get_positions(self._count)
+        return self._positions
+
+
+def best_accounts_for_deposits(accounts, deposits):
+    """Provides the accounts having maximum nominal for each of many deposits.
+
+    Answers every deposit with one vectorised search of the accounts sorted
+    by min_deposit, rather than a scan of the accounts per deposit.
+
+    Args:
+        accounts: iterable of accounts, read once
+        deposits: iterable of float deposits
+    Returns:
+        array with, for each deposit, TiedPositions of the int positions in
+        accounts of those having maximum nominal and accommodating the
+        deposit. See AccountIndex.indexes_for_deposits
+    """
+
+    return AccountIndex(accounts).indexes_for_deposits(deposits)
+
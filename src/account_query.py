@@ -0,0 +1,238 @@
+"""Lazy, composable queries over accounts.
+
+@author Adrian Parker
+"""
+
+import copy
+from operator import attrgetter
+
+from src.account_groups import AccountGroups
+from src.account_index import AccountIndex
+from src.credit_rating import required_rating_ordinal
+from src.credit_rating import UNRATED
+
+
+class Accounts:
+    """A lazy query over accounts, run when iterated.
+
+    Filters added with where, for_institution, for_institution_type,
+    for_rating_range and for_deposit, and a final max_by, are only
+    recorded. Iterating the query runs them all together in a single pass
+    over the accounts, without intermediate lists, yielding accounts in
+    their given order. Each call returns a new query, so partial queries can
+    be shared and extended.
+
+    When built with indexes, see indexed, predicates are pushed down to
+    them: an equality on a field of groups reads only the smallest matching
+    group rather than every account, and a maximum nominal for deposit
+    query with no other filters is answered by deposit_index directly.
+
+    Example:
+        Accounts(accounts).for_institution('BNZ').for_deposit(5000).max_by(
+            'nominal')
+    """
+
+    def __init__(self, accounts, groups=None, deposit_index=None):
+        """Creates a query over given accounts.
+
+        Args:
+            accounts: iterable of accounts, read on every iteration of the
+                query, so a generator supports only one
+            groups: optional AccountGroups built from the same accounts
+            deposit_index: optional AccountIndex built from the same accounts
+        """
+
+        self._accounts = accounts
+        self._groups = groups
+        self._deposit_index = deposit_index
+        self._equals = ()
+        self._predicates = ()
+        self._deposit = None
+        self._max_field = None
+
+    @classmethod
+    def indexed(cls, accounts):
+        """Creates a query over a snapshot of accounts, with indexes built.
+
+        Worth the one pass it takes when many queries are run over the same
+        accounts.
+
+        Args:
+            accounts: iterable of accounts, read once
+        Returns:
+            Accounts
+        """
+
+        accounts = list(accounts)
+        return cls(accounts, AccountGroups(accounts), AccountIndex(accounts))
+
+    def where(self, predicate=None, **fields):
+        """Filters accounts by a predicate and by field values.
+
+        Args:
+            predicate: function of an account, true to keep it. Default None.
+            fields: account field names and the values to keep, such as
+                institution='BNZ'. These can be pushed down to groups
+        Returns:
+            Accounts
+        Raises:
+            Exception if called after max_by
+        """
+
+        self._check_not_maximised()
+        query = copy.copy(self)
+        query._equals = self._equals + tuple(fields.items())
+        if predicate is not None:
+            query._predicates = self._predicates + (predicate,)
+        return query
+
+    def for_institution(self, institution):
+        """Filters accounts to those available from given institution."""
+        return self.where(institution=institution)
+
+    def for_institution_type(self, institution_type):
+        """Filters accounts to those listed under given institution type."""
+        return self.where(institution_type=institution_type)
+
+    def for_rating_range(self, min_rating=None, max_rating=None):
+        """Filters accounts to those rated within given range.
+
+        Ratings are compared as integer rating_ordinal values.
+
+        Args:
+            min_rating: str worst credit rating accepted, e.g. 'A-'. Default
+                None, any rating, including unrated accounts.
+            max_rating: str best credit rating accepted. Default None, any.
+        Returns:
+            Accounts
+        Raises:
+            Exception if a rating is unrecognised, or if called after max_by
+        """
+
+        low = (UNRATED if min_rating is None
+               else required_rating_ordinal(min_rating))
+        if max_rating is None:
+            return self.where(lambda account: account.rating_ordinal >= low)
+        high = required_rating_ordinal(max_rating)
+        return self.where(
+            lambda account: low <= account.rating_ordinal <= high)
+
+    def for_deposit(self, deposit):
+        """Filters accounts to those accommodating given deposit amount.
+
+        Args:
+            deposit: float of deposit the accounts must accommodate
+        Returns:
+            Accounts
+        Raises:
+            Exception if called after max_by
+        """
+
+        self._check_not_maximised()
+        query = copy.copy(self)
+        if self._deposit is None or deposit < self._deposit:
+            query._deposit = deposit
+        return query
+
+    def max_by(self, field):
+        """Keeps only the accounts having the maximum value of a field.
+
+        Like account_helper.get_accounts_with_maximum_nominal, all accounts
+        tied at the maximum are kept, but no accounts gives no results
+        rather than an Exception.
+
+        Args:
+            field: str account field to maximise, such as 'nominal'
+        Returns:
+            Accounts, to which no further filters can be added
+        Raises:
+            Exception if called after max_by
+        """
+
+        self._check_not_maximised()
+        query = copy.copy(self)
+        query._max_field = field
+        return query
+
+    def to_list(self):
+        """Runs the query.
+
+        Returns:
+            array of 0..* accounts
+        """
+
+        return list(self)
+
+    def __iter__(self):
+        if (self._max_field == 'nominal' and self._deposit_index is not None
+                and not self._equals and not self._predicates):
+            return iter(self._maximum_nominal_from_index())
+        accounts, equals = self._candidates()
+        matching = self._filter(accounts, equals)
+        if self._max_field is None:
+            return matching
+        return iter(_maxima(matching, attrgetter(self._max_field)))
+
+    def _check_not_maximised(self):
+        if self._max_field is not None:
+            raise Exception('Filters must be added before max_by')
+
+    def _maximum_nominal_from_index(self):
+        if len(self._deposit_index) == 0:
+            return []
+        if self._deposit is None:
+            return self._deposit_index.get_accounts_with_maximum_nominal()
+        return self._deposit_index.get_accounts_with_maximum_nominal_for_deposit(
+            self._deposit)
+
+    def _candidates(self):
+        # pushes the most selective equality down to groups, if any indexed
+        groups = self._groups
+        if groups is None:
+            return self._accounts, self._equals
+        best = None
+        for position, (field, value) in enumerate(self._equals):
+            if field in groups.fields:
+                count = groups.count(field, value)
+                if best is None or count < best[0]:
+                    best = (count, position)
+        if best is None:
+            return self._accounts, self._equals
+        field, value = self._equals[best[1]]
+        return (groups.get(field, value),
+                self._equals[:best[1]] + self._equals[best[1] + 1:])
+
+    def _filter(self, accounts, equals):
+        # one pass without intermediate lists; equalities are tested as one
+        # comparison of a tuple of fields, in the same test as the deposit
+        deposit = self._deposit
+        if equals:
+            get_key = attrgetter(*(field for field, _ in equals))
+            key = (equals[0][1] if len(equals) == 1
+                   else tuple(value for _, value in equals))
+            if deposit is None:
+                accounts = (account for account in accounts
+                            if get_key(account) == key)
+            else:
+                accounts = (account for account in accounts
+                            if account.min_deposit <= deposit
+                            and get_key(account) == key)
+        elif deposit is not None:
+            accounts = (account for account in accounts
+                        if account.min_deposit <= deposit)
+        for predicate in self._predicates:
+            accounts = filter(predicate, accounts)
+        return iter(accounts)
+
+
+def _maxima(accounts, get):
+    maxima = []
+    maximum = None
+    for account in accounts:
+        value = get(account)
+        if not maxima or value > maximum:
+            maximum = value
+            maxima = [account]
+        elif value == maximum:
+            maxima.append(account)
+    return maxima
@@ -0,0 +1,250 @@
+"""Column-wise storage of accounts, with vectorised filters and maxima.
+
+@author Adrian Parker
+"""
+
+import numpy as np
+
+from src.call_account import CallAccount
+from src.credit_rating import rating_ordinal
+from src.credit_rating import required_rating_ordinal
+
+
+class AccountTable:
+    """Accounts stored column-wise rather than as CallAccount objects.
+
+    min_deposit and nominal are float64 NumPy arrays. institution,
+    credit_rating and institution_type are dictionary encoded: int32 arrays
+    of codes that index the institutions, credit_ratings and
+    institution_types lists of distinct values. Filters
+    and maxima are vectorised over whole columns, mirroring the functions
+    in account_helper.
+
+    rating_ordinals holds the credit_rating ordinal of each row, see
+    credit_rating, so rating ranges are integer comparisons. Rows sorted by
+    ordinal are kept once first needed, so repeated range queries are
+    binary searches.
+    """
+
+    def __init__(self, institutions, institution_codes, credit_ratings,
+                 credit_rating_codes, names, min_deposit, nominal, movements,
+                 institution_types, institution_type_codes):
+        self.institutions = institutions
+        self.institution_codes = institution_codes
+        self.credit_ratings = credit_ratings
+        self.credit_rating_codes = credit_rating_codes
+        self.names = names
+        self.min_deposit = min_deposit
+        self.nominal = nominal
+        self.movements = movements
+        self.institution_types = institution_types
+        self.institution_type_codes = institution_type_codes
+        self._institution_lookup = dict(
+            (value, code) for code, value in enumerate(institutions))
+        self._institution_type_lookup = dict(
+            (value, code) for code, value in enumerate(institution_types))
+        code_ordinals = np.array(
+            [rating_ordinal(rating) for rating in credit_ratings], dtype=np.int8)
+        self.rating_ordinals = (code_ordinals[credit_rating_codes]
+                                if len(credit_ratings)
+                                else np.empty(0, dtype=np.int8))
+        self._rating_order = None
+        self._sorted_rating_ordinals = None
+
+    def __len__(self):
+        return len(self.nominal)
+
+    @classmethod
+    def from_accounts(cls, accounts):
+        """Creates a table from given accounts.
+
+        Args:
+            accounts: iterable of CallAccount
+        Returns:
+            AccountTable with one row per account, in order
+        """
+
+        institutions, institution_lookup, institution_codes = [], {}, []
+        credit_ratings, credit_rating_lookup, credit_rating_codes = [], {}, []
+        institution_types, institution_type_lookup, institution_type_codes = [], {}, []
+        names, min_deposit, nominal, movements = [], [], [], []
+        for account in accounts:
+            institution_codes.append(_encode(
+                account.institution, institutions, institution_lookup))
+            credit_rating_codes.append(_encode(
+                account.credit_rating, credit_ratings, credit_rating_lookup))
+            names.append(account.name)
+            min_deposit.append(account.min_deposit)
+            nominal.append(account.nominal)
+            movements.append(account.movement)
+            institution_type_codes.append(_encode(
+                account.institution_type, institution_types,
+                institution_type_lookup))
+        return cls(institutions, np.array(institution_codes, dtype=np.int32),
+                   credit_ratings, np.array(credit_rating_codes, dtype=np.int32),
+                   names, np.array(min_deposit, dtype=np.float64),
+                   np.array(nominal, dtype=np.float64), movements,
+                   institution_types,
+                   np.array(institution_type_codes, dtype=np.int32))
+
+    def to_accounts(self, indexes=None):
+        """Provides the rows of this table as CallAccount objects.
+
+        Args:
+            indexes: iterable of int rows to provide. Default None, all rows.
+        Returns:
+            array of CallAccount
+        """
+
+        if indexes is None:
+            indexes = range(len(self))
+        institution_codes = self.institution_codes.tolist()
+        credit_rating_codes = self.credit_rating_codes.tolist()
+        min_deposit = self.min_deposit.tolist()
+        nominal = self.nominal.tolist()
+        institution_type_codes = self.institution_type_codes.tolist()
+        return [CallAccount([self.institutions[institution_codes[i]],
+                             self.credit_ratings[credit_rating_codes[i]],
+                             self.names[i], min_deposit[i], nominal[i],
+                             self.movements[i],
+                             self.institution_types[institution_type_codes[i]]])
+                for i in indexes]
+
+    def take(self, indexes):
+        """Provides a new table of the given rows, with the same codes.
+
+        Args:
+            indexes: int array or sequence of rows to take
+        Returns:
+            AccountTable
+        """
+
+        indexes = np.asarray(indexes, dtype=np.intp)
+        return AccountTable(self.institutions, self.institution_codes[indexes],
+                            self.credit_ratings, self.credit_rating_codes[indexes],
+                            [self.names[i] for i in indexes.tolist()],
+                            self.min_deposit[indexes], self.nominal[indexes],
+                            [self.movements[i] for i in indexes.tolist()],
+                            self.institution_types,
+                            self.institution_type_codes[indexes])
+
+    def indexes_for_institution(self, institution):
+        """Provides the rows of accounts available from given institution.
+
+        Args:
+            institution: str institution to filter by
+        Returns:
+            int array of 0..* row indexes
+        """
+
+        code = self._institution_lookup.get(institution)
+        if code is None:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self.institution_codes == code)
+
+    def indexes_for_institution_type(self, institution_type):
+        """Provides the rows of accounts listed under given institution type.
+
+        Args:
+            institution_type: str institution type to filter by, e.g. 'Banks'
+        Returns:
+            int array of 0..* row indexes
+        """
+
+        code = self._institution_type_lookup.get(institution_type)
+        if code is None:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self.institution_type_codes == code)
+
+    def indexes_for_rating_range(self, min_rating=None, max_rating=None):
+        """Provides the rows of accounts rated within given range.
+
+        Args:
+            min_rating: str worst credit rating accepted, e.g. 'A-'. Default
+                None, any rating, including unrated accounts.
+            max_rating: str best credit rating accepted. Default None, any.
+        Returns:
+            int array of 0..* row indexes, in row order
+        Raises:
+            Exception if min_rating or max_rating is unrecognised
+        """
+
+        low = 0
+        high = len(self)
+        if min_rating is None and max_rating is None:
+            return np.arange(high)
+        order, ordinals = self._rating_index()
+        if min_rating is not None:
+            low = np.searchsorted(ordinals, required_rating_ordinal(min_rating),
+                                  side='left')
+        if max_rating is not None:
+            high = np.searchsorted(ordinals, required_rating_ordinal(max_rating),
+                                   side='right')
+        return np.sort(order[low:max(low, high)])
+
+    def indexes_with_maximum_nominal(self):
+        """Provides the rows of accounts that have maximum nominal interest.
+
+        Returns:
+            int array of 1..* row indexes
+        Raises:
+            Exception if table is empty
+        """
+
+        if len(self) == 0:
+            raise Exception('Must provide array of accounts')
+        return np.flatnonzero(self.nominal == self.nominal.max())
+
+    def indexes_with_maximum_nominal_for_deposit(self, deposit=0):
+        """Provides the rows with maximum nominal interest accessible with given deposit.
+
+        Args:
+            deposit: float of deposit the maximum account must accommodate, Default 0.
+        Returns:
+            int array of 0..* row indexes
+        Raises:
+            Exception if table is empty
+        """
+
+        if len(self) == 0:
+            raise Exception('Must provide array of accounts')
+        nominal = np.where(self.min_deposit <= deposit, self.nominal, -np.inf)
+        maximum = nominal.max()
+        if maximum == -np.inf:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(nominal == maximum)
+
+    def for_institution(self, institution):
+        """Table version of account_helper.get_accounts_for_institution."""
+        return self.take(self.indexes_for_institution(institution))
+
+    def for_institution_type(self, institution_type):
+        """Table version of account_helper.get_accounts_for_institution_type."""
+        return self.take(self.indexes_for_institution_type(institution_type))
+
+    def for_rating_range(self, min_rating=None, max_rating=None):
+        """Provides a table of the accounts rated within given range."""
+        return self.take(self.indexes_for_rating_range(min_rating, max_rating))
+
+    def with_maximum_nominal(self):
+        """Table version of account_helper.get_accounts_with_maximum_nominal."""
+        return self.take(self.indexes_with_maximum_nominal())
+
+    def with_maximum_nominal_for_deposit(self, deposit=0):
+        """Table version of account_helper.get_accounts_with_maximum_nominal_for_deposit."""
+        return self.take(self.indexes_with_maximum_nominal_for_deposit(deposit))
+
+    def _rating_index(self):
+        if self._rating_order is None:
+            self._rating_order = np.argsort(self.rating_ordinals, kind='stable')
+            self._sorted_rating_ordinals = self.rating_ordinals[self._rating_order]
+        return self._rating_order, self._sorted_rating_ordinals
+
+
+def _encode(value, values, lookup):
+    code = lookup.get(value)
+    if code is None:
+        code = len(values)
+        values.append(value)
+        lookup[value] = code
+    return code
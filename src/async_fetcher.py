@@ -0,0 +1,115 @@
+"""Fetches and parses several savings product pages concurrently.
+
+@author Adrian Parker
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from src.call_account import CallAccount
+from src.data_provider import CallAccountPage
+from src.data_provider import resolve_parser
+from src.http_fetcher import PageFetcher
+
+# the savings account type pages linked from the call account page
+SAVINGS_PRODUCT_URLS = (
+    'https://www.interest.co.nz/saving/bonus-savings-accounts',
+    'https://www.interest.co.nz/saving/business-savings-accounts',
+    'https://www.interest.co.nz/saving/children-youth-student',
+    'https://www.interest.co.nz/saving/e-saver-online',
+    'https://www.interest.co.nz/saving/call-account',
+)
+
+
+def get_call_accounts_from_urls(urls=SAVINGS_PRODUCT_URLS, per_host_limit=2,
+                                executor=None, parser=None, timeout=10):
+    """Accessor for the merged call accounts of several pages.
+
+    Args:
+        urls: sequence of str page urls. Default SAVINGS_PRODUCT_URLS
+        per_host_limit: int maximum concurrent fetches per host. Default 2.
+        executor: concurrent.futures executor to parse pages in, such as a
+            ProcessPoolExecutor. Defaults to None, the event loop's default
+            thread pool
+        parser: one of data_provider.PARSERS. Defaults to None, see
+            data_provider.resolve_parser
+        timeout: float seconds to wait to connect to or read each page.
+            Default 10.
+    Returns:
+        array of CallAccount, in order of urls, each with source set to the
+        url of the page it was parsed from
+    """
+
+    return asyncio.run(fetch_call_accounts(
+        urls, per_host_limit, executor, parser, timeout))
+
+
+async def fetch_call_accounts(urls=SAVINGS_PRODUCT_URLS, per_host_limit=2,
+                              executor=None, parser=None, timeout=10):
+    """Coroutine fetching and parsing pages concurrently.
+
+    Pages are fetched with a shared http_fetcher.PageFetcher on a thread
+    pool of its own, with a thread for each fetch the per host limits allow
+    at once, and parsed in executor, so neither blocks the event loop. See
+    get_call_accounts_from_urls for arguments and return value.
+
+    Raises:
+        Exception if any page cannot be fetched
+    """
+
+    parser = resolve_parser(parser)
+    limits = {}
+    for url in urls:
+        host = urlsplit(url).netloc
+        if host not in limits:
+            limits[host] = asyncio.Semaphore(per_host_limit)
+
+    fetcher = PageFetcher(timeout=timeout, pool_size=per_host_limit)
+    # the default thread pool would cap fetches at its own size instead
+    fetch_threads = ThreadPoolExecutor(max(1, per_host_limit * len(limits)))
+
+    async def fetch_and_parse(url):
+        loop = asyncio.get_running_loop()
+        async with limits[urlsplit(url).netloc]:
+            result = await loop.run_in_executor(fetch_threads, fetcher.fetch,
+                                                url)
+        rows = await loop.run_in_executor(executor, _parse_rows, result.body,
+                                          parser)
+        return [CallAccount(row, source=url) for row in rows]
+
+    try:
+        pages = await asyncio.gather(*(fetch_and_parse(url) for url in urls))
+    finally:
+        fetch_threads.shutdown(wait=False)
+        fetcher.close()
+    return [account for accounts in pages for account in accounts]
+
+
+async def fetch_page(url, fetcher=None):
+    """Coroutine fetching the body of given url in a thread.
+
+    Args:
+        url: str http or https url to fetch
+        fetcher: http_fetcher.PageFetcher to fetch with. Defaults to None,
+            a fetcher used for this page only
+    Returns:
+        str body of the page, decompressed if gzip encoded
+    Raises:
+        Exception if the page cannot be fetched, see PageFetcher.fetch
+    """
+
+    if fetcher is not None:
+        return (await asyncio.to_thread(fetcher.fetch, url)).body
+    fetcher = PageFetcher()
+    try:
+        return (await asyncio.to_thread(fetcher.fetch, url)).body
+    finally:
+        fetcher.close()
+
+
+def _parse_rows(html, parser):
+    # module level so it can also run in a process pool; rows of accounts are
+    # plain tuples, cheap to pickle back from a worker process
+    accounts = CallAccountPage(html, parser).accounts
+    return [tuple(account.to_row()) for account in accounts]
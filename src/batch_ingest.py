@@ -0,0 +1,224 @@
+"""Parses archived copies of the call account page in parallel, as a time series.
+
+@author Adrian Parker
+"""
+
+import glob
+import gzip
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from datetime import timezone
+
+import numpy as np
+
+from src.account_table import AccountTable
+from src.call_account import CallAccount
+from src.data_provider import CallAccountPage
+from src.data_provider import resolve_parser
+
+# file names matched when given a directory to ingest
+SNAPSHOT_PATTERNS = ('*.html', '*.htm', '*.html.gz', '*.htm.gz')
+
+_DATE_IN_NAME = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+
+class BatchIngester:
+    """Parses many saved pages across a process pool, in snapshot order.
+
+    Worker processes read and parse whole files, returning plain row tuples,
+    so only paths and rows cross process boundaries. A file that cannot be
+    read or parsed is recorded in failures and the batch carries on.
+
+    Attributes:
+        files: int files processed by the last run, including failures
+        accounts: int accounts parsed by the last run
+        failures: array of (str path, str error) tuples from the last run
+    """
+
+    def __init__(self, workers=None, chunksize=4, parser=None, progress=None):
+        """
+        Args:
+            workers: int worker processes. Default None, one per CPU.
+            chunksize: int files handed to a worker at a time. Default 4.
+            parser: one of data_provider.PARSERS. Defaults to None, see
+                data_provider.resolve_parser
+            progress: callable(done, total, path) called in the calling
+                process as each file completes. Default None.
+        """
+
+        self.workers = workers
+        self.chunksize = chunksize
+        self.parser = resolve_parser(parser)
+        self.progress = progress
+        self.files = 0
+        self.accounts = 0
+        self.failures = []
+
+    def iter_snapshots(self, source):
+        """Generates the accounts of each snapshot, in snapshot time order.
+
+        Args:
+            source: str directory, glob pattern or file path, or iterable of
+                str file paths. See find_snapshot_files
+        Yields:
+            (datetime, array of CallAccount) tuple per file parsed, the
+            accounts having source set to the file path
+        """
+
+        paths = find_snapshot_files(source)
+        self.files = 0
+        self.accounts = 0
+        self.failures = []
+        if not paths:
+            return
+        dated = sorted((snapshot_time(path), path) for path in paths)
+        with ProcessPoolExecutor(self.workers) as executor:
+            results = executor.map(
+                _parse_file, [path for _, path in dated],
+                [self.parser] * len(dated), chunksize=self.chunksize)
+            for (taken_at, path), (rows, error) in zip(dated, results):
+                self.files += 1
+                if self.progress is not None:
+                    self.progress(self.files, len(dated), path)
+                if error is not None:
+                    self.failures.append((path, error))
+                    continue
+                self.accounts += len(rows)
+                yield taken_at, [CallAccount(row, source=path) for row in rows]
+
+    def iter_accounts(self, source):
+        """Generates (snapshot time, CallAccount) records, in time order.
+
+        See iter_snapshots for arguments.
+        """
+
+        for taken_at, accounts in self.iter_snapshots(source):
+            for account in accounts:
+                yield taken_at, account
+
+    def ingest(self, source, sink):
+        """Writes each snapshot parsed from source to sink, in time order.
+
+        Args:
+            source: see iter_snapshots
+            sink: object with a write_snapshot(accounts, taken_at) method,
+                such as a rate_store.RateStore or a SnapshotSeries
+        Returns:
+            array of (str path, str error) tuples of files that failed
+        """
+
+        for taken_at, accounts in self.iter_snapshots(source):
+            sink.write_snapshot(accounts, taken_at)
+        return self.failures
+
+
+class SnapshotSeries:
+    """Columnar sink collecting snapshots into one AccountTable.
+
+    Snapshot times are kept in a datetime64 array parallel to the table's
+    rows, so a time series can be filtered with the table's indexes.
+    """
+
+    def __init__(self):
+        self._accounts = []
+        self._taken_at = []
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def write_snapshot(self, accounts, taken_at):
+        """Appends given accounts as a snapshot taken at given time.
+
+        Args:
+            accounts: iterable of CallAccount
+            taken_at: datetime the snapshot was taken
+        """
+
+        count = len(self._accounts)
+        self._accounts.extend(accounts)
+        moment = np.datetime64(_to_naive_utc(taken_at), 's')
+        self._taken_at.extend([moment] * (len(self._accounts) - count))
+
+    def to_table(self):
+        """Provides the collected accounts and their snapshot times.
+
+        Returns:
+            (datetime64[s] array, AccountTable) tuple with one entry per
+            account, in the order written
+        """
+
+        return (np.array(self._taken_at, dtype='datetime64[s]'),
+                AccountTable.from_accounts(self._accounts))
+
+
+def find_snapshot_files(source):
+    """Provides the paths of saved pages to ingest.
+
+    Args:
+        source: str directory, searched for SNAPSHOT_PATTERNS; str glob
+            pattern, which may use ** for subdirectories; str file path; or
+            iterable of str file paths, used as given
+    Returns:
+        array of str paths, sorted unless given as an iterable
+    """
+
+    if not isinstance(source, (str, os.PathLike)):
+        return [os.fspath(path) for path in source]
+    source = os.fspath(source)
+    if os.path.isdir(source):
+        paths = set()
+        for pattern in SNAPSHOT_PATTERNS:
+            paths.update(glob.glob(os.path.join(source, pattern)))
+        return sorted(paths)
+    if glob.has_magic(source):
+        return sorted(path for path in glob.glob(source, recursive=True)
+                      if os.path.isfile(path))
+    return [source]
+
+
+def snapshot_time(path):
+    """Provides the time a saved page was taken.
+
+    Args:
+        path: str file path, named with a yyyy-mm-dd date if known
+    Returns:
+        datetime, UTC midnight of the date in the file name, else the file's
+        modification time, else the epoch if the file cannot be read
+    """
+
+    match = _DATE_IN_NAME.search(os.path.basename(path))
+    if match is not None:
+        try:
+            return datetime(int(match.group(1)), int(match.group(2)),
+                            int(match.group(3)), tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    try:
+        return datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+    except OSError:
+        return datetime.fromtimestamp(0, timezone.utc)
+
+
+def _parse_file(path, parser):
+    # module level so it can run in a worker process; failures are returned
+    # rather than raised so one bad file does not abort the batch
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+        if data[:2] == b'\x1f\x8b':
+            data = gzip.decompress(data)
+        html = data.decode('utf-8', errors='replace')
+        # rows of accounts rather than page rows, as the soup parsers' strings
+        # reference their whole document tree and are costly to pickle
+        accounts = CallAccountPage(html, parser).accounts
+        return [tuple(account.to_row()) for account in accounts], None
+    except Exception as error:
+        return None, type(error).__name__ + ': ' + str(error)
+
+
+def _to_naive_utc(moment):
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
@@ -3,12 +3,175 @@
 @author Adrian Parker
 """
 
+import sys
+
+from src.credit_rating import rating_ordinal as _get_rating_ordinal
+
+_str_intern = sys.intern
+
+# directions of the most recent rate change, as flagged by the source page
+MOVEMENT_UP = 'up'
+MOVEMENT_DOWN = 'down'
+INDICATOR_MOVEMENTS = {'interest_financial_indicator-up': MOVEMENT_UP,
+                       'interest_financial_indicator-down': MOVEMENT_DOWN}
+
 
 class CallAccount:
+    """A call account, stored in slots rather than a per-instance dict.
+
+    Institution and credit rating strings are interned, as few distinct
+    values are shared by many accounts. The credit rating is also encoded as
+    rating_ordinal, see credit_rating, so rating ranges are integer
+    comparisons; it is updated whenever credit_rating is set. Accounts
+    compare equal, and hash alike, when all fields other than source are
+    equal; accounts used as dict keys should not be mutated, see
+    FrozenCallAccount.
+    """
+
+    __slots__ = ('institution', '_credit_rating', '_rating_ordinal', 'name',
+                 'min_deposit', 'nominal', 'movement', 'institution_type',
+                 'source')
+
+    def __init__(self, data, source=None):
+        _assign(self, data[0], data[1], data[2], data[3], data[4],
+                data[5] if len(data) > 5 else None,
+                data[6] if len(data) > 6 else None, source)
+
+    @classmethod
+    def from_fields(cls, institution, credit_rating, name, min_deposit,
+                    nominal, movement=None, institution_type=None, source=None):
+        """Creates an account directly from its fields, without a data list.
+
+        Returns:
+            CallAccount
+        """
+
+        account = object.__new__(cls)
+        _assign(account, institution, credit_rating, name, min_deposit,
+                nominal, movement, institution_type, source)
+        return account
+
+    @property
+    def credit_rating(self):
+        """str credit rating, such as 'AA-', or None if unrated."""
+        return self._credit_rating
+
+    @credit_rating.setter
+    def credit_rating(self, credit_rating):
+        self._credit_rating = _intern(credit_rating)
+        self._rating_ordinal = _get_rating_ordinal(credit_rating)
+
+    @property
+    def rating_ordinal(self):
+        """int rank of credit_rating, see credit_rating.rating_ordinal."""
+        return self._rating_ordinal
+
+    def to_row(self):
+        """Provides [institution, credit_rating, name, min_deposit, nominal,
+        movement, institution_type]."""
+        return [self.institution, self.credit_rating, self.name,
+                self.min_deposit, self.nominal, self.movement,
+                self.institution_type]
+
+    def frozen(self):
+        """Provides an immutable copy of this account.
+
+        Returns:
+            FrozenCallAccount
+        """
+
+        return FrozenCallAccount.from_fields(*self.to_row(), source=self.source)
+
+    def __eq__(self, other):
+        if not isinstance(other, CallAccount):
+            return NotImplemented
+        return (self.institution == other.institution
+                and self.credit_rating == other.credit_rating
+                and self.name == other.name
+                and self.min_deposit == other.min_deposit
+                and self.nominal == other.nominal
+                and self.movement == other.movement
+                and self.institution_type == other.institution_type)
+
+    def __hash__(self):
+        return hash((self.institution, self.credit_rating, self.name,
+                     self.min_deposit, self.nominal, self.movement,
+                     self.institution_type))
+
+    def __repr__(self):
+        return (type(self).__name__ + '(' + repr(self.to_row()) +
+                ', source=' + repr(self.source) + ')')
+
+    def __reduce__(self):
+        return (type(self).from_fields, tuple(self.to_row()) + (self.source,))
+
+
+class FrozenCallAccount(CallAccount):
+    """A CallAccount whose fields cannot be changed once created.
+
+    Created as a CallAccount whose class is then changed, which adding no
+    slots allows, so both share one way of setting fields.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, data, source=None):
+        return _freeze(CallAccount(data, source), cls)
+
+    def __init__(self, data, source=None):
+        # fields were all set by __new__
+        pass
+
+    @classmethod
+    def from_fields(cls, institution, credit_rating, name, min_deposit,
+                    nominal, movement=None, institution_type=None, source=None):
+        return _freeze(CallAccount.from_fields(
+            institution, credit_rating, name, min_deposit, nominal, movement,
+            institution_type, source), cls)
+
+    def frozen(self):
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenCallAccount is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('FrozenCallAccount is immutable')
+
+
+def _assign(account, institution, credit_rating, name, min_deposit, nominal,
+            movement, institution_type, source):
+    # the one place fields are set on creation, of a mutable CallAccount
+    account.institution = _intern(institution)
+    account._credit_rating = _intern(credit_rating)
+    account._rating_ordinal = _get_rating_ordinal(credit_rating)
+    account.name = _plain(name)
+    account.min_deposit = min_deposit
+    account.nominal = nominal
+    # MOVEMENT_UP, MOVEMENT_DOWN or None if the page flags no change
+    account.movement = movement
+    # title of the page section the account was listed in, e.g. 'Banks'
+    account.institution_type = _intern(institution_type)
+    # url of the page the account was parsed from, if known
+    account.source = source
+
+
+def _freeze(account, cls):
+    object.__setattr__(account, '__class__', cls)
+    return account
+
+
+def _intern(value):
+    # plain str is interned directly; parser string subclasses, which
+    # reference their document tree, are first made plain str
+    if type(value) is str:
+        return _str_intern(value)
+    return _str_intern(str(value)) if isinstance(value, str) else value
+
 
-    def __init__(self, data):
-        self.institution = data[0]
-        self.credit_rating = data[1]
-        self.name = data[2]
-        self.min_deposit = data[3]
-        self.nominal = data[4]
+def _plain(value):
+    # str() turns parser string subclasses, which reference their document
+    # tree, into plain str
+    if type(value) is str or not isinstance(value, str):
+        return value
+    return str(value)
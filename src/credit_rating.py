@@ -0,0 +1,65 @@
+"""Encodes the credit ratings given to institutions as ordered integers.
+
+@author Adrian Parker
+"""
+
+# Standard & Poor's style long term ratings, best first
+CREDIT_RATINGS = ('AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-',
+                  'BBB+', 'BBB', 'BBB-', 'BB+', 'BB', 'BB-',
+                  'B+', 'B', 'B-', 'CCC+', 'CCC', 'CCC-', 'CC', 'C', 'D')
+
+# ordinal of accounts that are unrated, or whose rating is unrecognised;
+# lower than every rating, so excluded by any minimum rating
+UNRATED = -1
+
+_ORDINALS = dict((rating, len(CREDIT_RATINGS) - 1 - position)
+                 for position, rating in enumerate(CREDIT_RATINGS))
+
+_RATINGS = dict((ordinal, rating) for rating, ordinal in _ORDINALS.items())
+
+
+def rating_ordinal(credit_rating):
+    """Returns the rank of a credit rating, higher being better.
+
+    Args:
+        credit_rating (str): rating such as 'AA-', or None if unrated
+    Returns:
+        int: 0 for 'D' up to 21 for 'AAA', or UNRATED if unrated or
+        unrecognised
+    """
+
+    if credit_rating is None:
+        return UNRATED
+    ordinal = _ORDINALS.get(credit_rating)
+    if ordinal is None:
+        ordinal = _ORDINALS.get(credit_rating.strip(), UNRATED)
+    return ordinal
+
+
+def rating_from_ordinal(ordinal):
+    """Returns the credit rating of given rank.
+
+    Args:
+        ordinal (int): rank as returned by rating_ordinal
+    Returns:
+        str: rating such as 'AA-', or None if UNRATED
+    """
+
+    return _RATINGS.get(ordinal)
+
+
+def required_rating_ordinal(credit_rating):
+    """Returns the rank of a credit rating given as a query bound.
+
+    Args:
+        credit_rating (str): rating such as 'A-'
+    Returns:
+        int: as rating_ordinal
+    Raises:
+        Exception if credit_rating is not a recognised rating
+    """
+
+    ordinal = rating_ordinal(credit_rating)
+    if ordinal == UNRATED:
+        raise Exception('Unrecognised credit rating ' + repr(credit_rating))
+    return ordinal
@@ -3,38 +3,214 @@
 @author Adrian Parker
  """
 
+import codecs
+import gzip
+import os
+import re
+import warnings
+from functools import cached_property
+from functools import lru_cache
+
 from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from src.call_account import *
+from src.http_fetcher import PageFetcher
+from src.row_extractor import CallAccountRowExtractor
+
+# parser backends accepted by the call account accessors
+SOUP_PARSER = 'html.parser'
+LXML_PARSER = 'lxml'
+STREAM_PARSER = 'stream'
+PARSERS = (SOUP_PARSER, LXML_PARSER, STREAM_PARSER)
+# environment variable naming the parser backend to use when none is given
+PARSER_ENV_VAR = 'REALRATES_PARSER'
+# chars fed to the streaming extractor at a time by iter_call_accounts
+STREAM_CHUNK_SIZE = 64 * 1024
+# page the live call account data is fetched from
+CALL_ACCOUNT_URL = 'https://www.interest.co.nz/saving/call-account'
+# gzipped sample of the call account page, used when not live
+SAMPLE_HTML_PATH = os.path.join(
+    os.path.dirname(__file__), 'data', 'call_account_2020-07-17.html.gz')
+
+# restricts a soup to the account tables, their rows and section headers
+_ACCOUNT_TABLE_STRAINER = SoupStrainer(attrs={'class': re.compile(
+    r'(^|\s)(interest_financial_datatable|interest_financial_row_\d+'
+    r'|primary_row|pane-title)(\s|$)')})
+
+
+class CallAccountPage:
+    """Snapshot of a call account page, parsed at most once.
+
+    Accounts, institution names and institution type sections are computed
+    on first access and cached, so callers needing several of them share a
+    single parse of the page.
+    """
+
+    def __init__(self, html, parser=None):
+        """Creates a snapshot of the given html.
+
+        Args:
+          html: to exract call account data from.
+          parser: one of PARSERS. Defaults to None, see resolve_parser
+        Raises:
+          Exception if parser is not recognised
+        """
+
+        self.html = html
+        self.parser = resolve_parser(parser)
+
+    @classmethod
+    def from_source(cls, live=False, parser=None):
+        """Creates a snapshot of the call account page.
+
+        Args:
+          live: snapshot live data or not. Defaults to False
+          parser: one of PARSERS. Defaults to None, see resolve_parser
+        Returns:
+          CallAccountPage, the previous live snapshot if the live page has
+          not been modified since it was last fetched. The snapshot's
+          accounts are then shared, so use the get_call_accounts accessors
+          for accounts to change
+        """
+
+        if not live:
+            return cls(_get_call_account_html(False), parser)
+        global _live_page
+        parser = resolve_parser(parser)
+        result = _live_fetcher.fetch(CALL_ACCOUNT_URL)
+        if (result.not_modified and _live_page is not None
+                and _live_page.parser == parser):
+            return _live_page
+        _live_page = cls(result.body, parser)
+        return _live_page
+
+    @cached_property
+    def rows(self):
+        """Array of [institution, credit_rating, name, min_deposit, nominal,
+        movement, institution_type]."""
+        if self.parser == STREAM_PARSER:
+            return [account.to_row() for account in self.accounts]
+        return _get_accounts_from_soup(self._table_soup)
+
+    @cached_property
+    def accounts(self):
+        """Array of CallAccount."""
+        if self.parser == STREAM_PARSER:
+            return self._extractor.rows
+        return [CallAccount(row) for row in self.rows]
+
+    @cached_property
+    def institution_names(self):
+        """Array of str names of the institutions providing call accounts."""
+        if self.parser == STREAM_PARSER:
+            return self._extractor.institutions
+        return _get_institution_names_from_soup(self._table_soup)
+
+    @cached_property
+    def sections(self):
+        """Dict of institution type to array of CallAccount, in page order."""
+        return _group_by_institution_type(self.accounts)
+
+    @cached_property
+    def _table_soup(self):
+        # only account tables are read, so skip menus, scripts and footer
+        return BeautifulSoup(self.html, self.parser,
+                             parse_only=_ACCOUNT_TABLE_STRAINER)
+
+    @cached_property
+    def _extractor(self):
+        # creates accounts directly, without an intermediate row list
+        extractor = CallAccountRowExtractor(CallAccount.from_fields)
+        extractor.feed(self.html)
+        extractor.close()
+        return extractor
+
+
+# shared by live fetches, so unchanged pages cost a 304 and no re-parse
+_live_fetcher = PageFetcher()
+_live_page = None
+
+
+def resolve_parser(parser=None):
+    """Resolves the parser backend to use.
+
+    Args:
+      parser: one of PARSERS, or None to use the PARSER_ENV_VAR environment
+        variable, itself defaulting to SOUP_PARSER
+    Returns:
+      str one of PARSERS. LXML_PARSER falls back to SOUP_PARSER, with a
+      warning, when lxml is not installed
+    Raises:
+      Exception if parser is not recognised
+    """
+
+    if parser is None:
+        parser = os.environ.get(PARSER_ENV_VAR) or SOUP_PARSER
+    if parser not in PARSERS:
+        raise Exception('Unknown parser: ' + str(parser))
+    if parser == LXML_PARSER and not _lxml_available():
+        warnings.warn('lxml is not installed, falling back to ' + SOUP_PARSER)
+        return SOUP_PARSER
+    return parser
 
 
-def get_call_accounts(live=False):
+def get_call_accounts(live=False, parser=None):
     """Accessor for set of call accounts.
 
     Args:
       live: return live data or not. Defaults to False
+      parser: one of PARSERS. Defaults to None, see resolve_parser
     Returns:
-      Array of CallAccount
+      Array of CallAccount, newly created on every call
     """
 
-    accounts = []
-    for account in _get_accounts(_get_call_account_html(live)):
-        accounts.append(CallAccount(account))
-    return accounts
+    return _new_accounts(CallAccountPage.from_source(live, parser))
 
 
-def get_call_accounts_from_html(html):
+def get_call_accounts_from_html(html, parser=None, cache=None):
     """Accessor for set of call accounts, derived from given html.
 
     Args:
       html: to exract call account data from.
+      parser: SOUP_PARSER or LXML_PARSER to build a BeautifulSoup tree, or
+        STREAM_PARSER to extract rows in a single streaming pass. Defaults to
+        None, see resolve_parser
+      cache: optional ParseCache to reuse rows previously parsed from the
+        same html. Defaults to None, parsing every call
     Returns:
-      Array of CallAccount
+      Array of CallAccount, newly created on every call
+    Raises:
+      Exception if parser is not recognised
     """
 
-    accounts = []
-    for account in _get_accounts(html):
-        accounts.append(CallAccount(account))
-    return accounts
+    parser = resolve_parser(parser)
+    if cache is None:
+        return CallAccountPage(html, parser).accounts
+    rows = cache.get_rows(html, lambda h: CallAccountPage(h, parser).rows)
+    return [CallAccount(row) for row in rows]
+
+
+def iter_call_accounts(source, encoding='utf-8'):
+    """Generator of call accounts, yielded as each row of source is parsed.
+
+    Parses with the STREAM_PARSER extractor, holding only the rows completed
+    by the latest chunk, so memory stays constant however long the source.
+    Concatenated pages are parsed one after another.
+
+    Args:
+      source: str of html; file object opened in text or binary mode; or
+        iterable of bytes or str chunks of html
+      encoding: of bytes read from source. Defaults to 'utf-8'
+    Yields:
+      CallAccount, in page order
+    """
+
+    extractor = CallAccountRowExtractor(CallAccount.from_fields)
+    for chunk in _iter_html_chunks(source, encoding):
+        extractor.feed(chunk)
+        yield from _take_rows(extractor)
+    extractor.close()
+    yield from _take_rows(extractor)
 
 
 def get_call_account_institution_names(live=False):
@@ -43,32 +219,107 @@ def get_call_account_institution_names(live=False):
     Args:
       live: derive names from live data, or not. Defaults to False
     Returns:
-      Array of str
+      Array of str, a new array on every call
+    """
+
+    return list(CallAccountPage.from_source(live).institution_names)
+
+
+def get_call_accounts_by_institution_type(live=False):
+    """Accessor for call accounts grouped by the type of institution providing them.
+
+    Args:
+      live: group live data, or not. Defaults to False
+    Returns:
+      Dict of str institution type, such as 'Banks', to array of CallAccount,
+      newly created on every call
     """
 
-    return _get_institution_names(_get_call_account_html(live))
+    return _group_by_institution_type(
+        _new_accounts(CallAccountPage.from_source(live)))
 
 
 def _get_accounts(html):
-    soup = BeautifulSoup(html, 'html.parser')
-    table_rows = soup.find_all('tr')
+    return CallAccountPage(html).rows
+
+
+def _get_institution_names(html):
+    return CallAccountPage(html).institution_names
+
+
+def _get_accounts_by_institution_type(html):
+    return CallAccountPage(html).sections
+
+
+def _new_accounts(page):
+    # a live page may be a shared snapshot, so callers get their own accounts
+    return [CallAccount(row) for row in page.rows]
+
+
+def _group_by_institution_type(accounts):
+    sections = {}
+    for account in accounts:
+        sections.setdefault(account.institution_type, []).append(account)
+    return sections
+
+
+def _iter_html_chunks(source, encoding):
+    if isinstance(source, str):
+        for start in range(0, len(source), STREAM_CHUNK_SIZE):
+            yield source[start:start + STREAM_CHUNK_SIZE]
+        return
+    if isinstance(source, (bytes, bytearray)):
+        source = (source,)
+    elif hasattr(source, 'read'):
+        file = source
+        source = iter(lambda: file.read(STREAM_CHUNK_SIZE), file.read(0))
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    for chunk in source:
+        # a multi-byte character may be split across chunks of bytes
+        yield chunk if isinstance(chunk, str) else decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+
+def _take_rows(extractor):
+    rows = extractor.rows
+    extractor.rows = []
+    extractor.institutions.clear()
+    return rows
+
+
+def _lxml_available():
+    try:
+        import lxml
+    except ImportError:
+        return False
+    return True
+
+
+def _get_accounts_from_soup(soup):
+    # section headers come before their rows, so read both in page order
+    elements = soup.find_all(['h2', 'tr'])
     accounts = []
-    for row in table_rows:
+    institution_type = None
+    for row in elements:
+        if row.name == 'h2':
+            if 'pane-title' in (row.get('class') or []):
+                institution_type = row.get_text().strip()
+            continue
         if row.get('class') and 'primary_row' in row['class']:
             institution = _get_institution(row)
         tds = row.find_all('td')
         if len(tds) == 5:
-            credit_rating = tds[1].string
-            account_type = tds[2].string
+            credit_rating = _get_string(tds[1])
+            account_type = _get_string(tds[2])
             min_amount = float(tds[3].string.replace('$', '').replace(',', ''))
             nominal = _get_nominal(tds[4])
-            accounts.append([institution, credit_rating,
-                             account_type, min_amount, nominal])
+            movement = _get_movement(tds[4])
+            accounts.append([institution, credit_rating, account_type,
+                             min_amount, nominal, movement, institution_type])
     return accounts
 
 
-def _get_institution_names(html):
-    soup = BeautifulSoup(html, 'html.parser')
+def _get_institution_names_from_soup(soup):
     table_rows = soup.find_all('tr')
     institutions = []
     for row in table_rows:
@@ -77,15 +328,6 @@ def _get_institution_names(html):
     return institutions
 
 
-def _get_accounts_by_institution_type(html):
-    html = _get_call_account_html(False)
-    soup = BeautifulSoup(html, 'html.parser')
-    # get divs with classes 'panel-pane' and 'pane-node'
-    institution_type_chunks = soup.select('div.panel-pane.pane-node')
-
-    return institution_type_chunks
-
-
 def _get_nominal(tag):
     # tag may include an up or down indicator img; if so will be child b tag
     b = tag.find('b')
@@ -93,10 +335,25 @@ def _get_nominal(tag):
     return float(nominal)
 
 
+def _get_movement(tag):
+    # the up or down indicator img, if any, says which way the rate last moved
+    for img in tag.find_all('img'):
+        for img_class in img.get('class') or []:
+            if img_class in INDICATOR_MOVEMENTS:
+                return INDICATOR_MOVEMENTS[img_class]
+    return None
+
+
+def _get_string(tag):
+    # plain str, as parser strings reference, and keep alive, their whole tree
+    string = tag.string
+    return None if string is None else str(string)
+
+
 def _get_institution(tag):
     anchor = tag.find('a')
     anchor_img = anchor.find('img')
-    institution = anchor_img['alt'] if anchor_img else anchor.string
+    institution = anchor_img['alt'] if anchor_img else _get_string(anchor)
     # remove any trailing spaces
     while institution[-1] == ' ':
         institution = institution[:-1]
@@ -105,1159 +362,13 @@ def _get_institution(tag):
 
 def _get_call_account_html(live=True):
     if live:
-        # "https://www.interest.co.nz/saving/call-account"
-        raise NotImplementedError()
+        return _live_fetcher.fetch(CALL_ACCOUNT_URL).body
     else:
-        # sample taken at 17/07/2020
-        return r"""
-    <html>
-    <head>
-      <meta name="viewport" content="width=device-width, initial-scale=1">
-      <meta http-equiv="Content-Type" content="text/html; charset=utf-8" />
-    <link rel="shortcut icon" href="https://www.interest.co.nz/sites/all/themes/interest_19/favicon.gif" type="image/gif" />
-    <meta name="generator" content="Drupal 7 (https://www.drupal.org)" />
-    <link rel="canonical" href="https://www.interest.co.nz/saving/call-account" />
-    <link rel="shortlink" href="https://www.interest.co.nz/saving/call-account" />
-    <meta property="og:site_name" content="interest.co.nz" />
-    <meta property="og:type" content="article" />
-    <meta property="og:url" content="https://www.interest.co.nz/saving/call-account" />
-    <meta property="og:title" content="Standard savings accounts" />
-    <meta name="twitter:card" content="summary" />
-    <meta name="twitter:url" content="https://www.interest.co.nz/saving/call-account" />
-    <meta name="twitter:title" content="Standard savings accounts" />
-      <title>Standard savings accounts | interest.co.nz</title>
-      <link type="text/css" rel="stylesheet" href="https://www.interest.co.nz/sites/default/files/css/css_xE-rWrJf-fncB6ztZfd2huxqgxu4WO-qwma6Xer30m4.css" media="all" />
-    <link type="text/css" rel="stylesheet" href="https://www.interest.co.nz/sites/default/files/css/css_ugmd-SSDbm1OKE5izFKyWoDlN0VLzOd_7qwRN49enDo.css" media="all" />
-    <link type="text/css" rel="stylesheet" href="https://www.interest.co.nz/sites/default/files/css/css_TgSGRqmLJOlGXFvFcKlXbuL6HyUBoh1mSO4zK9piWmA.css" media="all" />
-    <link type="text/css" rel="stylesheet" href="https://www.interest.co.nz/sites/default/files/css/css_9QAsD1IHKbFu9Zpw4oIZC-93fLehhxoI38rcLhA1t70.css" media="all" />
-    <link type="text/css" rel="stylesheet" href="https://www.interest.co.nz/sites/default/files/css/css_1MNfDLc11cP7WSWyxXMHK0Z9_gYZAY3zdNX5fA98j70.css" media="all" />
-      <script type="text/javascript" src="//ajax.googleapis.com/ajax/libs/jquery/1.10.2/jquery.min.js"></script>
-    <script type="text/javascript">
-    <!--//--><![CDATA[//><!--
-    window.jQuery || document.write("<script src='/sites/all/modules/jquery_update/replace/jquery/1.10/jquery.min.js'>\x3C/script>")
-    //--><!]]>
-    </script>
-    <script type="text/javascript" src="https://www.interest.co.nz/sites/default/files/js/js_uJR3Qfgc-bGacxkh36HU9Xm2Q98e_V5UWlFISwie5ro.js"></script>
-    <script type="text/javascript" src="//ajax.googleapis.com/ajax/libs/jqueryui/1.10.2/jquery-ui.min.js"></script>
-    <script type="text/javascript">
-    <!--//--><![CDATA[//><!--
-    window.jQuery.ui || document.write("<script src='/sites/all/modules/jquery_update/replace/ui/ui/minified/jquery-ui.min.js'>\x3C/script>")
-    //--><!]]>
-    </script>
-    <script type="text/javascript" src="https://www.interest.co.nz/sites/default/files/js/js_kVYUHPow03cU_mL4c7JNnI9gyFiLNdVAM2yU5r_fAPs.js"></script>
-    <script type="text/javascript">
-    <!--//--><![CDATA[//><!--
-    (function(i,s,o,g,r,a,m){i["GoogleAnalyticsObject"]=r;i[r]=i[r]||function(){(i[r].q=i[r].q||[]).push(arguments)},i[r].l=1*new Date();a=s.createElement(o),m=s.getElementsByTagName(o)[0];a.async=1;a.src=g;m.parentNode.insertBefore(a,m)})(window,document,"script","https://www.google-analytics.com/analytics.js","ga");ga("create", "UA-256522-2", {"cookieDomain":"auto"});ga("set", "anonymizeIp", true);ga("send", "pageview");
-    //--><!]]>
-    </script>
-    <script type="text/javascript">
-    <!--//--><![CDATA[//><!--
-
-        (function(d) {
-          var el, fjs = d.getElementsByTagName("script")[0];
-                el = d.createElement("script");
-                el.id = "js-pp-banner";
-                el.src = "//dashboard.presspatron.com/dev/banner?b=otsLiLFCX82yC86Cnz4DiJa6";
-                fjs.parentNode.insertBefore(el, fjs);
-        }(document));
-
-    //--><!]]>
-    </script>
-    <script type="text/javascript">
-    <!--//--><![CDATA[//><!--
-
-        (function() {
-          if(/[?]supporters$/.test(location.href)) {
-            var timer = setInterval(function() {
-              if(typeof presspatron != 'undefined' && document.getElementById('pp-banner')) {
-                clearInterval(timer);
-                presspatron.receiveMessage({'data' : 'modal', 'origin' : 'https://dashboard.presspatron.com'}); } }, 300); } })();
-
-    //--><!]]>
-    </script>
-    <script type="text/javascript" src="https://www.interest.co.nz/sites/default/files/js/js_bepzBW55BJOj3deHFNi0GvKkWObEg6ybqaHDyTBTWtw.js"></script>
-    <script type="text/javascript">
-    <!--//--><![CDATA[//><!--
-    jQuery.extend(Drupal.settings, {"basePath":"\/","pathPrefix":"","ajaxPageState":{"theme":"interest_19","theme_token":"xFuerbqdn5dYXooZ86oiDpFT5SredYiwt_HKKoqdtb4","js":{"sites\/all\/modules\/custom\/press_patron\/press_patron.js":1,"\/\/ajax.googleapis.com\/ajax\/libs\/jquery\/1.10.2\/jquery.min.js":1,"0":1,"misc\/jquery-extend-3.4.0.js":1,"misc\/jquery-html-prefilter-3.5.0-backport.js":1,"misc\/jquery.once.js":1,"misc\/drupal.js":1,"\/\/ajax.googleapis.com\/ajax\/libs\/jqueryui\/1.10.2\/jquery-ui.min.js":1,"1":1,"sites\/all\/modules\/custom\/tabs\/tabs.js":1,"sites\/all\/modules\/google_analytics\/googleanalytics.js":1,"2":1,"3":1,"4":1,"sites\/all\/themes\/interest_19\/js\/vendor\/slick.min.js":1,"sites\/all\/themes\/interest_19\/js\/scripts.js":1,"sites\/all\/themes\/interest_19\/js\/comments.js":1,"sites\/all\/themes\/interest_19\/js\/expand-image.js":1},"css":{"modules\/system\/system.base.css":1,"modules\/system\/system.menus.css":1,"modules\/system\/system.messages.css":1,"modules\/system\/system.theme.css":1,"misc\/ui\/jquery.ui.core.css":1,"misc\/ui\/jquery.ui.theme.css":1,"misc\/ui\/jquery.ui.tabs.css":1,"sites\/all\/modules\/simplenews\/simplenews.css":1,"modules\/comment\/comment.css":1,"sites\/all\/modules\/date\/date_api\/date.css":1,"sites\/all\/modules\/date\/date_popup\/themes\/datepicker.1.7.css":1,"modules\/field\/theme\/field.css":1,
-                  "sites\/all\/modules\/custom\/image_format\/image_format.css":1,"sites\/all\/modules\/custom\/kiwisaver\/kiwisaver.css":1,"modules\/node\/node.css":1,"modules\/search\/search.css":1,"modules\/user\/user.css":1,"sites\/all\/modules\/views\/css\/views.css":1,"sites\/all\/modules\/ctools\/css\/ctools.css":1,"sites\/all\/modules\/panels\/css\/panels.css":1,"sites\/all\/modules\/rate\/rate.css":1,"sites\/all\/modules\/custom\/tabs\/drupal-tabs.css":1,"sites\/all\/modules\/panels\/plugins\/layouts\/onecol\/onecol.css":1,"sites\/all\/modules\/addtoany\/addtoany.css":1,"sites\/all\/modules\/custom\/interest_financial\/interest_financial.css":1,"sites\/all\/modules\/print\/print_ui\/css\/print_ui.theme.css":1,"sites\/all\/themes\/interest_19\/css\/vendor\/slick.css":1,"sites\/all\/themes\/interest_19\/css\/vendor\/slick-theme.css":1,"sites\/all\/themes\/interest_19\/css\/styles.css":1}},"tabs":{"slide":false,"fade":true,"speed":"slow","auto_height":false,"next_text":"next","previous_text":"previous","navigation_titles":0},"googleanalytics":{"trackOutbound":1,"trackMailto":1,"trackDownload":1,"trackDownloadExtensions":"7z|aac|arc|arj|asf|asx|avi|bin|csv|doc(x|m)?|dot(x|m)?|exe|flv|gif|gz|gzip|hqx|jar|jpe?g|js|mp(2|3|4|e?g)|mov(ie)?|msi|msp|pdf|phps|png|ppt(x|m)?|pot(x|m)?|pps(x|m)?|ppam|sld(x|m)?|thmx|qtm?|ra(m|r)?|sea|sit|tar|tgz|torrent|txt|wav|wma|wmv|wpd|xls(x|m|b)?|xlt(x|m)|xlam|xml|z|zip"}});
-    //--><!]]>
-    </script>
-
-        <!-- SCRIPT NEEDED TO RUN GOOGLE DFP -->
-      <!-- Not needed as of now. Publift script doing the work -->
-      <!-- <script async='async' src='https://www.googletagservices.com/tag/js/gpt.js'></script> -->
-
-      <!-- Publift Fuse Tag -->
-      <script async src="https://cdn.fuseplatform.net/publift/tags/2/2001/fuse.js"></script>
-      </head>
-    <body class="html not-front not-logged-in no-sidebars page-saving page-saving-call-account">
-      <!-- Press Patron Banner -->
-      <div id="pp-banner"></div>
-      <!-- End Press Patron Banner -->
-
-      <header>
-        <div id="header-wrapper">
-          <div id="search-block">
-            <!-- <div id="search-icon"></div> -->
-            <div class="gcse-wrapper">
-
-      <script>
-        (function() {
-          var cx = '013234808727065659026:_n8ackc_blq';
-          var gcse = document.createElement('script');
-          gcse.type = 'text/javascript';
-          gcse.async = true;
-          gcse.src = 'https://cse.google.com/cse.js?cx=' + cx;
-          var s = document.getElementsByTagName('script')[0];
-          s.parentNode.insertBefore(gcse, s);
-        })();
-      </script>
-      <gcse:search></gcse:search>
-              </div>
-          </div>
-          <div id="logo-block">
-            <div id="site-logo"><a href="/"></a></div>
-          </div>
-          <div id="login-block">
-            <a href="/user/register" class="has-button-styles">sign up</a><a href="/user" class="has-button-styles">log in</a>      </div>
-        </div>
-        <div id="navigation">
-          <div id="navigation-wrapper">
-            <div id="burger-menu">
-            </div>
-            <div id="login-block2">
-              <a href="/user/register" class="has-button-styles">sign up</a><a href="/user" class="has-button-styles">log in</a>        </div>
-            <div id="full-nav">
-                <div class="parent-div">
-        <a class="parent-link" href="/home">Home </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/podcasts"  >Podcast - subscribe here </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/news">News </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/economic-calendar"  >Economic calendar </a>
-                          <a class="child-link white-font" href="/news/2020-economic-rescue-package"  >The crisis rescue package tally </a>
-                          <a class="child-link white-font" href="/news/82573/reserve-bank-lays-out-detail-how-it-reviews-our-monetary-policy-settings-and-processes"  >How the OCR is set </a>
-                          <a class="child-link white-font" href="/category/tag/tppa"  >TPPA explainer series </a>
-                          <a class="child-link white-font" href="/saving/bank-financial-comparator"  >Key bank metrics </a>
-                          <a class="child-link white-font" href="/news/105115/budget-202021-summary-all-spending-plans"  >Budget 2020/21 - Spending plan </a>
-                          <a class="child-link white-font" href="/news/105190/budget-2020-summary-all-tax-collections"  >Budget 2020/21 - Tax revenue </a>
-                          <a class="child-link white-font" href="/news/102724/we-update-nations-economic-benchmarks-second-time-one-after-year-delivery-overall-there"  >New Govt. benchmarks </a>
-                          <a class="child-link white-font" href="/opinion/94342/media-world-changing-challenging-readers-who-expect independent-news-data-and-comment"  >Become a Supporter </a>
-                          <a class="child-link white-font" href="/podcasts"  >Podcast - subscribe here </a>
-                          <a class="child-link white-font" href="https://www.interest.co.nz/gdp-live" target="_blank" >GDP Live </a>
-                          <a class="child-link white-font" href="/news/emails-newsletters-sign-up"  >Sign up for our free newsletters </a>
-                          <a class="child-link white-font" href="/paid-newsletter/37138"  >Banking newsletter subscription </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/property">Property </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/property/residential-auction-results"  >Residential auction results </a>
-                          <a class="child-link white-font" href="/property/commercial-property-sales"  >Commercial property sales </a>
-                          <a class="child-link white-font" href="/property/rural-farm-property-sales"  >Farms sold </a>
-                          <a class="child-link white-font" href="/property/90395/we-release-new-set-visualisations-showing-how-seven-our-cities-have-grown-over-time"  >'Sprawl' visualisations </a>
-                          <a class="child-link white-font" href="https://www.interest.co.nz/property/105655/house-prices-bottom-end-market-have-declined-73-their-march-peak-while-mortgage" target="_blank" >Home loan affordability </a>
-                          <a class="child-link white-font" href="/property/house-price-income-multiples"  >Median multiples </a>
-                          <a class="child-link white-font" href="/calculators/mortgage-calculator"  >Mortgage calculator </a>
-                          <a class="child-link white-font" href="/calculators/mortgage-break-fee-estimator"  >Break fee calculator </a>
-                          <a class="child-link white-font" href="/saving/rental-yield-indicator"  >Rental yield indicator </a>
-                          <a class="child-link white-font" href="/property/rent-ratio"  >Rent ratio </a>
-                          <a class="child-link white-font" href="/property/commercial-property-for-sale"  >Commercial property for sale </a>
-                          <a class="child-link white-font" href="/property/lifestyle-blocks"  >Lifestyle blocks for sale </a>
-                          <a class="child-link white-font" href="https://www.interest.co.nz/news/emails-newsletters-sign-up" target="_blank" >Sign up for our free Property newsletter </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/borrowing">Borrowing </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/borrowing"  >Mortgage rates </a>
-                          <a class="child-link white-font" href="/calculators/mortgage-calculator"  >- Mortgage calculator </a>
-                          <a class="child-link white-font" href="/calculators/mortgage-break-fee-estimator"  >- Break fee calculator </a>
-                          <a class="child-link white-font" href="/personal-finance/101570/moneyhubs-christopher-walsh-digs-deep-reverse-mortgages-what-they-are-their"  >Reverse mortgage FAQ </a>
-                          <a class="child-link white-font" href="/borrowing/revolving-credit"  >Revolving credit </a>
-                          <a class="child-link white-font" href="/borrowing/car-loan"  >Car loans </a>
-                          <a class="child-link white-font" href="/borrowing/credit-cards"  >Credit cards </a>
-                          <a class="child-link white-font" href="/borrowing/personal-loan"  >Personal loans </a>
-                          <a class="child-link white-font" href="/borrowing/business-base-rates"  >Business loan rates </a>
-                          <a class="child-link white-font" href="/calculators/55377/should-you-fix-or-stay-floating"  >Fix or Float calculator </a>
-                          <a class="child-link white-font" href="/property/rent-or-buy"  >Rent or Buy ? </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/saving/term-deposits-1-to-5-years">Saving </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/saving/call-account"  >Savings accounts </a>
-                          <a class="child-link white-font" href="/saving/bonus-savings-accounts"  >Bonus savings accounts </a>
-                          <a class="child-link white-font" href="/saving/term-deposits-1-to-9-months"  >Term deposits < 1 yr </a>
-                          <a class="child-link white-font" href="/saving/term-deposits-1-to-5-years"  >Term deposits 1 - 5 years </a>
-                          <a class="child-link white-font" href="/saving/term-pie"  >Term PIEs </a>
-                          <a class="child-link white-font" href="/calculators/deposit-calculator"  >Deposit calculator </a>
-                          <a class="child-link white-font" href="/saving/interest-codes"  >Interest codes </a>
-                          <a class="child-link white-font" href="/credit-ratings-explained"  >Credit ratings explained </a>
-                          <a class="child-link white-font" href="/saving/market-platform"  >Private market </a>
-                          <a class="child-link white-font" href="/saving/bank-leverage"  >Bank leverage </a>
-                          <a class="child-link white-font" href="/saving/deep-freeze-list"  >Deep Freeze list </a>
-                          <a class="child-link white-font" href="/saving/porridge-list"  >Porridge list </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/kiwisaver">Kiwisaver </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/kiwisaver/funds"  >Find your fund </a>
-                          <a class="child-link white-font" href="/kiwisaver/fund-comparison-table"  >Compare fund categories </a>
-                          <a class="child-link white-font" href="/kiwisaver/calculators"  >Calculators </a>
-                          <a class="child-link white-font" href="/kiwisaver"  >KiwiSaver news </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/banking">Banking </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/saving/bank-leverage"  >Bank leverage </a>
-                          <a class="child-link white-font" href="/credit-ratings-explained"  >Credit ratings explained </a>
-                          <a class="child-link white-font" href="/saving/bank-financial-comparator"  >Key bank metrics </a>
-                          <a class="child-link white-font" href="/news/82573/reserve-bank-lays-out-detail-how-it-reviews-our-monetary-policy-settings-and-processes"  >How the OCR is set </a>
-                          <a class="child-link white-font" href="/opinion/77033/overview-functions-money-and-how-money-and-credit-are-created-nz-economy-examining"  >How money is created </a>
-                          <a class="child-link white-font" href="/bonds/64411/if-bank-failed-and-open-bank-resolution-policy-was-implemented-how-would-it-affect-bank"  >How OBR will work </a>
-                          <a class="child-link white-font" href="https://www.rbnz.govt.nz/monetary-policy/unconventional-monetary-policy" target="_blank" >About unconventional monetary policy </a>
-                          <a class="child-link white-font" href="/borrowing"  >Mortgage interest rates </a>
-                          <a class="child-link white-font" href="/saving/term-deposits-1-to-5-years"  >Term deposit interest rates </a>
-                          <a class="child-link white-font" href="/category/topic/little-book-scams"  >Scams - how to protect yourself </a>
-                          <a class="child-link white-font" href="/paid-newsletter/37138"  >Subscribe to industry newsletter </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/insurance">Insurance </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/insurance-data/car-insurance-compared-january-2018"  >Car insurance - 2018 </a>
-                          <a class="child-link white-font" href="/category/tag/house-insurance"  >House cover </a>
-                          <a class="child-link white-font" href="/category/tag/climate-change"  >Climate change </a>
-                          <a class="child-link white-font" href="http://www.icnz.org.nz/statistics-data/industry-data/" target="_blank" >Industry stats </a>
-                          <a class="child-link white-font" href="/users/andrew-hooker"  >Andrew Hooker columns </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/personal-finance">Personal </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/borrowing"  >Mortgage interest rates </a>
-                          <a class="child-link white-font" href="/personal-finance/101570/moneyhubs-christopher-walsh-digs-deep-reverse-mortgages-what-they-are-their"  >Reverse mortgages </a>
-                          <a class="child-link white-font" href="/saving/term-deposits-1-to-5-years"  >Term deposit interest rates </a>
-                          <a class="child-link white-font" href="/category/tag/credit-cards"  >Credit cards </a>
-                          <a class="child-link white-font" href="/calculators"  >Calculators </a>
-                          <a class="child-link white-font" href="/saving/market-platform"  >Private investments </a>
-                          <a class="child-link white-font" href="/kiwisaver"  >KiwiSaver </a>
-                          <a class="child-link white-font" href="/saving/gold-spot"  >Gold & silver prices </a>
-                          <a class="child-link white-font" href="/saving/gold-coins"  >- Gold coin prices </a>
-                          <a class="child-link white-font" href="/saving/gold-bars"  >- Gold bar prices </a>
-                          <a class="child-link white-font" href="/saving/scrap-metals"  >- Precious metal scrap prices </a>
-                          <a class="child-link white-font" href="/category/topic/little-book-scams"  >Protection from scams </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/rural">Rural </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/rural/beef/bull-m2"  >Bull prices </a>
-                          <a class="child-link white-font" href="/rural/beef/steer-p2"  >Steer & heifer prices </a>
-                          <a class="child-link white-font" href="/rural/beef/heifer-localtrade"  >Beef local trade prices </a>
-                          <a class="child-link white-font" href="/rural/beef/cow-prime"  >Cow prices </a>
-                          <a class="child-link white-font" href="/rural/sheep/lamb-y"  >Lamb prices </a>
-                          <a class="child-link white-font" href="/rural/sheep/lamb-localtrade"  >Local trade lamb prices </a>
-                          <a class="child-link white-font" href="/rural/sheep/wool"  >Wool prices </a>
-                          <a class="child-link white-font" href="/rural-data/dairy-industry-payout-history"  >Dairy payout history </a>
-                          <a class="child-link white-font" href="/rural/logs"  >Logs </a>
-                          <a class="child-link white-font" href="/rural-news/farms-for-sale"  >Farms for sale </a>
-                          <a class="child-link white-font" href="/rural"  >All other rural links to data </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/currencies">Currencies </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/currencies/buying-foreign-currency"  >Live rates for buying fx </a>
-                          <a class="child-link white-font" href="/currencies/selling-foreign-currency-transfers"  >Live rates to sell TT fx </a>
-                          <a class="child-link white-font" href="/currencies/currency-conversion-fees"  >Currency fees </a>
-                          <a class="child-link white-font" href="/currencies/rate-pricing"  >Rate pricing </a>
-                          <a class="child-link white-font" href="/currencies/spot-rates"  >Spot transactions </a>
-                          <a class="child-link white-font" href="/currencies/forward-rates"  >Forward transactions </a>
-                          <a class="child-link white-font" href="/currencies/how-currency-swaps-work"  >Currency swaps </a>
-                          <a class="child-link white-font" href="/currencies/how-to-do-currency-deals-with-hifx"  >How to do currency deals </a>
-                          <a class="child-link white-font" href="/currencies/currency-directory"  >Directory - where to buy/sell </a>
-                          <a class="child-link white-font" href="/currencies/subscribe_to_newsletter"  >Daily fx rate sheet email </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/charts">Charts </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/charts/commodities"  >Commodities </a>
-                          <a class="child-link white-font" href="/charts/confidence"  >Confidence </a>
-                          <a class="child-link white-font" href="/charts/credit"  >Debt (Credit) </a>
-                          <a class="child-link white-font" href="/charts/economy"  >Economy </a>
-                          <a class="child-link white-font" href="/charts/exchange rates"  >Exchange rates </a>
-                          <a class="child-link white-font" href="/charts/interest rates"  >Interest rates </a>
-                          <a class="child-link white-font" href="/charts/population"  >Population </a>
-                          <a class="child-link white-font" href="/charts/prices"  >Prices </a>
-                          <a class="child-link white-font" href="/charts/real estate"  >Real estate </a>
-                          <a class="child-link white-font" href="/charts/rural"  >Rural </a>
-                          <a class="child-link white-font" href="/charts"  >Full list of all charts </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/calculators">Calculators </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/calculators/deposit-calculator"  >Deposit calculator </a>
-                          <a class="child-link white-font" href="/calculators/mortgage-calculator"  >Mortgage calculator </a>
-                          <a class="child-link white-font" href="/calculators/borrowing-capacity-calculator"  >How much can you bid? </a>
-                          <a class="child-link white-font" href="/calculators/full-function-mortgage-calculator"  >Full-function mortgage calculator </a>
-                          <a class="child-link white-font" href="/calculators/lvr-borrowing-capacity-calculator"  >LVR borrowing capacity </a>
-                          <a class="child-link white-font" href="/calculators/property-upsize-downsize-calculator"  >Property upsize/downsize </a>
-                          <a class="child-link white-font" href="/calculators/principal-payback-milestone-calculator"  >Principal payback milestone </a>
-                          <a class="child-link white-font" href="/calculators/mortgage-break-fee-estimator"  >Break fee calculator </a>
-                          <a class="child-link white-font" href="/calculators/55377/should-you-fix-or-stay-floating"  >Fix or float calculator </a>
-                          <a class="child-link white-font" href="/calculators/credit-card-minimum-payments"  >Credit card real cost </a>
-                          <a class="child-link white-font" href="/calculators/cost-of-credit-calculator"  >Real cost of debt </a>
-                          <a class="child-link white-font" href="/calculators/retirement-calculator"  >Retirement calculator </a>
-                          <a class="child-link white-font" href="/calculators/foreign-currency-calculator"  >Buying foreign currency </a>
-                          <a class="child-link white-font" href="/calculators"  >All our calculators </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/bonds">Bonds </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/bonds-data/issues"  >Current prices </a>
-                          <a class="child-link white-font" href="/bonds/how-to-read-these-pages"  >How to use our bonds resource </a>
-                          <a class="child-link white-font" href="/bonds/how-to-buy-bonds"  >How to buy bonds </a>
-                          <a class="child-link white-font" href="/bonds/bond-types"  >Bond types </a>
-                          <a class="child-link white-font" href="/bonds/glossary"  >Glossary </a>
-                          <a class="child-link white-font" href="/charts/interest-rates/government-bond-rates"  >NZ Govt bond rates </a>
-                          <a class="child-link white-font" href="/charts/interest-rates/us-treasures"  >US Treasury bond rates </a>
-                      </div>
-          </div>
-        </div>
-      <div class="parent-div">
-        <a class="parent-link" href="/business">Business </a>
-              <div class="child-dropdown">
-            <div class="child-dropdown-inner-wrapper">
-                          <a class="child-link white-font" href="/borrowing/business-base-rates"  >Business borrowing rates </a>
-                          <a class="child-link white-font" href="/understanding-china"  >Understanding China </a>
-                          <a class="child-link white-font" href="/understanding-china"  >- by Professor Ang and guests </a>
-                          <a class="child-link white-font" href="/category/tag/tppa"  >TPPA explainer series </a>
-                          <a class="child-link white-font" href="/business/how-to-guides"  >How to guides: </a>
-                          <a class="child-link white-font" href="/business/60438/we-are-starting-new-13-part-guide-small-business-managers-who-want-achieve-financial"  >- Achieving financial success </a>
-                          <a class="child-link white-font" href="/business/60243/first-ten-part-guide-series-how-tackle-often-complex-challenges-companies-face-when"  >- The realities of growth </a>
-                          <a class="child-link white-font" href="/category/tag/success-stories"  >Success stories </a>
-                          <a class="child-link white-font" href="https://www.interest.co.nz/gdp-live" target="_blank" >GDP Live </a>
-                      </div>
-          </div>
-        </div>
-            </div>
-            <div id="nav-logo-block">
-              <a href="/"></a>
-            </div>
-          </div>
-        </div>
-      </header>
-
-    <div id="banner-ad-wrapper">
-        <div class="region region-banner">
-        <div id="block-dfp-setup-19-interest-19-ros-billboard" class="block block-dfp-setup-19">
-
-
-      <div class="content">
-        <!-- 2332506/interest_19_ROS_Billboard/interest_19_ROS_Billboard -->
-            <div data-fuse="21850843980"></div>  </div>
-    </div>
-      </div>
-    </div>
-
-
-    <div id="page-wrapper">
-      <div id="page">
-
-
-        <div id="content">
-          <a id="main-content"></a>
-
-          <div id="main-content-container">
-
-            <div id="main-column-wrapper">
-                        <!--<div id="breadcrumb"><h2 class="element-invisible">You are here</h2><div class="breadcrumb"><a href="/">Home</a> » <a href="/saving/term-deposits-1-to-5-years">Saving</a></div></div>-->
-
-                        <h1 class="title" id="page-title"> Standard savings accounts </h1>
-
-                        <div class="tabs">
-                        </div>
-
-              <div id="main-column">
-                  <div class="region region-content">
-        <div id="block-system-main" class="block block-system">
-
-
-      <div class="content">
-        <div class="panel-display panel-1col clearfix" >
-      <div class="panel-panel panel-col">
-        <div><div class="panel-pane pane-custom pane-1"  >
-
-
-
-      <div class="pane-content">
-        <p><a href="https://www.rabobank.co.nz/noticesaver/?utm_source=interest.co.nz&amp;utm_medium=banner&amp;utm_campaign=savingsaccount&amp;utm_term=saving_call-account&amp;utm_content=noticesaver" target="_blank"><img src="/banners/rabo-featured-rate-noticesaver-Jul-20.jpg" /></a></p>
-
-    <table border="0" cellpadding="1" cellspacing="1" style="width:760px;"><tbody><tr><td colspan="3">We have updated our coverage of Saving accounts, separating them out by type. Unique pages now exist for the following savings account types:</td>
-        </tr><tr><td style="width: 262px;">- <a href="http://www.interest.co.nz/saving/bonus-savings-accounts" target="_blank">Bonus savings accounts</a></td>
-          <td style="width: 253px;">- <a href="http://www.interest.co.nz/saving/business-savings-accounts" target="_blank">Business savings accounts</a></td>
-          <td style="width: 217px;">- <a href="http://www.interest.co.nz/saving/children-youth-student">Children's accounts</a></td>
-        </tr><tr><td style="width: 262px;">- <a href="http://www.interest.co.nz/saving/e-saver-online" target="_blank">Online savings accounts</a></td>
-          <td style="width: 253px;">- <a href="http://www.interest.co.nz/saving/call-account" target="_blank">Standard savings accounts</a></td>
-        </tr></tbody></table><p style="clear:both;"><a href="" onclick="javascript:window.print()">Printer friendly version of this page</a></p>
-
-    <p style="clear:both;"><a href="http://www.interest.co.nz/saving/term-deposits-1-to-9-months">for term deposits up to 9 months, see here »</a></p>
-
-    <p style="clear:both; padding-bottom:10px;"><a href="http://www.interest.co.nz/calculators/deposit-calculator">Make sense of all these rates by using our Savings Calculator</a></p>
-      </div>
-
-
-      </div>
-    <div class="panel-separator"></div><div class="panel-pane pane-node"  >
-
-            <h2 class="pane-title">
-          Banks    </h2>
-
-
-      <div class="pane-content">
-        <div about="/node/37807" typeof="sioc:Item foaf:Document">
-          <header>
-                        <h2><a href="/node/37807" rel="bookmark"></a></h2>
-                <span property="dc:title" content="" class="rdf-meta element-hidden"></span><span property="sioc:num_replies" content="0" datatype="xsd:integer" class="rdf-meta element-hidden"></span>    </header>
-
-      <div>
-        <table id="interest_financial_datatable" class="interest_financial_datatable">
-      <thead>
-        <tr>
-          <th width="210px" valign="bottom" align="left">Institution</th>
-    <th width="12px" class="right" valign="bottom" align="left"><a href="/credit-ratings-explained">Credit Rating</a></th>
-    <th width="150px" valign="bottom" align="left">Account type</th>
-    <th width="55px" class="right" valign="bottom" align="left">Minimum deposit $</th>
-    <th width="55px" class="right" valign="bottom" align="left">Interest rate %</th>    </tr>
-      </thead>
-      <tbody>
-        <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#anz" title="ANZ">ANZ</a></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Online savings </td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Select</td><td width="55px" class="right" valign="middle">$5,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#asb" title="ASB">ASB</a></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">FastSaver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><a class="interest_financial_link" href="https://www.asb.co.nz/personal/accounts/savings" >0.05</a></td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Unlimited</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Savings On Call</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Savings On Call</td><td width="55px" class="right" valign="middle">$10,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Savings On Call</td><td width="55px" class="right" valign="middle">$25,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Savings On Call</td><td width="55px" class="right" valign="middle">$50,000</td><td width="55px" class="right" valign="middle">0.08</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Savings On Call</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">0.08</td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#bob" title="Bank of Baroda">Bank of Baroda</a></td><td width="12px" class="right" valign="top">BBB-</td><td width="150px" class="left-align" valign="middle">Savings </td><td width="55px" class="right" valign="middle">$1,000</td><td width="55px" class="right" valign="middle">1.25</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB-</td><td width="150px" class="left-align" valign="middle">Super savings </td><td width="55px" class="right" valign="middle">$1,000</td><td width="55px" class="right" valign="middle">1.25</td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#boi" title="Bank of India">Bank of India</a></td><td width="12px" class="right" valign="top">BB+</td><td width="150px" class="left-align" valign="middle">Star savings</td><td width="55px" class="right" valign="middle">$1,000</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB+</td><td width="150px" class="left-align" valign="middle">Star super savings</td><td width="55px" class="right" valign="middle">$1,000</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#bnz" title="BNZ">BNZ</a></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Personal OnCall</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Total Money</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Call</td><td width="55px" class="right" valign="middle">$500,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#psis" title="Co-operative Bank">Co-operative Bank</a></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Online Account</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><b>0.10<img class="interest_financial_indicator-down" src="https://www.interest.co.nz/sites/default/files/images/interest_financial_indicator-down.gif" /></b></td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Smile On Call</td><td width="55px" class="right" valign="middle">$50,000</td><td width="55px" class="right" valign="middle"><b>0.10<img class="interest_financial_indicator-down" src="https://www.interest.co.nz/sites/default/files/images/interest_financial_indicator-down.gif" /></b></td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Smile On Call</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle"><b>0.10<img class="interest_financial_indicator-down" src="https://www.interest.co.nz/sites/default/files/images/interest_financial_indicator-down.gif" /></b></td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.heartland.co.nz/savings-and-deposits/savings-account?utm_source=interest_nz&utm_medium=logo&utm_campaign=Deposits-savings&utm_content=interest.nz-call-account-page&utm_term=logo" title="Invest in Heartland to invest in New Zealand"><img title="Invest in Heartland to invest in New Zealand" src="https://www.interest.co.nz/images/campaign-logo/heartland-logo-3.jpg" alt="Heartland Bank" style = "border:0 none;"/></a></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Heartland Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.25</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Business Call Accounts</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><a class="interest_financial_link" href="https://www.heartland.co.nz/savings-and-deposits/savings-account" title="Invest in Heartland to invest in New Zealand">1.00</a></td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Direct Call</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><a class="interest_financial_link" href="https://www.heartland.co.nz/savings-and-deposits/savings-account" title="Invest in Heartland to invest in New Zealand">1.00</a></td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Heartland Everyday</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Heartland Everyday</td><td width="55px" class="right" valign="middle">$10,000</td><td width="55px" class="right" valign="middle">0.10</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Heartland Everyday</td><td width="55px" class="right" valign="middle">$50,000</td><td width="55px" class="right" valign="middle">0.15</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Heartland Everyday</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">0.20</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Heartland Everyday</td><td width="55px" class="right" valign="middle">$250,000</td><td width="55px" class="right" valign="middle">0.30</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">YouChoose </td><td width="55px" class="right" valign="middle">$0</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Heartland Savings Optimiser</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#hsbc" title="HSBC">HSBC</a></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">E-Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.07</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Smart Saver</td><td width="55px" class="right" valign="middle">$0</td><td width="55px" class="right" valign="middle">0.65</td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#icbc" title="ICBC ">ICBC </a></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Smart Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.80</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#kiwi" title="Kiwibank">Kiwibank</a></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Notice Saver 90 days</td><td width="55px" class="right" valign="middle">$2,000</td><td width="55px" class="right" valign="middle">1.75</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Notice Saver 32 days</td><td width="55px" class="right" valign="middle">$2,000</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Back-up Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Bill Blaster</td><td width="55px" class="right" valign="middle">$100</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Front Runner</td><td width="55px" class="right" valign="middle">$4,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Front Runner</td><td width="55px" class="right" valign="middle">$15,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Front Runner</td><td width="55px" class="right" valign="middle">$50,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Front Runner</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">0.25</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#kookmin" title="Kookmin">Kookmin</a></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Personal Cheque</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">Personal Cheque</td><td width="55px" class="right" valign="middle">$250,000</td><td width="55px" class="right" valign="middle">0.20</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.rabobank.co.nz/interest-rates/?utm_source=interest.co.nz&utm_medium=logo&utm_campaign=savingsaccount&utm_term=saving_call-account" title="Click Here To Apply Online"><img title="Click Here To Apply Online" src="https://www.interest.co.nz/images/campaign-logo/rabobank-logo-june-2019.jpg" alt="RaboDirect" style = "border:0 none;"/></a></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">NoticeSaver 60 days</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><a class="interest_financial_link" href="https://www.rabobank.co.nz/interest-rates/?utm_source=interest.co.nz&utm_medium=rateslink&utm_campaign=savingsaccount&utm_term=saving_call-account" >1.85</a></td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">RaboSaver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><a class="interest_financial_link" href="https://www.rabobank.co.nz/interest-rates/?utm_source=interest.co.nz&utm_medium=rateslink&utm_campaign=savingsaccount&utm_term=saving_call-account" >0.50</a></td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">RaboSaver</td><td width="55px" class="right" valign="middle">$5,000,000</td><td width="55px" class="right" valign="middle"><a class="interest_financial_link" href="https://www.rabobank.co.nz/interest-rates/?utm_source=interest.co.nz&utm_medium=rateslink&utm_campaign=savingsaccount&utm_term=saving_call-account" >0.30</a></td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">PremiumSaver - base</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><a class="interest_financial_link" href="https://www.rabobank.co.nz/interest-rates/?utm_source=interest.co.nz&utm_medium=rateslink&utm_campaign=savingsaccount&utm_term=saving_bonus-savings-accounts" >0.20</a></td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">PremiumSaver - bonus</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><a class="interest_financial_link" href="https://www.rabobank.co.nz/interest-rates/?utm_source=interest.co.nz&utm_medium=rateslink&utm_campaign=savingsaccount&utm_term=saving_bonus-savings-accounts" >0.80</a></td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A</td><td width="150px" class="left-align" valign="middle">PremiumSaver - potential rate</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><a class="interest_financial_link" href="https://www.rabobank.co.nz/interest-rates/?utm_source=interest.co.nz&utm_medium=rateslink&utm_campaign=savingsaccount&utm_term=saving_bonus-savings-accounts" >1.00</a></td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#sbs" title="SBS Bank.">SBS Bank.</a></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">i-Save</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Prospector Call</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Prospector Call</td><td width="55px" class="right" valign="middle">$50,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Prospector Call</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">0.25</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.tsbbank.co.nz?utm_source=interest.co.nz&utm_medium=oncall_logo&utm_campaign=interest.co.nz" title="Find Out More
-    "><img title="Find Out More
-    " src="https://www.interest.co.nz/images/campaign-logo/tsb-bank-logo-1.gif" alt="TSB Bank" style = "border:0 none;"/></a></td><td width="12px" class="right" valign="top">A-</td><td width="150px" class="left-align" valign="middle">WebSaver</td><td width="55px" class="right" valign="middle">$1,000</td><td width="55px" class="right" valign="middle">0.40</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A-</td><td width="150px" class="left-align" valign="middle">Horizon Savings</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.40</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A-</td><td width="150px" class="left-align" valign="middle">Premier Cheque</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.10</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A-</td><td width="150px" class="left-align" valign="middle">Premier Cheque</td><td width="55px" class="right" valign="middle">$20,000</td><td width="55px" class="right" valign="middle">0.35</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A-</td><td width="150px" class="left-align" valign="middle">Premier Cheque</td><td width="55px" class="right" valign="middle">$35,000</td><td width="55px" class="right" valign="middle">0.55</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A-</td><td width="150px" class="left-align" valign="middle">Premier Cheque</td><td width="55px" class="right" valign="middle">$50,000</td><td width="55px" class="right" valign="middle">0.95</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">A-</td><td width="150px" class="left-align" valign="middle">Premier Cheque</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">1.15</td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#westpac" title="Westpac">Westpac</a></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Notice Saver 32 days</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">AA-</td><td width="150px" class="left-align" valign="middle">Simple Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.05</td></tr>  </tbody>
-    </table>
-      </div>
-
-
-    </div>
-      </div>
-
-
-      </div>
-    <div class="panel-separator"></div><div class="panel-pane pane-node"  >
-
-            <h2 class="pane-title">
-          Brokers    </h2>
-
-
-      <div class="pane-content">
-        <div about="/node/37812" typeof="sioc:Item foaf:Document">
-          <header>
-                        <h2><a href="/node/37812" rel="bookmark"></a></h2>
-                <span property="dc:title" content="" class="rdf-meta element-hidden"></span><span property="sioc:num_replies" content="0" datatype="xsd:integer" class="rdf-meta element-hidden"></span>    </header>
-
-      <div>
-        <table id="interest_financial_datatable" class="interest_financial_datatable">
-      <thead>
-        <tr>
-          <th width="210px" valign="bottom" align="left">Institution</th>
-    <th width="12px" class="right" valign="bottom" align="left"><a href="/credit-ratings-explained">Credit Rating</a></th>
-    <th width="150px" valign="bottom" align="left">Account type</th>
-    <th width="55px" class="right" valign="bottom" align="left">Minimum deposit $</th>
-    <th width="55px" class="right" valign="bottom" align="left">Interest rate %</th>    </tr>
-      </thead>
-      <tbody>
-        <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#asb" title="ASB Securities">ASB Securities</a></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">0.00</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$250,000</td><td width="55px" class="right" valign="middle">0.00</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$500,000</td><td width="55px" class="right" valign="middle">0.25</td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="http://www.interest.co.nz/directory1.asp#craigs" title="click here for more information"><img title="click here for more information" src="https://www.interest.co.nz/images/campaign-logo/Craigs.gif" alt="Craigs Investment Partners" style = "border:0 none;"/></a></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">1.45</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$20,000</td><td width="55px" class="right" valign="middle">1.65</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">2.10</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$250,000</td><td width="55px" class="right" valign="middle">2.25</td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#Direct" title="Direct Broking">Direct Broking</a></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">OMCA</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="http://www.forbar.co.nz" title="click here for more info"><img title="click here for more info" src="https://www.interest.co.nz/images/campaign-logo/Fb_140.gif" alt="Forsyth Barr" style = "border:0 none;"/></a></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$3,000</td><td width="55px" class="right" valign="middle">0.00</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$20,000</td><td width="55px" class="right" valign="middle">0.25</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$50,000</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Cash Management Trust</td><td width="55px" class="right" valign="middle">$250,000</td><td width="55px" class="right" valign="middle">0.75</td></tr>  </tbody>
-    </table>
-      </div>
-
-
-    </div>
-      </div>
-
-
-      </div>
-    <div class="panel-separator"></div><div class="panel-pane pane-node"  >
-
-            <h2 class="pane-title">
-          Building Societies    </h2>
-
-
-      <div class="pane-content">
-        <div about="/node/37809" typeof="sioc:Item foaf:Document">
-          <header>
-                        <h2><a href="/node/37809" rel="bookmark"></a></h2>
-                <span property="dc:title" content="" class="rdf-meta element-hidden"></span><span property="sioc:num_replies" content="0" datatype="xsd:integer" class="rdf-meta element-hidden"></span>    </header>
-
-      <div>
-        <table id="interest_financial_datatable" class="interest_financial_datatable">
-      <thead>
-        <tr>
-          <th width="210px" valign="bottom" align="left">Institution</th>
-    <th width="12px" class="right" valign="bottom" align="left"><a href="/credit-ratings-explained">Credit Rating</a></th>
-    <th width="150px" valign="bottom" align="left">Account type</th>
-    <th width="55px" class="right" valign="bottom" align="left">Minimum deposit $</th>
-    <th width="55px" class="right" valign="bottom" align="left">Interest rate %</th>    </tr>
-      </thead>
-      <tbody>
-        <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#hpbs" title="Heretaunga">Heretaunga</a></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">On Call</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle"><b>0.50<img class="interest_financial_indicator-down" src="https://www.interest.co.nz/sites/default/files/images/interest_financial_indicator-down.gif" /></b></td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">On Call</td><td width="55px" class="right" valign="middle">$50,000</td><td width="55px" class="right" valign="middle"><b>0.80<img class="interest_financial_indicator-down" src="https://www.interest.co.nz/sites/default/files/images/interest_financial_indicator-down.gif" /></b></td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">On Call</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle"><b>1.20<img class="interest_financial_indicator-down" src="https://www.interest.co.nz/sites/default/files/images/interest_financial_indicator-down.gif" /></b></td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#nelson" title="Nelson">Nelson</a></td><td width="12px" class="right" valign="top">BB+</td><td width="150px" class="left-align" valign="middle">Call</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.75</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB+</td><td width="150px" class="left-align" valign="middle">Target</td><td width="55px" class="right" valign="middle">$100</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB+</td><td width="150px" class="left-align" valign="middle">Target</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB+</td><td width="150px" class="left-align" valign="middle">Cheque</td><td width="55px" class="right" valign="middle">$10,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB+</td><td width="150px" class="left-align" valign="middle">Access</td><td width="55px" class="right" valign="middle">$10,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>  </tbody>
-    </table>
-      </div>
-
-
-    </div>
-      </div>
-
-
-      </div>
-    <div class="panel-separator"></div><div class="panel-pane pane-node"  >
-
-            <h2 class="pane-title">
-          Credit Unions    </h2>
-
-
-      <div class="pane-content">
-        <div about="/node/37810" typeof="sioc:Item foaf:Document">
-          <header>
-                        <h2><a href="/node/37810" rel="bookmark"></a></h2>
-                <span property="dc:title" content="" class="rdf-meta element-hidden"></span><span property="sioc:num_replies" content="0" datatype="xsd:integer" class="rdf-meta element-hidden"></span>    </header>
-
-      <div>
-        <table id="interest_financial_datatable" class="interest_financial_datatable">
-      <thead>
-        <tr>
-          <th width="210px" valign="bottom" align="left">Institution</th>
-    <th width="12px" class="right" valign="bottom" align="left"><a href="/credit-ratings-explained">Credit Rating</a></th>
-    <th width="150px" valign="bottom" align="left">Account type</th>
-    <th width="55px" class="right" valign="bottom" align="left">Minimum deposit $</th>
-    <th width="55px" class="right" valign="bottom" align="left">Interest rate %</th>    </tr>
-      </thead>
-      <tbody>
-        <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#actu" title="Aotearoa Credit Union">Aotearoa Credit Union</a></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Serious Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.40</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Serious Saver</td><td width="55px" class="right" valign="middle">$5,000</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Serious Saver</td><td width="55px" class="right" valign="middle">$20,000</td><td width="55px" class="right" valign="middle">0.60</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Home deposit account</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Home deposit account</td><td width="55px" class="right" valign="middle">$1,000</td><td width="55px" class="right" valign="middle">1.75</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Home deposit account</td><td width="55px" class="right" valign="middle">$10,000</td><td width="55px" class="right" valign="middle">2.00</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#fcu" title="First CU">First CU</a></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Online savings</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">1.75</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Moneymaker</td><td width="55px" class="right" valign="middle">$5,000</td><td width="55px" class="right" valign="middle">1.50</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory/" title="NZ Firefighters CU">NZ Firefighters CU</a></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Bill Pay Account</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Christmas Club (Membership criteria apply)</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">2.00</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#cua" title="NZCU Auckland">NZCU Auckland</a></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Success Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">1.50</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Success Saver</td><td width="55px" class="right" valign="middle">$5,000</td><td width="55px" class="right" valign="middle">2.00</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#cub" title="NZCU Baywide">NZCU Baywide</a></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Online Saver</td><td width="55px" class="right" valign="middle">$1,000</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Online Saver</td><td width="55px" class="right" valign="middle">$20,000</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Success Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.40</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Success Saver</td><td width="55px" class="right" valign="middle">$5,000</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Success Saver</td><td width="55px" class="right" valign="middle">$20,000</td><td width="55px" class="right" valign="middle">0.60</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Success Saver</td><td width="55px" class="right" valign="middle">$100,000</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Goal Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.75</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Christmas Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#cuc" title="NZCU Central">NZCU Central</a></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Money maker</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.40</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Money maker</td><td width="55px" class="right" valign="middle">$5,000</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Money maker</td><td width="55px" class="right" valign="middle">$20,000</td><td width="55px" class="right" valign="middle">0.60</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Cash Access Shares</td><td width="55px" class="right" valign="middle">$2</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory/#cub" title="NZCU Employees">NZCU Employees</a></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Target Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">1.00</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Loan Provider</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">2.00</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top"></td><td width="150px" class="left-align" valign="middle">Christmas Club</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">3.00</td></tr>
-    <tr class="primary_row interest_financial_row_0" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#scu" title="NZCU South">NZCU South</a></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Success Saver</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.40</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Success Saver</td><td width="55px" class="right" valign="middle">$5,000</td><td width="55px" class="right" valign="middle">0.50</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Success Saver</td><td width="55px" class="right" valign="middle">$20,000</td><td width="55px" class="right" valign="middle">0.60</td></tr>
-    <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory#policecu" title="Police CU">Police CU</a></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Achiever Saver (Membership criteria apply)</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.45</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Transactional Account (Membership criteria apply)</td><td width="55px" class="right" valign="middle">$2,000</td><td width="55px" class="right" valign="middle">0.05</td></tr>
-    <tr class="interest_financial_row_1" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BBB</td><td width="150px" class="left-align" valign="middle">Christmas Club (Membership criteria apply)</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.45</td></tr>  </tbody>
-    </table>
-      </div>
-
-
-    </div>
-      </div>
-
-
-      </div>
-    <div class="panel-separator"></div><div class="panel-pane pane-node"  >
-
-            <h2 class="pane-title">
-          Finance Companies    </h2>
-
-
-      <div class="pane-content">
-        <div about="/node/37811" typeof="sioc:Item foaf:Document">
-          <header>
-                        <h2><a href="/node/37811" rel="bookmark"></a></h2>
-                <span property="dc:title" content="" class="rdf-meta element-hidden"></span><span property="sioc:num_replies" content="0" datatype="xsd:integer" class="rdf-meta element-hidden"></span>    </header>
-
-      <div>
-        <table id="interest_financial_datatable" class="interest_financial_datatable">
-      <thead>
-        <tr>
-          <th width="210px" valign="bottom" align="left">Institution</th>
-    <th width="12px" class="right" valign="bottom" align="left"><a href="/credit-ratings-explained">Credit Rating</a></th>
-    <th width="150px" valign="bottom" align="left">Account type</th>
-    <th width="55px" class="right" valign="bottom" align="left">Minimum deposit $</th>
-    <th width="55px" class="right" valign="bottom" align="left">Interest rate %</th>    </tr>
-      </thead>
-      <tbody>
-        <tr class="primary_row interest_financial_row_1" style="border-top:1px solid #CCE2F3;"><td width="210px" class="inst-name" valign="top"><a class="interest_financial_link" href="https://www.interest.co.nz/directory" title="Christian Savings ">Christian Savings </a></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Call</td><td width="55px" class="right" valign="middle">$1</td><td width="55px" class="right" valign="middle">0.10</td></tr>
-    <tr class="interest_financial_row_0" style=""><td width="210px" class="inst-name" valign="top"></td><td width="12px" class="right" valign="top">BB</td><td width="150px" class="left-align" valign="middle">Call</td><td width="55px" class="right" valign="middle">$5,000</td><td width="55px" class="right" valign="middle">0.25</td></tr>  </tbody>
-    </table>
-      </div>
-
-
-    </div>
-      </div>
-
-
-      </div>
-    <div class="panel-separator"></div><div class="panel-pane pane-custom pane-2"  >
-
-
-
-      <div class="pane-content">
-        <style type="text/css">
-    <!--/*--><![CDATA[/* ><!--*/
-
-    @media print {
-      header{
-        display:none;
-      }
-      div#sidebar {
-        display: none;
-      }
-    }
-
-    /*--><!]]>*/
-    </style>  </div>
-
-
-      </div>
-    </div>
-      </div>
-    </div>
-      </div>
-    </div>
-    <div id="block-dfp-setup-19-publift-sticky-footer" class="block block-dfp-setup-19">
-
-
-      <div class="content">
-        <div data-fuse="21858320168"></div>  </div>
-    </div>
-    <div id="block-dfp-setup-19-publift-left-ad-gutter" class="block block-dfp-setup-19">
-
-
-      <div class="content">
-
-              <!-- 2332506/interest_19_ROS_leftgutter/interest_19_ROS_leftgutter -->
-              <div data-fuse="21866065070"></div>  </div>
-    </div>
-    <div id="block-dfp-setup-19-publift-right-ad-gutter" class="block block-dfp-setup-19">
-
-
-      <div class="content">
-
-            <!-- 2332506/interest_19_ROS_rightgutter/interest_19_ROS_rightgutter -->
-            <div data-fuse="21866065073"></div>  </div>
-    </div>
-    <div id="block-dfp-setup-19-publift-imp-pixel-1" class="block block-dfp-setup-19">
-
-
-      <div class="content">
-
-            <!-- 2332506/interest_19_impression_pixel_1/interest_19_impression_pixel_1 -->
-            <div data-fuse="21878348251"></div>
-              </div>
-    </div>
-    <div id="block-eyeota-tags-home-eyeota-tag" class="block block-eyeota-tags">
-
-
-      <div class="content">
-        <script type="text/javascript" async defer src="https://ps.eyeota.net/pixel?pid=muoi0ru&t=ajs&sid=interest"></script>  </div>
-    </div>
-    <div id="block-eyeota-tags-saving-eyeota-tag" class="block block-eyeota-tags">
-
-
-      <div class="content">
-        <script type="text/javascript" async defer src="https://ps.eyeota.net/pixel?pid=muoi0ru&t=ajs&sid=interest&cat=saving"></script>  </div>
-    </div>
-    <div id="block-press-patron-presspatron-donation-campaign" class="block block-press-patron">
-
-
-      <div class="content">
-        <div id="pp-donation-campaign-wrapper" class="rose">
-      <div id="pp-close-button" class="pp-donation-close"></div>
-      <p> Your access to our unique content is free - always has been. But ad revenues are diving so we need your direct support.</p>
-      <p>
-        <a href="https://dashboard.presspatron.com/donations/new?frame=1&t=otsLiLFCX82yC86Cnz4DiJa6" id="pp-donation-campaign-button" class="has-button-styles">Become a supporter</a>
-      </p>
-      <p>
-        <a id="pp-close-link" class="pp-donation-close">Thanks, I'm already a supporter.</a>
-      </p>
-    </div>
-      </div>
-    </div>
-      </div>
-              </div>
-            </div>
-
-            <div id="sidebar-wrapper">
-              <div id="sidebar">
-                  <div class="region region-sidebar">
-        <div id="block-in-this-section-0" class="block block-in-this-section">
-
-        <h2>In this section</h2>
-
-      <div class="content">
-        <ul class="menu"><li class="first leaf"><a href="/saving/e-saver-online">E-saver accounts</a></li>
-    <li class="leaf active-trail"><a href="/saving/call-account" class="active-trail active">Savings accounts</a></li>
-    <li class="leaf"><a href="/saving/bonus-savings-accounts">Bonus Savings Accounts</a></li>
-    #039;s Accounts</a></li>
-    <li class="leaf"><a href="/saving/children-youth-student">Children&
-    <li class="leaf"><a href="/saving/business-savings-accounts">Business Savings </a></li>
-    <li class="leaf"><a href="/saving/term-deposits-1-to-9-months">Term deposits &lt; 1 year</a></li>
-    <li class="leaf"><a href="/saving/term-deposits-1-to-5-years">Term deposits 1 to 5 years</a></li>
-    <li class="leaf"><a href="/saving/cash-pie">Cash PIEs</a></li>
-    <li class="leaf"><a href="/saving/term-pie">Term PIEs</a></li>
-    <li class="leaf"><a href="/bonds-data/issues">Moneymarket</a></li>
-    <li class="collapsed"><a href="/saving/account-fees/standard-cheque-account-fees">Account fees</a></li>
-    <li class="leaf"><a href="/credit-ratings-explained">Credit ratings explained</a></li>
-    <li class="leaf"><a href="/saving/interest-codes">Interest codes</a></li>
-    <li class="leaf"><a href="/saving/market-platform" title="">Private investments</a></li>
-    <li class="leaf"><a href="/saving/international-investors-faqs">International investors</a></li>
-    <li class="leaf"><a href="/saving/deep-freeze-list">Deep Freeze</a></li>
-    <li class="leaf"><a href="/saving/bank-leverage">Bank leverage</a></li>
-    <li class="last leaf"><a href="/news/emails-newsletters-sign-up" title="">Sign up for emails</a></li>
-    </ul>  </div>
-    </div>
-    <div id="block-dfp-setup-19-interest-19-pos1-mrec" class="block block-dfp-setup-19">
-
-
-      <div class="content">
-        <!-- 2332506/interest_19_POS1_MREC/interest_19_POS1_MREC -->
-            <div data-fuse="21850843986"></div>  </div>
-    </div>
-    <div id="block-dfp-setup-19-interest-19-pos2-mrec" class="block block-dfp-setup-19">
-
-
-      <div class="content">
-        <!-- 2332506/interest_19_POS2_MREC/interest_19_POS2_MREC -->
-            <div data-fuse="21850843992"></div>  </div>
-    </div>
-      </div>
-              </div>
-            </div>
-
-          </div> <!-- /#main-content-container -->
-
-        </div> <!-- /#content -->
-
-      </div> <!-- /#page -->
-    </div> <!-- /#page-wrapper -->  <script type="text/javascript" src="https://www.interest.co.nz/sites/default/files/js/js_buXG3r8iLS7RFtegCzOFRGoTUMN5W9EhHmNhO62eVts.js"></script>
-      <div id="burger-nav">
-        <div class="gcse-wrapper">
-
-      <script>
-        (function() {
-          var cx = '013234808727065659026:_n8ackc_blq';
-          var gcse = document.createElement('script');
-          gcse.type = 'text/javascript';
-          gcse.async = true;
-          gcse.src = 'https://cse.google.com/cse.js?cx=' + cx;
-          var s = document.getElementsByTagName('script')[0];
-          s.parentNode.insertBefore(gcse, s);
-        })();
-      </script>
-      <gcse:search></gcse:search>
-          </div>
-        <div id="burger-close"></div>
-    <div class="clearfix"></div>
-    <div id="burger-container">
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/home">Home </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-0"> > </a>
-          </div>
-        <div id="burger-child-0" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/podcasts"  > Podcast - subscribe here </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/news">News </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-1"> > </a>
-          </div>
-        <div id="burger-child-1" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/economic-calendar"  > Economic calendar </a>
-              <a class="burger-child-link white-font" href="/news/2020-economic-rescue-package"  > The crisis rescue package tally </a>
-              <a class="burger-child-link white-font" href="/news/82573/reserve-bank-lays-out-detail-how-it-reviews-our-monetary-policy-settings-and-processes"  > How the OCR is set </a>
-              <a class="burger-child-link white-font" href="/category/tag/tppa"  > TPPA explainer series </a>
-              <a class="burger-child-link white-font" href="/saving/bank-financial-comparator"  > Key bank metrics </a>
-              <a class="burger-child-link white-font" href="/news/105115/budget-202021-summary-all-spending-plans"  > Budget 2020/21 - Spending plan </a>
-              <a class="burger-child-link white-font" href="/news/105190/budget-2020-summary-all-tax-collections"  > Budget 2020/21 - Tax revenue </a>
-              <a class="burger-child-link white-font" href="/news/102724/we-update-nations-economic-benchmarks-second-time-one-after-year-delivery-overall-there"  > New Govt. benchmarks </a>
-              <a class="burger-child-link white-font" href="/opinion/94342/media-world-changing-challenging-readers-who-expect independent-news-data-and-comment"  > Become a Supporter </a>
-              <a class="burger-child-link white-font" href="/podcasts"  > Podcast - subscribe here </a>
-              <a class="burger-child-link white-font" href="https://www.interest.co.nz/gdp-live" target="_blank" > GDP Live </a>
-              <a class="burger-child-link white-font" href="/news/emails-newsletters-sign-up"  > Sign up for our free newsletters </a>
-              <a class="burger-child-link white-font" href="/paid-newsletter/37138"  > Banking newsletter subscription </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/property">Property </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-2"> > </a>
-          </div>
-        <div id="burger-child-2" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/property/residential-auction-results"  > Residential auction results </a>
-              <a class="burger-child-link white-font" href="/property/commercial-property-sales"  > Commercial property sales </a>
-              <a class="burger-child-link white-font" href="/property/rural-farm-property-sales"  > Farms sold </a>
-              <a class="burger-child-link white-font" href="/property/90395/we-release-new-set-visualisations-showing-how-seven-our-cities-have-grown-over-time"  > 'Sprawl' visualisations </a>
-              <a class="burger-child-link white-font" href="https://www.interest.co.nz/property/105655/house-prices-bottom-end-market-have-declined-73-their-march-peak-while-mortgage" target="_blank" > Home loan affordability </a>
-              <a class="burger-child-link white-font" href="/property/house-price-income-multiples"  > Median multiples </a>
-              <a class="burger-child-link white-font" href="/calculators/mortgage-calculator"  > Mortgage calculator </a>
-              <a class="burger-child-link white-font" href="/calculators/mortgage-break-fee-estimator"  > Break fee calculator </a>
-              <a class="burger-child-link white-font" href="/saving/rental-yield-indicator"  > Rental yield indicator </a>
-              <a class="burger-child-link white-font" href="/property/rent-ratio"  > Rent ratio </a>
-              <a class="burger-child-link white-font" href="/property/commercial-property-for-sale"  > Commercial property for sale </a>
-              <a class="burger-child-link white-font" href="/property/lifestyle-blocks"  > Lifestyle blocks for sale </a>
-              <a class="burger-child-link white-font" href="https://www.interest.co.nz/news/emails-newsletters-sign-up" target="_blank" > Sign up for our free Property newsletter </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/borrowing">Borrowing </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-3"> > </a>
-          </div>
-        <div id="burger-child-3" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/borrowing"  > Mortgage rates </a>
-              <a class="burger-child-link white-font" href="/calculators/mortgage-calculator"  > - Mortgage calculator </a>
-              <a class="burger-child-link white-font" href="/calculators/mortgage-break-fee-estimator"  > - Break fee calculator </a>
-              <a class="burger-child-link white-font" href="/personal-finance/101570/moneyhubs-christopher-walsh-digs-deep-reverse-mortgages-what-they-are-their"  > Reverse mortgage FAQ </a>
-              <a class="burger-child-link white-font" href="/borrowing/revolving-credit"  > Revolving credit </a>
-              <a class="burger-child-link white-font" href="/borrowing/car-loan"  > Car loans </a>
-              <a class="burger-child-link white-font" href="/borrowing/credit-cards"  > Credit cards </a>
-              <a class="burger-child-link white-font" href="/borrowing/personal-loan"  > Personal loans </a>
-              <a class="burger-child-link white-font" href="/borrowing/business-base-rates"  > Business loan rates </a>
-              <a class="burger-child-link white-font" href="/calculators/55377/should-you-fix-or-stay-floating"  > Fix or Float calculator </a>
-              <a class="burger-child-link white-font" href="/property/rent-or-buy"  > Rent or Buy ? </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/saving/term-deposits-1-to-5-years">Saving </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-4"> > </a>
-          </div>
-        <div id="burger-child-4" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/saving/call-account"  > Savings accounts </a>
-              <a class="burger-child-link white-font" href="/saving/bonus-savings-accounts"  > Bonus savings accounts </a>
-              <a class="burger-child-link white-font" href="/saving/term-deposits-1-to-9-months"  > Term deposits < 1 yr </a>
-              <a class="burger-child-link white-font" href="/saving/term-deposits-1-to-5-years"  > Term deposits 1 - 5 years </a>
-              <a class="burger-child-link white-font" href="/saving/term-pie"  > Term PIEs </a>
-              <a class="burger-child-link white-font" href="/calculators/deposit-calculator"  > Deposit calculator </a>
-              <a class="burger-child-link white-font" href="/saving/interest-codes"  > Interest codes </a>
-              <a class="burger-child-link white-font" href="/credit-ratings-explained"  > Credit ratings explained </a>
-              <a class="burger-child-link white-font" href="/saving/market-platform"  > Private market </a>
-              <a class="burger-child-link white-font" href="/saving/bank-leverage"  > Bank leverage </a>
-              <a class="burger-child-link white-font" href="/saving/deep-freeze-list"  > Deep Freeze list </a>
-              <a class="burger-child-link white-font" href="/saving/porridge-list"  > Porridge list </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/kiwisaver">Kiwisaver </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-5"> > </a>
-          </div>
-        <div id="burger-child-5" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/kiwisaver/funds"  > Find your fund </a>
-              <a class="burger-child-link white-font" href="/kiwisaver/fund-comparison-table"  > Compare fund categories </a>
-              <a class="burger-child-link white-font" href="/kiwisaver/calculators"  > Calculators </a>
-              <a class="burger-child-link white-font" href="/kiwisaver"  > KiwiSaver news </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/banking">Banking </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-6"> > </a>
-          </div>
-        <div id="burger-child-6" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/saving/bank-leverage"  > Bank leverage </a>
-              <a class="burger-child-link white-font" href="/credit-ratings-explained"  > Credit ratings explained </a>
-              <a class="burger-child-link white-font" href="/saving/bank-financial-comparator"  > Key bank metrics </a>
-              <a class="burger-child-link white-font" href="/news/82573/reserve-bank-lays-out-detail-how-it-reviews-our-monetary-policy-settings-and-processes"  > How the OCR is set </a>
-              <a class="burger-child-link white-font" href="/opinion/77033/overview-functions-money-and-how-money-and-credit-are-created-nz-economy-examining"  > How money is created </a>
-              <a class="burger-child-link white-font" href="/bonds/64411/if-bank-failed-and-open-bank-resolution-policy-was-implemented-how-would-it-affect-bank"  > How OBR will work </a>
-              <a class="burger-child-link white-font" href="https://www.rbnz.govt.nz/monetary-policy/unconventional-monetary-policy" target="_blank" > About unconventional monetary policy </a>
-              <a class="burger-child-link white-font" href="/borrowing"  > Mortgage interest rates </a>
-              <a class="burger-child-link white-font" href="/saving/term-deposits-1-to-5-years"  > Term deposit interest rates </a>
-              <a class="burger-child-link white-font" href="/category/topic/little-book-scams"  > Scams - how to protect yourself </a>
-              <a class="burger-child-link white-font" href="/paid-newsletter/37138"  > Subscribe to industry newsletter </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/insurance">Insurance </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-7"> > </a>
-          </div>
-        <div id="burger-child-7" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/insurance-data/car-insurance-compared-january-2018"  > Car insurance - 2018 </a>
-              <a class="burger-child-link white-font" href="/category/tag/house-insurance"  > House cover </a>
-              <a class="burger-child-link white-font" href="/category/tag/climate-change"  > Climate change </a>
-              <a class="burger-child-link white-font" href="http://www.icnz.org.nz/statistics-data/industry-data/" target="_blank" > Industry stats </a>
-              <a class="burger-child-link white-font" href="/users/andrew-hooker"  > Andrew Hooker columns </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/personal-finance">Personal </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-8"> > </a>
-          </div>
-        <div id="burger-child-8" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/borrowing"  > Mortgage interest rates </a>
-              <a class="burger-child-link white-font" href="/personal-finance/101570/moneyhubs-christopher-walsh-digs-deep-reverse-mortgages-what-they-are-their"  > Reverse mortgages </a>
-              <a class="burger-child-link white-font" href="/saving/term-deposits-1-to-5-years"  > Term deposit interest rates </a>
-              <a class="burger-child-link white-font" href="/category/tag/credit-cards"  > Credit cards </a>
-              <a class="burger-child-link white-font" href="/calculators"  > Calculators </a>
-              <a class="burger-child-link white-font" href="/saving/market-platform"  > Private investments </a>
-              <a class="burger-child-link white-font" href="/kiwisaver"  > KiwiSaver </a>
-              <a class="burger-child-link white-font" href="/saving/gold-spot"  > Gold & silver prices </a>
-              <a class="burger-child-link white-font" href="/saving/gold-coins"  > - Gold coin prices </a>
-              <a class="burger-child-link white-font" href="/saving/gold-bars"  > - Gold bar prices </a>
-              <a class="burger-child-link white-font" href="/saving/scrap-metals"  > - Precious metal scrap prices </a>
-              <a class="burger-child-link white-font" href="/category/topic/little-book-scams"  > Protection from scams </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/rural">Rural </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-9"> > </a>
-          </div>
-        <div id="burger-child-9" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/rural/beef/bull-m2"  > Bull prices </a>
-              <a class="burger-child-link white-font" href="/rural/beef/steer-p2"  > Steer & heifer prices </a>
-              <a class="burger-child-link white-font" href="/rural/beef/heifer-localtrade"  > Beef local trade prices </a>
-              <a class="burger-child-link white-font" href="/rural/beef/cow-prime"  > Cow prices </a>
-              <a class="burger-child-link white-font" href="/rural/sheep/lamb-y"  > Lamb prices </a>
-              <a class="burger-child-link white-font" href="/rural/sheep/lamb-localtrade"  > Local trade lamb prices </a>
-              <a class="burger-child-link white-font" href="/rural/sheep/wool"  > Wool prices </a>
-              <a class="burger-child-link white-font" href="/rural-data/dairy-industry-payout-history"  > Dairy payout history </a>
-              <a class="burger-child-link white-font" href="/rural/logs"  > Logs </a>
-              <a class="burger-child-link white-font" href="/rural-news/farms-for-sale"  > Farms for sale </a>
-              <a class="burger-child-link white-font" href="/rural"  > All other rural links to data </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/currencies">Currencies </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-10"> > </a>
-          </div>
-        <div id="burger-child-10" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/currencies/buying-foreign-currency"  > Live rates for buying fx </a>
-              <a class="burger-child-link white-font" href="/currencies/selling-foreign-currency-transfers"  > Live rates to sell TT fx </a>
-              <a class="burger-child-link white-font" href="/currencies/currency-conversion-fees"  > Currency fees </a>
-              <a class="burger-child-link white-font" href="/currencies/rate-pricing"  > Rate pricing </a>
-              <a class="burger-child-link white-font" href="/currencies/spot-rates"  > Spot transactions </a>
-              <a class="burger-child-link white-font" href="/currencies/forward-rates"  > Forward transactions </a>
-              <a class="burger-child-link white-font" href="/currencies/how-currency-swaps-work"  > Currency swaps </a>
-              <a class="burger-child-link white-font" href="/currencies/how-to-do-currency-deals-with-hifx"  > How to do currency deals </a>
-              <a class="burger-child-link white-font" href="/currencies/currency-directory"  > Directory - where to buy/sell </a>
-              <a class="burger-child-link white-font" href="/currencies/subscribe_to_newsletter"  > Daily fx rate sheet email </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/charts">Charts </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-11"> > </a>
-          </div>
-        <div id="burger-child-11" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/charts/commodities"  > Commodities </a>
-              <a class="burger-child-link white-font" href="/charts/confidence"  > Confidence </a>
-              <a class="burger-child-link white-font" href="/charts/credit"  > Debt (Credit) </a>
-              <a class="burger-child-link white-font" href="/charts/economy"  > Economy </a>
-              <a class="burger-child-link white-font" href="/charts/exchange rates"  > Exchange rates </a>
-              <a class="burger-child-link white-font" href="/charts/interest rates"  > Interest rates </a>
-              <a class="burger-child-link white-font" href="/charts/population"  > Population </a>
-              <a class="burger-child-link white-font" href="/charts/prices"  > Prices </a>
-              <a class="burger-child-link white-font" href="/charts/real estate"  > Real estate </a>
-              <a class="burger-child-link white-font" href="/charts/rural"  > Rural </a>
-              <a class="burger-child-link white-font" href="/charts"  > Full list of all charts </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/calculators">Calculators </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-12"> > </a>
-          </div>
-        <div id="burger-child-12" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/calculators/deposit-calculator"  > Deposit calculator </a>
-              <a class="burger-child-link white-font" href="/calculators/mortgage-calculator"  > Mortgage calculator </a>
-              <a class="burger-child-link white-font" href="/calculators/borrowing-capacity-calculator"  > How much can you bid? </a>
-              <a class="burger-child-link white-font" href="/calculators/full-function-mortgage-calculator"  > Full-function mortgage calculator </a>
-              <a class="burger-child-link white-font" href="/calculators/lvr-borrowing-capacity-calculator"  > LVR borrowing capacity </a>
-              <a class="burger-child-link white-font" href="/calculators/property-upsize-downsize-calculator"  > Property upsize/downsize </a>
-              <a class="burger-child-link white-font" href="/calculators/principal-payback-milestone-calculator"  > Principal payback milestone </a>
-              <a class="burger-child-link white-font" href="/calculators/mortgage-break-fee-estimator"  > Break fee calculator </a>
-              <a class="burger-child-link white-font" href="/calculators/55377/should-you-fix-or-stay-floating"  > Fix or float calculator </a>
-              <a class="burger-child-link white-font" href="/calculators/credit-card-minimum-payments"  > Credit card real cost </a>
-              <a class="burger-child-link white-font" href="/calculators/cost-of-credit-calculator"  > Real cost of debt </a>
-              <a class="burger-child-link white-font" href="/calculators/retirement-calculator"  > Retirement calculator </a>
-              <a class="burger-child-link white-font" href="/calculators/foreign-currency-calculator"  > Buying foreign currency </a>
-              <a class="burger-child-link white-font" href="/calculators"  > All our calculators </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/bonds">Bonds </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-13"> > </a>
-          </div>
-        <div id="burger-child-13" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/bonds-data/issues"  > Current prices </a>
-              <a class="burger-child-link white-font" href="/bonds/how-to-read-these-pages"  > How to use our bonds resource </a>
-              <a class="burger-child-link white-font" href="/bonds/how-to-buy-bonds"  > How to buy bonds </a>
-              <a class="burger-child-link white-font" href="/bonds/bond-types"  > Bond types </a>
-              <a class="burger-child-link white-font" href="/bonds/glossary"  > Glossary </a>
-              <a class="burger-child-link white-font" href="/charts/interest-rates/government-bond-rates"  > NZ Govt bond rates </a>
-              <a class="burger-child-link white-font" href="/charts/interest-rates/us-treasures"  > US Treasury bond rates </a>
-          </div>
-        <div class="burger-parent-wrapper">
-        <a class="burger-parent-link white-font" href="/business">Business </a>
-            <a class="burger-parent-ct white-font" id="burger-parent-14"> > </a>
-          </div>
-        <div id="burger-child-14" class="burger-child-wrapper" >
-        <div class="burger-child-back white-font"> back </div>
-              <a class="burger-child-link white-font" href="/borrowing/business-base-rates"  > Business borrowing rates </a>
-              <a class="burger-child-link white-font" href="/understanding-china"  > Understanding China </a>
-              <a class="burger-child-link white-font" href="/understanding-china"  > - by Professor Ang and guests </a>
-              <a class="burger-child-link white-font" href="/category/tag/tppa"  > TPPA explainer series </a>
-              <a class="burger-child-link white-font" href="/business/how-to-guides"  > How to guides: </a>
-              <a class="burger-child-link white-font" href="/business/60438/we-are-starting-new-13-part-guide-small-business-managers-who-want-achieve-financial"  > - Achieving financial success </a>
-              <a class="burger-child-link white-font" href="/business/60243/first-ten-part-guide-series-how-tackle-often-complex-challenges-companies-face-when"  > - The realities of growth </a>
-              <a class="burger-child-link white-font" href="/category/tag/success-stories"  > Success stories </a>
-              <a class="burger-child-link white-font" href="https://www.interest.co.nz/gdp-live" target="_blank" > GDP Live </a>
-          </div>
-      </div>
-      </div>
-
-      <footer>
-        <div id = "footer-wrapper">
-          <div id="footer-logo"><a href="/"></a></div>
-          <div id="footer-links-1">
-            <a href="/about-us">About</a>
-            <a href="/feedback">Contact us</a>
-          </div>
-          <div id="footer-links-2">
-            <a href="/about-us">About</a>
-            <a href="/feedback">Contact us</a>
-            <a href="/sitemap">Sitemap</a>
-            <a href="/terms-conditions">Terms and Conditions</a>
-            <a href="/privacy">Privacy</a>
-            <a href="/advertise">Advertise</a>
-          </div>
-          <div id="copyright" class="white-font">
-            <span>&copy; 2020 interest.co.nz</span>
-            <span id="calculate-partnership"><a href="https://www.interest.co.nz">interest.co.nz</a> is partnered with <a target="_blank" href="https://www.calculate.co.nz">Calculate.co.nz</a> for New Zealand's highest quality calculators and analysis.</span>
-          </div>
-        </div>
-      </footer>
-    </body>
-    </html>
-    """
+        return _get_sample_html()
+
+
+@lru_cache(maxsize=None)
+def _get_sample_html():
+    # sample taken at 17/07/2020, only read when first asked for
+    with gzip.open(SAMPLE_HTML_PATH, 'rt', encoding='utf-8') as sample:
+        return sample.read()
@@ -0,0 +1,167 @@
+"""Fetches pages over pooled keep-alive HTTP connections.
+
+@author Adrian Parker
+"""
+
+import gzip
+import http.client
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+
+# result of a fetch; url is that fetched after any redirects, and body is the
+# cached body when not_modified
+FetchResult = namedtuple('FetchResult', ['url', 'status', 'body', 'not_modified'])
+
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+class PageFetcher:
+    """Fetches pages, reusing connections and sending conditional requests.
+
+    Connections are pooled per host and kept alive between fetches. The
+    ETag and Last-Modified validators of each fetched page are remembered so
+    that refetching an unchanged page costs a 304 response, answered from
+    the previously fetched body.
+    """
+
+    def __init__(self, timeout=10, retries=3, backoff=0.5, pool_size=4,
+                 user_agent='RealRatesOfReturn', max_redirects=3):
+        """Creates a fetcher with an empty connection pool.
+
+        Args:
+            timeout: float seconds to wait to connect or read. Default 10.
+            retries: int number of times to retry a failed fetch. Default 3.
+            backoff: float seconds before the first retry, doubling after
+                every retry. Default 0.5.
+            pool_size: int maximum idle connections kept per host. Default 4.
+            user_agent: str sent as the User-Agent header.
+            max_redirects: int number of redirects to follow. Default 3.
+        """
+
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self.user_agent = user_agent
+        self.max_redirects = max_redirects
+        self._pool = {}
+        self._validators = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, url):
+        """Fetches given url, conditionally if it has been fetched before.
+
+        Args:
+            url: str http or https url to fetch
+        Returns:
+            FetchResult
+        Raises:
+            Exception if the page cannot be fetched after all retries, or
+            redirects more than max_redirects times
+        """
+
+        attempt = 0
+        redirects = 0
+        while True:
+            try:
+                return self._fetch_once(url)
+            except _Redirect as redirect:
+                if redirects >= self.max_redirects:
+                    raise Exception('Too many redirects fetching ' + url)
+                redirects += 1
+                url = redirect.location
+                continue
+            except (OSError, http.client.HTTPException, _RetryableStatus) as e:
+                if attempt >= self.retries:
+                    raise Exception('Failed to fetch ' + url) from e
+            time.sleep(self.backoff * (2 ** attempt))
+            attempt += 1
+
+    def close(self):
+        """Closes all pooled connections."""
+        with self._lock:
+            pool, self._pool = self._pool, {}
+        for connections in pool.values():
+            for connection in connections:
+                connection.close()
+
+    def _fetch_once(self, url):
+        parts = urlsplit(url)
+        host = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        headers = {'Accept-Encoding': 'gzip', 'User-Agent': self.user_agent}
+        validators = self._validators.get(url)
+        if validators:
+            etag, last_modified, _ = validators
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        connection = self._acquire(host)
+        try:
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(host, connection)
+        location = response.getheader('Location')
+        if response.status in _REDIRECT_STATUSES and location:
+            raise _Redirect(urljoin(url, location))
+        if response.status == 304 and validators:
+            return FetchResult(url, 304, validators[2], True)
+        if response.status in _RETRY_STATUSES:
+            raise _RetryableStatus(response.status)
+        if response.status != 200:
+            raise Exception('Unexpected status ' + str(response.status) +
+                            ' fetching ' + url)
+        if response.getheader('Content-Encoding', '').lower() == 'gzip':
+            data = gzip.decompress(data)
+        charset = response.headers.get_content_charset() or 'utf-8'
+        body = data.decode(charset, errors='replace')
+        etag = response.getheader('ETag')
+        last_modified = response.getheader('Last-Modified')
+        if etag or last_modified:
+            self._validators[url] = (etag, last_modified, body)
+        return FetchResult(url, 200, body, False)
+
+    def _acquire(self, host):
+        with self._lock:
+            connections = self._pool.get(host)
+            if connections:
+                return connections.pop()
+        scheme, netloc = host
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        if scheme == 'http':
+            return http.client.HTTPConnection(netloc, timeout=self.timeout)
+        raise Exception('Unsupported url scheme: ' + scheme)
+
+    def _release(self, host, connection):
+        with self._lock:
+            connections = self._pool.setdefault(host, [])
+            if len(connections) < self.pool_size:
+                connections.append(connection)
+                return
+        connection.close()
+
+
+class _RetryableStatus(Exception):
+    pass
+
+
+class _Redirect(Exception):
+
+    def __init__(self, location):
+        super().__init__(location)
+        self.location = location
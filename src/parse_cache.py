@@ -0,0 +1,100 @@
+"""Bounded LRU cache of parsed call account rows, keyed by html digest.
+
+@author Adrian Parker
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+
+class ParseCache:
+    """Least recently used cache of account rows parsed from html.
+
+    Rows are stored as tuples of tuples, so results handed back from the
+    cache cannot be mutated by callers. Entries are evicted, least recently
+    used first, once either max_entries or max_bytes would be exceeded.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=16 * 1024 * 1024):
+        """Creates an empty cache.
+
+        Args:
+            max_entries: int maximum number of pages to cache. Default 128.
+            max_bytes: int maximum estimated size of cached rows. Default 16MiB.
+        Raises:
+            Exception if max_entries or max_bytes is not positive
+        """
+
+        if max_entries <= 0 or max_bytes <= 0:
+            raise Exception('Must provide positive max_entries and max_bytes')
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_rows(self, html, parse):
+        """Provides the rows parsed from given html, parsing only on a miss.
+
+        Args:
+            html: str of html the rows are parsed from
+            parse: function taking html and returning an array of rows
+        Returns:
+            tuple of row tuples
+        """
+
+        key = _digest(html)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        rows = tuple(tuple(row) for row in parse(html))
+        self._put(key, rows)
+        return rows
+
+    def clear(self):
+        """Removes all entries and resets the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _put(self, key, rows):
+        size = _estimate_size(rows)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (rows, size)
+            self.bytes += size
+            while (len(self._entries) > self.max_entries
+                   or self.bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+
+
+def _digest(html):
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+    return hashlib.blake2b(html, digest_size=16).digest()
+
+
+def _estimate_size(rows):
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row:
+            size += sys.getsizeof(value)
+    return size
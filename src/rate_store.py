@@ -0,0 +1,197 @@
+"""Persists snapshots of call accounts in SQLite, for historical lookups.
+
+@author Adrian Parker
+"""
+
+import sqlite3
+from datetime import datetime
+from datetime import timezone
+
+from src.call_account import CallAccount
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    taken_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_taken_at ON snapshots (taken_at);
+CREATE TABLE IF NOT EXISTS rates (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    taken_at TEXT NOT NULL,
+    institution TEXT,
+    credit_rating TEXT,
+    name TEXT,
+    min_deposit REAL,
+    nominal REAL,
+    movement TEXT,
+    institution_type TEXT
+);
+CREATE INDEX IF NOT EXISTS rates_institution_name_taken_at
+    ON rates (institution, name, taken_at);
+CREATE INDEX IF NOT EXISTS rates_snapshot_id ON rates (snapshot_id);
+'''
+
+_ACCOUNT_COLUMNS = ('institution, credit_rating, name, min_deposit, nominal, '
+                    'movement, institution_type')
+
+# fixed width, so timestamps stored as text compare in time order
+_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+
+
+class RateStore:
+    """SQLite store of timestamped call account snapshots.
+
+    Each snapshot is written in bulk in a single transaction. Lookups return
+    CallAccount objects, either as they were at a point in time or over a
+    range of time. Timestamps without a timezone are taken to be UTC.
+    """
+
+    def __init__(self, path=':memory:'):
+        """Opens, creating if need be, the store at given path.
+
+        Args:
+            path: str path of the SQLite database. Default ':memory:'.
+        """
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Closes the underlying database connection."""
+        self._connection.close()
+
+    def write_snapshot(self, accounts, taken_at=None):
+        """Writes given accounts as a snapshot taken at given time.
+
+        Args:
+            accounts: iterable of CallAccount to write
+            taken_at: datetime the snapshot was taken. Defaults to now
+        Returns:
+            int id of the snapshot written
+        """
+
+        stamp = _to_text(taken_at or datetime.now(timezone.utc))
+        with self._connection:
+            snapshot_id = self._connection.execute(
+                'INSERT INTO snapshots (taken_at) VALUES (?)',
+                (stamp,)).lastrowid
+            self._connection.executemany(
+                'INSERT INTO rates (snapshot_id, taken_at, ' + _ACCOUNT_COLUMNS +
+                ') VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                ((snapshot_id, stamp, account.institution,
+                  account.credit_rating, account.name, account.min_deposit,
+                  account.nominal, account.movement, account.institution_type)
+                 for account in accounts))
+        return snapshot_id
+
+    def get_snapshot_times(self, start=None, end=None):
+        """Provides the times snapshots were taken, within an optional range.
+
+        Args:
+            start: datetime, inclusive, to list snapshots from. Default None.
+            end: datetime, inclusive, to list snapshots until. Default None.
+        Returns:
+            array of datetime in time order
+        """
+
+        where, args = _time_range('taken_at', start, end)
+        rows = self._connection.execute(
+            'SELECT taken_at FROM snapshots' + where + ' ORDER BY taken_at, id',
+            args)
+        return [_from_text(row[0]) for row in rows]
+
+    def get_accounts_at(self, taken_at, institution=None, name=None):
+        """Provides the accounts as they were at given point in time.
+
+        Args:
+            taken_at: datetime to look up accounts at
+            institution: str to limit accounts to. Default None, all.
+            name: str account name to limit accounts to. Default None, all.
+        Returns:
+            array of CallAccount from the latest snapshot taken at or before
+            taken_at, empty if there is no such snapshot
+        """
+
+        snapshot = self._connection.execute(
+            'SELECT id, taken_at FROM snapshots WHERE taken_at <= ? '
+            'ORDER BY taken_at DESC, id DESC LIMIT 1',
+            (_to_text(taken_at),)).fetchone()
+        if snapshot is None:
+            return []
+        if institution is None and name is None:
+            rows = self._connection.execute(
+                'SELECT ' + _ACCOUNT_COLUMNS + ' FROM rates '
+                'WHERE snapshot_id = ? ORDER BY rowid', (snapshot[0],))
+        else:
+            where, args = _account_filter(institution, name)
+            rows = self._connection.execute(
+                'SELECT ' + _ACCOUNT_COLUMNS + ' FROM rates WHERE ' + where +
+                ' AND taken_at = ? AND snapshot_id = ? ORDER BY rowid',
+                args + [snapshot[1], snapshot[0]])
+        return [CallAccount(row) for row in rows]
+
+    def get_account_history(self, institution, name=None, start=None, end=None):
+        """Provides the history of an institution's accounts over a range of time.
+
+        Args:
+            institution: str providing the accounts
+            name: str account name to limit history to. Default None, all.
+            start: datetime, inclusive, to look up history from. Default None.
+            end: datetime, inclusive, to look up history until. Default None.
+        Returns:
+            array of (datetime, CallAccount) tuples in time order
+        """
+
+        where, args = _account_filter(institution, name)
+        time_where, time_args = _time_range('taken_at', start, end)
+        if time_where:
+            where += ' AND ' + time_where[len(' WHERE '):]
+        rows = self._connection.execute(
+            'SELECT taken_at, ' + _ACCOUNT_COLUMNS + ' FROM rates WHERE ' +
+            where + ' ORDER BY taken_at, rowid', args + time_args)
+        return [(_from_text(row[0]), CallAccount(row[1:])) for row in rows]
+
+
+def _account_filter(institution, name):
+    clauses = []
+    args = []
+    if institution is not None:
+        clauses.append('institution = ?')
+        args.append(institution)
+    if name is not None:
+        clauses.append('name = ?')
+        args.append(name)
+    return ' AND '.join(clauses), args
+
+
+def _time_range(column, start, end):
+    clauses = []
+    args = []
+    if start is not None:
+        clauses.append(column + ' >= ?')
+        args.append(_to_text(start))
+    if end is not None:
+        clauses.append(column + ' <= ?')
+        args.append(_to_text(end))
+    if not clauses:
+        return '', args
+    return ' WHERE ' + ' AND '.join(clauses), args
+
+
+def _to_text(moment):
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.strftime(_TIMESTAMP_FORMAT)
+
+
+def _from_text(text):
+    return datetime.strptime(text, _TIMESTAMP_FORMAT).replace(
+        tzinfo=timezone.utc)
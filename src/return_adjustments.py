@@ -1,51 +1,235 @@
 """
 A collection of return adjustment calculation functions.
 
+Every function takes a mode, choosing how results are rounded to
+SIGNIFICANT_FIGURES:
+
+    DECIMAL_MODE, the default: exactly, through Decimal in a context local
+        to this module, leaving the global Decimal context untouched
+    FLOAT_MODE: with float arithmetic, using round for scalars and rint
+        for arrays, which is faster, but where a value is within float
+        error of a rounding tie, or of a power of ten, may differ from
+        DECIMAL_MODE in the last figure
+    UNROUNDED_MODE: not at all, the fastest
+
 @author Adrian Parker
 """
 
-from decimal import getcontext
+import math
+from decimal import Context
+from decimal import ROUND_HALF_EVEN
+
+import numpy as np
+
+SIGNIFICANT_FIGURES = 4
+
+DECIMAL_MODE = 'decimal'
+FLOAT_MODE = 'float'
+UNROUNDED_MODE = 'unrounded'
+MODES = (DECIMAL_MODE, FLOAT_MODE, UNROUNDED_MODE)
+
+_CONTEXT = Context(prec=SIGNIFICANT_FIGURES, rounding=ROUND_HALF_EVEN)
 
-getcontext().prec = 4
+# powers of ten up to this are exact floats, so scaling by them is exact
+_MAX_EXACT_POWER = 22
+_EXACT_POWERS = 10.0 ** np.arange(_MAX_EXACT_POWER + 1)
 
+# scaled values this close to a rounding tie may have been misplaced by the
+# scaling, so are rounded as scalars instead
+_TIE_TOLERANCE = 1e-9
 
-def after_tax_return(nominal, tax_rate):
+
+def after_tax_return(nominal, tax_rate, mode=DECIMAL_MODE):
     """Returns after tax return rate for given nominal and tax rate.
 
     Args:
         nominal (float): the nominal rate of return
         tax_rate (float): the tax rate to adjust nominal for
+        mode (str): one of MODES, Default DECIMAL_MODE.
     Returns:
-      float: after tax rate of return, to 4 decimal places
+      float: after tax rate of return, to 4 significant figures
+    Raises:
+        Exception if mode is not recognised
     """
 
-    return float(getcontext().create_decimal_from_float(
-        nominal * (1 - tax_rate)))
+    return _get_rounder(mode)(nominal * (1 - tax_rate))
 
 
-def real_return(after_tax_return, inflation):
+def real_return(after_tax_return, inflation, mode=DECIMAL_MODE):
     """Returns real return for given after tax return and inflation rate.
 
     Args:
         after_tax_return (float): the after tax rate of return
         inflation (float): the inflation rate to adjust by
+        mode (str): one of MODES, Default DECIMAL_MODE.
     Returns:
-        float: real rate of return, to 4 decimal places
+        float: real rate of return, to 4 significant figures
+    Raises:
+        Exception if mode is not recognised
     """
 
     real_rate = ((1 + after_tax_return) / (1 + inflation)) - 1
-    return float(getcontext().create_decimal_from_float(real_rate))
+    return _get_rounder(mode)(real_rate)
 
 
-def real_return_from_nominal(nominal, tax_rate, inflation):
+def real_return_from_nominal(nominal, tax_rate, inflation, mode=DECIMAL_MODE):
     """Returns real return for given nominal rate, tax rate and inflation rate.
 
     Args:
         nominal (float): the nominal rate of return
         tax_rate (float): the tax rate to adjust nominal for
         inflation (float): the inflation rate to adjust by
+        mode (str): one of MODES, Default DECIMAL_MODE.
+    Returns:
+        float: real rate of return, to 4 significant figures
+    Raises:
+        Exception if mode is not recognised
+    """
+
+    return real_return(after_tax_return(nominal, tax_rate, mode), inflation,
+                       mode)
+
+
+def after_tax_returns(nominal, tax_rate, mode=DECIMAL_MODE):
+    """Array version of after_tax_return.
+
+    Args:
+        nominal (array_like): the nominal rates of return
+        tax_rate (array_like): the tax rates to adjust nominal for,
+            broadcast against nominal
+        mode (str): one of MODES, Default DECIMAL_MODE.
+    Returns:
+        numpy.ndarray: after tax rates of return, equal to after_tax_return
+        of each element in DECIMAL_MODE
+    Raises:
+        Exception if mode is not recognised
+    """
+
+    return _round_array(
+        np.multiply(nominal, np.subtract(1, tax_rate, dtype=np.float64)), mode)
+
+
+def real_returns(after_tax_return, inflation, mode=DECIMAL_MODE):
+    """Array version of real_return.
+
+    Args:
+        after_tax_return (array_like): the after tax rates of return
+        inflation (array_like): the inflation rates to adjust by, broadcast
+            against after_tax_return
+        mode (str): one of MODES, Default DECIMAL_MODE.
+    Returns:
+        numpy.ndarray: real rates of return, equal to real_return of each
+        element in DECIMAL_MODE
+    Raises:
+        Exception if mode is not recognised
+    """
+
+    real_rates = np.subtract(
+        np.divide(np.add(1, after_tax_return, dtype=np.float64),
+                  np.add(1, inflation, dtype=np.float64)), 1)
+    return _round_array(real_rates, mode)
+
+
+def real_returns_from_nominal(nominal, tax_rate, inflation, mode=DECIMAL_MODE):
+    """Array version of real_return_from_nominal.
+
+    Args:
+        nominal (array_like): the nominal rates of return
+        tax_rate (array_like): the tax rates to adjust nominal for
+        inflation (array_like): the inflation rates to adjust by
+        mode (str): one of MODES, Default DECIMAL_MODE.
+    Returns:
+        numpy.ndarray: real rates of return, broadcast from all three
+        arguments, equal to real_return_from_nominal of each element in
+        DECIMAL_MODE
+    Raises:
+        Exception if mode is not recognised
+    """
+
+    return real_returns(after_tax_returns(nominal, tax_rate, mode), inflation,
+                        mode)
+
+
+def round_significant(values):
+    """Rounds values as DECIMAL_MODE does, to SIGNIFICANT_FIGURES.
+
+    Each value is scaled by a power of ten, rounded half even to an integer
+    and scaled back, giving the same float as the rounded Decimal. The few
+    values the scaling leaves too close to a tie to be sure of, or too small
+    or large to scale exactly, are rounded through Decimal.
+
+    Args:
+        values (array_like): floats to round
     Returns:
-        float: real rate of return, to 4 decimal places
+        numpy.ndarray: rounded floats, with zeros, infinities and NaN as given
     """
 
-    return real_return(after_tax_return(nominal, tax_rate), inflation)
+    return _round_array(values, DECIMAL_MODE)
+
+
+def _get_rounder(mode):
+    rounder = _ROUNDERS.get(mode)
+    if rounder is None:
+        raise Exception('Unknown rounding mode ' + repr(mode))
+    return rounder
+
+
+def _round_decimal(value):
+    return float(_CONTEXT.create_decimal_from_float(value))
+
+
+def _round_float(value):
+    if value == 0 or not math.isfinite(value):
+        return value
+    return round(value,
+                 SIGNIFICANT_FIGURES - 1 - math.floor(math.log10(abs(value))))
+
+
+def _unrounded(value):
+    return value
+
+
+_ROUNDERS = {DECIMAL_MODE: _round_decimal, FLOAT_MODE: _round_float,
+             UNROUNDED_MODE: _unrounded}
+
+
+def _round_array(values, mode):
+    _get_rounder(mode)
+    values = np.asarray(values, dtype=np.float64)
+    if mode == UNROUNDED_MODE:
+        return values
+    shape = values.shape
+    values = values.reshape(-1)
+    magnitude = np.abs(values)
+    finite = np.isfinite(magnitude) & (magnitude != 0)
+    all_finite = finite.all()
+    given = values
+    if not all_finite:
+        values = np.where(finite, values, 1.0)
+        magnitude = np.abs(values)
+    exponent = np.floor(np.log10(magnitude)).astype(np.intp)
+    places = SIGNIFICANT_FIGURES - 1 - exponent
+    # exact powers of ten, one of which is 1, so each step rounds only once
+    up = _EXACT_POWERS[np.clip(places, 0, _MAX_EXACT_POWER)]
+    down = _EXACT_POWERS[np.clip(-places, 0, _MAX_EXACT_POWER)]
+    scaled = values * up / down
+    rounded = np.rint(scaled)
+    result = rounded / up * down
+    if not all_finite:
+        result = np.where(finite, result, given)
+    uncertain = np.abs(places) > _MAX_EXACT_POWER
+    if mode == DECIMAL_MODE:
+        # log10 may be out by one close to powers of ten, leaving too many
+        # or too few figures before the point
+        scaled_magnitude = np.abs(scaled)
+        uncertain |= (
+            (np.abs(np.abs(scaled - rounded) - 0.5) < _TIE_TOLERANCE)
+            | (scaled_magnitude < _EXACT_POWERS[SIGNIFICANT_FIGURES - 1])
+            | (scaled_magnitude >= _EXACT_POWERS[SIGNIFICANT_FIGURES]))
+    if not all_finite:
+        uncertain &= finite
+    if uncertain.any():
+        rounder = _ROUNDERS[mode]
+        result[uncertain] = [rounder(value)
+                             for value in given[uncertain].tolist()]
+    return result.reshape(shape)
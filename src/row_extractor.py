@@ -0,0 +1,186 @@
+"""Extracts call account rows from html in a single streaming pass.
+
+@author Adrian Parker
+"""
+
+from html.parser import HTMLParser
+
+from src.call_account import INDICATOR_MOVEMENTS
+
+
+class CallAccountRowExtractor(HTMLParser):
+    """Event driven extractor of call account rows.
+
+    Emits the same [institution, credit_rating, name, min_deposit, nominal,
+    movement, institution_type] rows as data_provider._get_accounts, and the
+    same institution names as data_provider._get_institution_names, without
+    building a document tree. Rows are appended as each one is completed, so
+    may be taken between calls to feed.
+    """
+
+    def __init__(self, row_factory=None):
+        """Creates an extractor.
+
+        Args:
+            row_factory: function called with institution, credit_rating,
+                name, min_deposit, nominal, movement and institution_type to
+                create each row, such as CallAccount.from_fields. Default
+                None, making lists
+        """
+
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self._row_factory = row_factory or _new_row
+        self.institutions = []
+        self._institution = None
+        self._in_row = False
+        self._primary_row = False
+        self._cells = []
+        self._cell = None
+        self._anchor = None
+        self._anchor_done = False
+        # text of a cell's first b tag, up to its first child tag, collected
+        # while _in_b, as feed may split it across handle_data calls
+        self._in_b = False
+        self._b_text = None
+        self._movement = None
+        self._institution_type = None
+        self._section_title = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'h2' and 'pane-title' in (dict(attrs).get('class') or '').split():
+            self._section_title = []
+        elif tag == 'tr':
+            if self._in_row:
+                self._end_row()
+            self._start_row(attrs)
+        elif not self._in_row:
+            return
+        elif tag == 'td':
+            if self._cell is not None:
+                self._end_cell()
+            self._cell = []
+            self._in_b = False
+            self._b_text = None
+            self._movement = None
+        elif tag == 'a':
+            if self._primary_row and not self._anchor_done and self._anchor is None:
+                self._anchor = {'text': [], 'alt': None}
+        elif tag == 'img':
+            if self._anchor is not None and self._anchor['alt'] is None:
+                self._anchor['alt'] = dict(attrs).get('alt')
+            if self._cell is not None and self._movement is None:
+                self._movement = _get_movement(attrs)
+        elif tag == 'b':
+            if self._cell is not None and self._b_text is None:
+                self._in_b = True
+                self._b_text = []
+                return
+        self._in_b = False
+
+    def handle_endtag(self, tag):
+        if tag == 'h2' and self._section_title is not None:
+            self._institution_type = ''.join(self._section_title).strip()
+            self._section_title = None
+        if not self._in_row:
+            return
+        if tag == 'tr':
+            self._end_row()
+        elif tag == 'td':
+            if self._cell is not None:
+                self._end_cell()
+        elif tag == 'a':
+            if self._anchor is not None:
+                self._end_anchor()
+        elif tag == 'b':
+            self._in_b = False
+
+    def handle_data(self, data):
+        if self._section_title is not None:
+            self._section_title.append(data)
+        if not self._in_row:
+            return
+        if self._anchor is not None:
+            self._anchor['text'].append(data)
+        if self._cell is not None:
+            self._cell.append(data)
+            if self._in_b:
+                self._b_text.append(data)
+
+    def close(self):
+        super().close()
+        if self._in_row:
+            self._end_row()
+
+    def _start_row(self, attrs):
+        self._in_row = True
+        classes = (dict(attrs).get('class') or '').split()
+        self._primary_row = 'primary_row' in classes
+        self._cells = []
+        self._cell = None
+        self._anchor = None
+        self._anchor_done = False
+
+    def _end_cell(self):
+        text = ''.join(self._cell) if self._cell else None
+        self._cells.append((text, self._b_text, self._movement))
+        self._cell = None
+        self._in_b = False
+        self._b_text = None
+        self._movement = None
+
+    def _end_anchor(self):
+        anchor = self._anchor
+        self._anchor = None
+        self._anchor_done = True
+        institution = anchor['alt'] if anchor['alt'] else ''.join(anchor['text'])
+        self._institution = institution.rstrip(' ')
+        self.institutions.append(self._institution)
+
+    def _end_row(self):
+        if self._cell is not None:
+            self._end_cell()
+        if self._anchor is not None:
+            self._end_anchor()
+        self._in_row = False
+        self._primary_row = False
+        if len(self._cells) == 5:
+            cells = self._cells
+            nominal_text, b_text, movement = cells[4]
+            nominal = ''.join(b_text) if b_text else nominal_text
+            self.rows.append(self._row_factory(
+                self._institution,
+                cells[1][0],
+                cells[2][0],
+                float(cells[3][0].replace('$', '').replace(',', '')),
+                float(nominal),
+                movement,
+                self._institution_type))
+        self._cells = []
+
+
+def extract_account_rows(html):
+    """Extracts call account rows from given html in a single pass.
+
+    Args:
+        html: str of html to extract call account rows from
+    Returns:
+        array of [institution, credit_rating, name, min_deposit, nominal,
+        movement, institution_type]
+    """
+
+    extractor = CallAccountRowExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.rows
+
+
+def _get_movement(attrs):
+    for img_class in (dict(attrs).get('class') or '').split():
+        if img_class in INDICATOR_MOVEMENTS:
+            return INDICATOR_MOVEMENTS[img_class]
+    return None
+
+
+def _new_row(*fields):
+    return list(fields)
@@ -0,0 +1,174 @@
+"""Real returns of every account under every tax rate and inflation scenario.
+
+@author Adrian Parker
+"""
+
+import numpy as np
+
+from src.return_adjustments import DECIMAL_MODE
+from src.return_adjustments import real_returns_from_nominal
+
+# New Zealand RWT and PIR rates: 10.5%, 17.5%, 30%, 33%, 39% and the 28% PIE
+# rate
+NZ_TAX_RATES = (0.105, 0.175, 0.30, 0.33, 0.39, 0.28)
+
+# axes of the grid
+ACCOUNT_AXIS = 0
+TAX_AXIS = 1
+INFLATION_AXIS = 2
+
+# approximate size of the block of the grid computed at a time
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+
+# bytes of the temporary arrays rounding needs per grid value
+_BYTES_PER_VALUE = 8 * 8
+
+
+class ScenarioGrid:
+    """Real after tax returns of accounts, tax rates and inflation rates.
+
+    The grid is a float64 array of shape (accounts, tax rates, inflation
+    rates), indexed by ACCOUNT_AXIS, TAX_AXIS and INFLATION_AXIS, each value
+    being return_adjustments.real_returns_from_nominal of the account's
+    nominal rate, as a fraction. It is computed by broadcasting, one block
+    of accounts at a time, so only blocks of about chunk_bytes are ever
+    held besides the result. real_returns allocates the whole grid once;
+    iter_chunks, reduce and argmax stream blocks for grids that do not fit
+    in memory.
+
+    Filter accounts first, such as with account_query.Accounts.for_deposit,
+    to grid only those accommodating a deposit.
+    """
+
+    def __init__(self, accounts, inflations, tax_rates=NZ_TAX_RATES,
+                 mode=DECIMAL_MODE, chunk_bytes=DEFAULT_CHUNK_BYTES):
+        """Creates a grid, without computing it.
+
+        Args:
+            accounts: iterable of accounts, read once
+            inflations: sequence of float inflation rates
+            tax_rates: sequence of float tax rates. Default NZ_TAX_RATES
+            mode: return_adjustments mode to round with. Default DECIMAL_MODE
+            chunk_bytes: int approximate bytes of working memory per block.
+                Default DEFAULT_CHUNK_BYTES
+        """
+
+        self.accounts = list(accounts)
+        self.nominals = np.array([account.nominal for account in self.accounts],
+                                 dtype=np.float64) / 100
+        self.tax_rates = np.array(tax_rates, dtype=np.float64)
+        self.inflations = np.array(inflations, dtype=np.float64)
+        self.mode = mode
+        cell_bytes = _BYTES_PER_VALUE * len(self.tax_rates) * len(self.inflations)
+        self.chunk_accounts = max(1, chunk_bytes // max(1, cell_bytes))
+
+    @property
+    def shape(self):
+        """tuple of (accounts, tax rates, inflation rates)."""
+        return (len(self.nominals), len(self.tax_rates), len(self.inflations))
+
+    def real_returns(self):
+        """Provides the whole grid.
+
+        Returns:
+            numpy.ndarray of shape self.shape, allocated once
+        """
+
+        grid = np.empty(self.shape, dtype=np.float64)
+        for start, block in self.iter_chunks():
+            grid[start:start + len(block)] = block
+        return grid
+
+    def iter_chunks(self):
+        """Generates the grid one block of accounts at a time.
+
+        Yields:
+            (int index of the block's first account, numpy.ndarray of shape
+            (accounts in block, tax rates, inflation rates)) tuples, in
+            account order
+        """
+
+        tax_rates = self.tax_rates[np.newaxis, :, np.newaxis]
+        inflations = self.inflations[np.newaxis, np.newaxis, :]
+        for start in range(0, len(self.nominals), self.chunk_accounts):
+            nominals = self.nominals[start:start + self.chunk_accounts]
+            yield start, real_returns_from_nominal(
+                nominals[:, np.newaxis, np.newaxis], tax_rates, inflations,
+                self.mode)
+
+    def reduce(self, ufunc, axis):
+        """Reduces the grid along an axis, streaming blocks of accounts.
+
+        Args:
+            ufunc: binary numpy ufunc, such as numpy.maximum or numpy.add
+            axis: ACCOUNT_AXIS, TAX_AXIS or INFLATION_AXIS
+        Returns:
+            numpy.ndarray of self.shape without axis, as ufunc.reduce of the
+            whole grid would give
+        Raises:
+            Exception if reducing an empty ACCOUNT_AXIS
+        """
+
+        if axis != ACCOUNT_AXIS:
+            reduced = np.empty(_without(self.shape, axis), dtype=np.float64)
+            for start, block in self.iter_chunks():
+                reduced[start:start + len(block)] = ufunc.reduce(block, axis=axis)
+            return reduced
+        reduced = None
+        for _, block in self.iter_chunks():
+            block = ufunc.reduce(block, axis=ACCOUNT_AXIS)
+            reduced = block if reduced is None else ufunc(reduced, block)
+        if reduced is None:
+            raise Exception('Must provide array of accounts')
+        return reduced
+
+    def argmax(self, axis):
+        """Provides the index of the maximum along an axis, streaming blocks.
+
+        Of equal maxima, the first is given, so of accounts with equal real
+        return, the earliest.
+
+        Args:
+            axis: ACCOUNT_AXIS, TAX_AXIS or INFLATION_AXIS
+        Returns:
+            int numpy.ndarray of self.shape without axis
+        Raises:
+            Exception if taking the maximum along an empty ACCOUNT_AXIS
+        """
+
+        if axis != ACCOUNT_AXIS:
+            indexes = np.empty(_without(self.shape, axis), dtype=np.intp)
+            for start, block in self.iter_chunks():
+                indexes[start:start + len(block)] = block.argmax(axis=axis)
+            return indexes
+        indexes = None
+        for start, block in self.iter_chunks():
+            block_indexes = block.argmax(axis=ACCOUNT_AXIS)
+            block_maxima = np.take_along_axis(
+                block, block_indexes[np.newaxis], axis=ACCOUNT_AXIS)[0]
+            if indexes is None:
+                indexes, maxima = block_indexes + start, block_maxima
+                continue
+            better = block_maxima > maxima
+            indexes = np.where(better, block_indexes + start, indexes)
+            maxima = np.where(better, block_maxima, maxima)
+        if indexes is None:
+            raise Exception('Must provide array of accounts')
+        return indexes
+
+    def best_accounts(self):
+        """Provides the account with the highest real return in every cell.
+
+        Returns:
+            array per tax rate of an array per inflation rate of the
+            account, the earliest if several are equal
+        Raises:
+            Exception if the grid has no accounts
+        """
+
+        return [[self.accounts[i] for i in row]
+                for row in self.argmax(ACCOUNT_AXIS).tolist()]
+
+
+def _without(shape, axis):
+    return shape[:axis] + shape[axis + 1:]
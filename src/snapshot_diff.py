@@ -0,0 +1,119 @@
+"""Compares snapshots of call accounts, so only changed accounts are reprocessed.
+
+@author Adrian Parker
+"""
+
+from src.call_account import MOVEMENT_DOWN
+from src.call_account import MOVEMENT_UP
+
+
+def account_key(account):
+    """Provides the key identifying an account across snapshots.
+
+    Args:
+        account: CallAccount to identify
+    Returns:
+        tuple of (institution, name, min_deposit)
+    """
+
+    return (account.institution, account.name, account.min_deposit)
+
+
+class SnapshotDiff:
+    """Accounts added, removed and changed between two snapshots.
+
+    Attributes:
+        added: array of CallAccount only in the current snapshot
+        removed: array of CallAccount only in the previous snapshot
+        changed: array of (previous, current) CallAccount tuples whose
+            nominal rate or credit rating differ
+    """
+
+    def __init__(self, added, removed, changed, current):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+        self._current = current
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def apply_to(self, accounts_by_key):
+        """Updates a mapping of account_key to CallAccount with this diff only.
+
+        Args:
+            accounts_by_key: dict of account_key to CallAccount, built from
+                the previous snapshot, updated in place to the current one
+        Returns:
+            the given dict
+        """
+
+        for account in self.removed:
+            accounts_by_key.pop(account_key(account), None)
+        for account in self.added:
+            accounts_by_key[account_key(account)] = account
+        for _, account in self.changed:
+            accounts_by_key[account_key(account)] = account
+        return accounts_by_key
+
+    def indicator_mismatches(self):
+        """Cross-checks this diff against the page's up/down indicators.
+
+        Returns:
+            array of current CallAccount whose movement indicator disagrees
+            with the observed change in nominal rate: flagged up or down
+            without such a change, or changed without the matching flag.
+            Added accounts have no previous rate, so are not checked
+        """
+
+        changed = {}
+        for previous, current in self.changed:
+            changed[id(current)] = _observed_movement(previous, current)
+        added = set(id(account) for account in self.added)
+        mismatches = []
+        for account in self._current:
+            if id(account) in added:
+                continue
+            if account.movement != changed.get(id(account)):
+                mismatches.append(account)
+        return mismatches
+
+
+def diff_accounts(previous, current):
+    """Compares two snapshots of accounts by account_key.
+
+    Accounts sharing a key within a snapshot are paired in snapshot order.
+
+    Args:
+        previous: iterable of CallAccount from the earlier snapshot
+        current: iterable of CallAccount from the later snapshot
+    Returns:
+        SnapshotDiff
+    """
+
+    previous_by_key = {}
+    for account in previous:
+        previous_by_key.setdefault(account_key(account), []).append(account)
+    current = list(current)
+    added = []
+    changed = []
+    for account in current:
+        candidates = previous_by_key.get(account_key(account))
+        if not candidates:
+            added.append(account)
+            continue
+        previous_account = candidates.pop(0)
+        if (previous_account.nominal != account.nominal
+                or previous_account.credit_rating != account.credit_rating):
+            changed.append((previous_account, account))
+    removed = [account for accounts in previous_by_key.values()
+               for account in accounts]
+    return SnapshotDiff(added, removed, changed, current)
+
+
+def _observed_movement(previous, current):
+    if current.nominal > previous.nominal:
+        return MOVEMENT_UP
+    if current.nominal < previous.nominal:
+        return MOVEMENT_DOWN
+    return None
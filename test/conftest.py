@@ -0,0 +1,95 @@
+"""Shared fixtures for the tests. """
+
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from src.data_provider import _get_call_account_html
+
+SAMPLE_ETAG = '"sample-17-07-2020"'
+SAMPLE_LAST_MODIFIED = 'Fri, 17 Jul 2020 00:00:00 GMT'
+
+
+class _SampleHandler(BaseHTTPRequestHandler):
+    """Serves the embedded sample page at every path, honouring validators."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.client_address,
+                                dict(self.headers)))
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+        self._respond()
+
+    def _respond(self):
+        server = self.server
+        if server.failures > 0:
+            server.failures -= 1
+            self._send(503, b'')
+            return
+        if self.path in server.redirects:
+            self._send(302, b'', {'Location': server.redirects[self.path]})
+            return
+        if self.headers.get('If-None-Match') == SAMPLE_ETAG:
+            self._send(304, None)
+            return
+        body = server.pages.get(self.path, server.body).encode('utf-8')
+        headers = {'ETag': SAMPLE_ETAG, 'Last-Modified': SAMPLE_LAST_MODIFIED,
+                   'Content-Type': 'text/html; charset=utf-8'}
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+        self._send(200, body, headers)
+
+    def _send(self, status, body, headers={}):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if body is not None:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def sample_server():
+    """Local stand-in for interest.co.nz serving the embedded sample page.
+
+    Exposes url, requests made, failures (503s to send before succeeding),
+    pages (bodies to serve by path instead of the sample), redirects
+    (locations to redirect to by path), delay (seconds to wait before
+    responding) and max_in_flight (most concurrent requests).
+    """
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _SampleHandler)
+    server.daemon_threads = True
+    server.body = _get_call_account_html(False)
+    server.pages = {}
+    server.redirects = {}
+    server.requests = []
+    server.failures = 0
+    server.delay = 0
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.url = 'http://127.0.0.1:' + str(server.server_address[1])
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,),
+                              daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,60 @@
+"""Tests account_groups.py. """
+
+import pytest
+
+from src import account_helper
+from src.account_groups import AccountGroups
+from src.account_groups import group_accounts_by
+from src.data_provider import get_call_accounts
+from src.data_provider import get_call_account_institution_names
+
+
+def test_for_institution_matches_account_helper():
+    accounts = get_call_accounts()
+    groups = AccountGroups(accounts)
+    assert(len(groups) == 116)
+    for institution in get_call_account_institution_names() + ['None']:
+        assert(groups.for_institution(institution) ==
+               account_helper.get_accounts_for_institution(accounts, institution))
+
+
+def test_groups_cover_snapshot_in_order():
+    accounts = get_call_accounts()
+    groups = AccountGroups(accounts)
+    institution_types = groups.groups('institution_type')
+    assert(list(institution_types) == ['Banks', 'Brokers', 'Building Societies',
+                                       'Credit Unions', 'Finance Companies'])
+    for field in ('institution', 'credit_rating', 'institution_type'):
+        grouped = groups.groups(field)
+        assert(sum(len(group) for group in grouped.values()) == 116)
+        for value, group in grouped.items():
+            assert(all(getattr(account, field) == value for account in group))
+            assert(group == [account for account in accounts
+                             if getattr(account, field) == value])
+    assert(len(groups.for_credit_rating(None)) > 0)
+
+
+def test_index_is_independent_of_source_list():
+    accounts = list(get_call_accounts())
+    groups = AccountGroups(accounts)
+    accounts.clear()
+    groups.for_institution('BNZ').clear()
+    assert(len(groups.for_institution('BNZ')) == 3)
+
+
+def test_composite_fields():
+    groups = AccountGroups(get_call_accounts(),
+                           [('institution_type', 'credit_rating'), ('name',)])
+    banks = groups.get(('institution_type', 'credit_rating'), ('Banks', 'AA-'))
+    assert(len(banks) > 0)
+    assert(all(account.credit_rating == 'AA-' for account in banks))
+    assert(list(groups.groups(('name',)))[0] ==
+           (get_call_accounts()[0].name,))
+    with pytest.raises(Exception):
+        groups.for_institution('BNZ')
+
+
+def test_group_accounts_by_generator():
+    accounts = get_call_accounts()
+    grouped = group_accounts_by(iter(accounts), 'institution')
+    assert(len(grouped) == len(get_call_account_institution_names()))
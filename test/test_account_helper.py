@@ -1,7 +1,11 @@
 """Tests nominal_rate_extractor.py functions. """
 
+import pytest
+
 from src import account_helper
 from src import data_provider
+from src.call_account import CallAccount
+from src.return_adjustments import real_return_from_nominal
 
 
 def _get_sample_call_accounts():
@@ -90,6 +94,14 @@ def test_sample_call_accounts_BNZ_correct_length():
     assert(len(bnz_accounts) == 3)
 
 
+def test_sample_call_accounts_building_societies():
+    accounts = account_helper.get_accounts_for_institution_type(
+        _get_sample_call_accounts(), 'Building Societies')
+    assert(len(accounts) > 0)
+    for account in accounts:
+        assert(account.institution_type == 'Building Societies')
+
+
 def test_sample_call_accounts_HSBC_correct_rating():
     hsbc_accounts = account_helper.get_accounts_for_institution(
         _get_sample_call_accounts(), 'HSBC')
@@ -167,3 +179,99 @@ def test_get_accounts_with_maximum_nominal_for_deposit():
         accounts, 25000)
     assert(len(max_accounts) == 1)
     assert(max_accounts[0].nominal == 0.0500000001)
+
+
+def test_maximum_nominal_accepts_generators():
+    accounts = _get_sample_call_accounts()
+    assert(account_helper.get_accounts_with_maximum_nominal(
+        account for account in accounts) ==
+        account_helper.get_accounts_with_maximum_nominal(accounts))
+    assert(account_helper.get_accounts_with_maximum_nominal_for_deposit(
+        iter(accounts), 0) ==
+        account_helper.get_accounts_with_maximum_nominal_for_deposit(
+            accounts, 0))
+    assert(account_helper.get_accounts_with_maximum_nominal_for_deposit(
+        iter(accounts), -1) == [])
+    assert(len(account_helper.get_accounts_for_institution(
+        data_provider.iter_call_accounts(
+            data_provider._get_call_account_html(False)), 'BNZ')) == 3)
+
+
+def test_maximum_nominal_of_empty_iterable_raises():
+    with pytest.raises(Exception):
+        account_helper.get_accounts_with_maximum_nominal(iter([]))
+    with pytest.raises(Exception):
+        account_helper.get_accounts_with_maximum_nominal_for_deposit(None)
+
+
+def test_top_k_accounts_matches_full_sort():
+    accounts = _get_sample_call_accounts()
+    top = account_helper.top_k_accounts(accounts, 10, 10000, 0.33, 0.015, 'A')
+    assert(len(top) == 10)
+    qualifying = [account for account in accounts
+                  if account.min_deposit <= 10000
+                  and account.credit_rating in ('AAA', 'AA+', 'AA', 'AA-',
+                                                'A+', 'A')]
+    expected = sorted(
+        ((real_return_from_nominal(account.nominal / 100, 0.33, 0.015), account)
+         for account in qualifying), key=lambda ranked: ranked[0],
+        reverse=True)[:10]
+    assert(top == expected)
+    assert(top[0][1].name == 'NoticeSaver 60 days')
+
+
+def test_top_k_accounts_keeps_ties_in_given_order():
+    accounts = [CallAccount(['Bank ' + str(i), 'AA', 'Saver', 1, 1.0])
+                for i in range(5)]
+    top = account_helper.top_k_accounts(reversed(accounts), 3)
+    assert([account for _, account in top] == accounts[:-4:-1])
+
+
+def test_top_k_accounts_filters():
+    accounts = _get_sample_call_accounts()
+    assert(account_helper.top_k_accounts(accounts, 0) == [])
+    assert(account_helper.top_k_accounts(accounts, 5, deposit=-1) == [])
+    assert(len(account_helper.top_k_accounts(accounts, 500)) == 116)
+    unrated = account_helper.top_k_accounts(accounts, 500, min_rating='D')
+    assert(len(unrated) == 116 - 22)
+    with pytest.raises(Exception):
+        account_helper.top_k_accounts(accounts, 5, min_rating='Z')
+
+
+def _dominates(a, b, objectives):
+    better = False
+    for field, direction in objectives:
+        x, y = getattr(a, field) * direction, getattr(b, field) * direction
+        if x < y:
+            return False
+        better = better or x > y
+    return better
+
+
+def test_pareto_frontier_matches_pairwise_comparison():
+    accounts = _get_sample_call_accounts()
+    for objectives in (account_helper.PARETO_OBJECTIVES,
+                       (('nominal', account_helper.MAXIMISE),
+                        ('min_deposit', account_helper.MINIMISE)),
+                       (('rating_ordinal', account_helper.MAXIMISE),)):
+        expected = [a for a in accounts
+                    if not any(_dominates(b, a, objectives) for b in accounts)]
+        assert(account_helper.pareto_frontier(iter(accounts), objectives) ==
+               expected)
+
+
+def test_pareto_frontier_keeps_equal_accounts():
+    accounts = [CallAccount(['A', 'AA', 'x', 1, 2.0]),
+                CallAccount(['B', 'AA', 'y', 1, 2.0]),
+                CallAccount(['C', 'AA', 'z', 10, 2.0]),
+                CallAccount(['D', 'BB', 'w', 1, 3.0])]
+    assert(account_helper.pareto_frontier(accounts) ==
+           [accounts[0], accounts[1], accounts[3]])
+    assert(account_helper.pareto_frontier([]) == [])
+
+
+def test_pareto_frontiers_of_snapshots():
+    accounts = _get_sample_call_accounts()
+    snapshots = [accounts, accounts[:40], [], accounts[40:]]
+    assert(account_helper.pareto_frontiers(snapshots, workers=2, chunksize=1) ==
+           [account_helper.pareto_frontier(snapshot) for snapshot in snapshots])
@@ -0,0 +1,107 @@
+"""Tests account_index.py. """
+
+import random
+
+import numpy as np
+import pytest
+
+from src import account_helper
+from src.account_index import AccountIndex
+from src.account_index import best_accounts_for_deposits
+from src.call_account import CallAccount
+from src.data_provider import get_call_accounts
+
+
+def test_matches_account_helper_on_sample():
+    accounts = get_call_accounts()
+    index = AccountIndex(accounts)
+    assert(len(index) == 116)
+    assert(index.get_accounts_with_maximum_nominal() ==
+           account_helper.get_accounts_with_maximum_nominal(accounts))
+    for deposit in (-1, 0, 1, 999.99, 1000, 5000, 10000, 25000, 1e9):
+        assert(index.get_accounts_with_maximum_nominal_for_deposit(deposit) ==
+               account_helper.get_accounts_with_maximum_nominal_for_deposit(
+                   accounts, deposit))
+
+
+def test_matches_account_helper_with_ties():
+    generator = random.Random(16)
+    accounts = [CallAccount(['Bank ' + str(i), 'A', 'Saver',
+                             generator.choice([0, 1, 500, 1000, 5000]),
+                             generator.choice([0.5, 1.0, 1.5])])
+                for i in range(200)]
+    index = AccountIndex(iter(accounts))
+    for deposit in (-1, 0, 1, 499, 500, 1000, 4999, 5000, 6000):
+        maximum = index.get_accounts_with_maximum_nominal_for_deposit(deposit)
+        expected = account_helper.get_accounts_with_maximum_nominal_for_deposit(
+            accounts, deposit)
+        assert([id(account) for account in maximum] ==
+               [id(account) for account in expected])
+
+
+def test_all_accounts_tied():
+    accounts = [CallAccount(['Bank ' + str(i), 'A', 'Saver', (i * 7) % 100, 1.0])
+                for i in range(3000)]
+    index = AccountIndex(accounts)
+    assert(index.get_accounts_with_maximum_nominal() == accounts)
+    for deposit in (0, 49, 99):
+        maximum = index.get_accounts_with_maximum_nominal_for_deposit(deposit)
+        assert(maximum == [account for account in accounts
+                           if account.min_deposit <= deposit])
+    answers = index.indexes_for_deposits([49, 49.5, 99])
+    assert(answers[0] is answers[1])
+    assert(list(answers[2]) == list(range(3000)))
+
+
+def test_indexes_for_deposits_when_ties_span_every_deposit():
+    count = 5000
+    accounts = [CallAccount(['Bank ' + str(i), 'A', 'Saver',
+                             float((i * 7919) % count), 1.0])
+                for i in range(count)]
+    index = AccountIndex(accounts)
+    answers = index.indexes_for_deposits(np.arange(-1.0, count))
+    assert([len(answer) for answer in answers] == list(range(count + 1)))
+    for deposit in (-1, 0, 1, 7, count // 2, count - 1):
+        expected = [i for i, account in enumerate(accounts)
+                    if account.min_deposit <= deposit]
+        assert(answers[deposit + 1] == expected)
+        assert([accounts[i] for i in expected] ==
+               index.get_accounts_with_maximum_nominal_for_deposit(deposit))
+
+
+def test_best_accounts_for_deposits_matches_account_helper():
+    generator = random.Random(17)
+    accounts = [CallAccount(['Bank ' + str(i), 'A', 'Saver',
+                             generator.choice([0, 1, 500, 1000, 5000]),
+                             generator.choice([0.5, 1.0, 1.5])])
+                for i in range(200)]
+    deposits = [generator.choice([-1, 0, 1, 499, 500, 2500, 5000, 6000])
+                for _ in range(500)]
+    answers = best_accounts_for_deposits(accounts, deposits)
+    assert(len(answers) == len(deposits))
+    for deposit, positions in zip(deposits, answers):
+        expected = account_helper.get_accounts_with_maximum_nominal_for_deposit(
+            accounts, deposit)
+        assert([accounts[i] for i in positions] == expected)
+        assert(list(positions) == sorted(positions))
+
+
+def test_indexes_for_deposits_shares_equal_answers():
+    index = AccountIndex(get_call_accounts())
+    answers = index.indexes_for_deposits(iter([5000, 5000.0, -1]))
+    assert(answers[0] is answers[1])
+    assert(answers[2] == ())
+
+
+def test_results_are_new_lists():
+    index = AccountIndex(get_call_accounts())
+    index.get_accounts_with_maximum_nominal().clear()
+    assert(len(index.get_accounts_with_maximum_nominal()) == 1)
+
+
+def test_empty_index_raises():
+    index = AccountIndex([])
+    with pytest.raises(Exception):
+        index.get_accounts_with_maximum_nominal_for_deposit(0)
+    with pytest.raises(Exception):
+        index.get_accounts_with_maximum_nominal()
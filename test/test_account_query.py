@@ -0,0 +1,87 @@
+"""Tests account_query.py. """
+
+import pytest
+
+from src import account_helper
+from src.account_query import Accounts
+from src.data_provider import get_call_accounts
+
+
+def _queries():
+    accounts = get_call_accounts()
+    return accounts, Accounts(accounts), Accounts.indexed(accounts)
+
+
+def test_for_institution_matches_account_helper():
+    accounts, plain, indexed = _queries()
+    expected = account_helper.get_accounts_for_institution(accounts, 'Kiwibank')
+    assert(plain.for_institution('Kiwibank').to_list() == expected)
+    assert(indexed.for_institution('Kiwibank').to_list() == expected)
+
+
+def test_max_by_nominal_for_deposit_matches_account_helper():
+    accounts, plain, indexed = _queries()
+    for deposit in (-1, 0, 1, 5000, 1e9):
+        expected = account_helper.get_accounts_with_maximum_nominal_for_deposit(
+            accounts, deposit)
+        assert(plain.for_deposit(deposit).max_by('nominal').to_list() == expected)
+        assert(indexed.for_deposit(deposit).max_by('nominal').to_list() ==
+               expected)
+    assert(list(indexed.max_by('nominal')) ==
+           account_helper.get_accounts_with_maximum_nominal(accounts))
+
+
+def test_chained_filters_match_account_helper():
+    accounts, plain, indexed = _queries()
+    banks = account_helper.get_accounts_for_institution_type(accounts, 'Banks')
+    expected = account_helper.get_accounts_with_maximum_nominal_for_deposit(
+        [account for account in banks if account.credit_rating == 'AA-'], 10000)
+    for query in (plain, indexed):
+        assert(query.for_institution_type('Banks')
+               .where(lambda account: account.credit_rating == 'AA-')
+               .for_deposit(20000).for_deposit(10000)
+               .max_by('nominal').to_list() == expected)
+        assert(query.where(institution='BNZ', credit_rating='AA-',
+                           institution_type='Banks').to_list() ==
+               account_helper.get_accounts_for_institution(accounts, 'BNZ'))
+        assert(query.where(institution='BNZ', name='no such account')
+               .to_list() == [])
+
+
+def test_query_is_lazy_and_reusable():
+    calls = []
+
+    def predicate(account):
+        calls.append(account)
+        return True
+
+    accounts = get_call_accounts()
+    query = Accounts(accounts).where(predicate)
+    assert(calls == [])
+    first = next(iter(query))
+    assert(first is accounts[0] and len(calls) == 1)
+    assert(len(query.to_list()) == 116)
+    kiwibank = query.for_institution('Kiwibank')
+    assert(len(query.to_list()) == 116)
+    assert(len(kiwibank.to_list()) == 8)
+
+
+def test_filters_after_max_by_raise():
+    with pytest.raises(Exception):
+        Accounts([]).max_by('nominal').for_deposit(0)
+    assert(Accounts([]).max_by('nominal').to_list() == [])
+    assert(Accounts.indexed([]).max_by('nominal').to_list() == [])
+
+
+def test_for_rating_range():
+    accounts, plain, indexed = _queries()
+    for query in (plain, indexed):
+        assert(query.for_rating_range('A-').to_list() ==
+               [account for account in accounts
+                if account.credit_rating in ('AA-', 'A', 'A-')])
+        assert(query.for_rating_range('BB', 'BB+').for_institution_type(
+            'Banks').to_list() ==
+            [account for account in accounts
+             if account.credit_rating in ('BB', 'BB+')
+             and account.institution_type == 'Banks'])
+        assert(len(query.for_rating_range().to_list()) == 116)
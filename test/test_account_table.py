@@ -0,0 +1,82 @@
+"""Tests account_table.py. """
+
+import pytest
+
+from src import account_helper
+from src.account_table import AccountTable
+from src.credit_rating import rating_ordinal
+from src.data_provider import get_call_accounts
+
+
+def _sample_table():
+    return AccountTable.from_accounts(get_call_accounts())
+
+
+def test_round_trip_to_accounts():
+    accounts = get_call_accounts()
+    table = AccountTable.from_accounts(accounts)
+    assert(len(table) == 116)
+    assert(len(table.institutions) == 31)
+    assert(table.to_accounts() == accounts)
+
+
+def test_for_institution_matches_account_helper():
+    accounts = get_call_accounts()
+    table = AccountTable.from_accounts(accounts)
+    for institution in ('BNZ', 'HSBC', 'Kookmin', 'Westpac', 'ICBC', 'None'):
+        expected = account_helper.get_accounts_for_institution(
+            accounts, institution)
+        assert(table.for_institution(institution).to_accounts() == expected)
+
+
+def test_for_institution_type_matches_account_helper():
+    accounts = get_call_accounts()
+    table = AccountTable.from_accounts(accounts)
+    for institution_type in ('Banks', 'Credit Unions', 'None'):
+        expected = account_helper.get_accounts_for_institution_type(
+            accounts, institution_type)
+        assert(table.for_institution_type(institution_type).to_accounts()
+               == expected)
+
+
+def test_with_maximum_nominal():
+    maximum = _sample_table().with_maximum_nominal().to_accounts()
+    assert(len(maximum) == 1)
+    assert(maximum[0].institution == 'NZCU Employees')
+    assert(maximum[0].nominal == 3)
+
+
+def test_with_maximum_nominal_for_deposit_matches_account_helper():
+    accounts = get_call_accounts()
+    table = AccountTable.from_accounts(accounts)
+    for deposit in (0, 1, 999, 5000, 100000, 10000000):
+        expected = account_helper.get_accounts_with_maximum_nominal_for_deposit(
+            accounts, deposit)
+        assert([account.nominal for account in
+                table.with_maximum_nominal_for_deposit(deposit).to_accounts()] ==
+               [account.nominal for account in expected])
+
+
+def test_empty_table_raises():
+    with pytest.raises(Exception):
+        AccountTable.from_accounts([]).with_maximum_nominal()
+
+
+def test_for_rating_range_matches_ordinals():
+    accounts = get_call_accounts()
+    table = AccountTable.from_accounts(accounts)
+    assert(table.rating_ordinals.tolist() ==
+           [account.rating_ordinal for account in accounts])
+    for min_rating, max_rating in ((None, None), ('A-', None), (None, 'BBB'),
+                                   ('BB', 'BBB+'), ('AAA', None),
+                                   ('A', 'BB')):
+        expected = [account for account in accounts
+                    if (min_rating is None or account.rating_ordinal >=
+                        rating_ordinal(min_rating))
+                    and (max_rating is None or account.rating_ordinal <=
+                         rating_ordinal(max_rating))]
+        assert(table.for_rating_range(min_rating, max_rating).to_accounts() ==
+               expected)
+    assert(len(table.for_rating_range('D')) == 116 - 22)
+    with pytest.raises(Exception):
+        table.indexes_for_rating_range('unrated')
@@ -0,0 +1,80 @@
+"""Tests async_fetcher.py against a local stand-in server. """
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+from src.async_fetcher import fetch_call_accounts
+from src.async_fetcher import fetch_page
+from src.async_fetcher import get_call_accounts_from_urls
+from src.data_provider import _get_call_account_html
+from src.data_provider import get_call_accounts
+
+ONE_ACCOUNT = """
+    <tr class="primary_row interest_financial_row_1">
+        <td><a title="ANZ">ANZ</a></td>
+        <td>AA-</td><td>Online savings </td><td>$1</td><td>0.05</td>
+    </tr>"""
+
+
+def test_fetch_page_decompresses_gzip(sample_server):
+    body = asyncio.run(fetch_page(sample_server.url + '/saving/call-account'))
+    assert(body == _get_call_account_html(False))
+
+
+def test_fetch_page_follows_redirects(sample_server):
+    sample_server.redirects['/old'] = '/saving/call-account'
+    body = asyncio.run(fetch_page(sample_server.url + '/old'))
+    assert(body == _get_call_account_html(False))
+    assert([path for path, _, _ in sample_server.requests] ==
+           ['/old', '/saving/call-account'])
+
+
+def test_get_call_accounts_from_urls_merges_and_tags_source(sample_server):
+    sample_server.pages['/saving/e-saver-online'] = ONE_ACCOUNT
+    urls = [sample_server.url + '/saving/call-account',
+            sample_server.url + '/saving/e-saver-online']
+    accounts = get_call_accounts_from_urls(urls)
+    assert(len(accounts) == 117)
+    assert(accounts[0].source == urls[0])
+    assert(accounts[-1].source == urls[1])
+    assert(accounts[-1].institution == 'ANZ')
+
+
+def test_fetch_call_accounts_limits_concurrency_per_host(sample_server):
+    sample_server.delay = 0.05
+    urls = [sample_server.url + '/page/' + str(i) for i in range(6)]
+    with ThreadPoolExecutor(2) as executor:
+        accounts = asyncio.run(fetch_call_accounts(
+            urls, per_host_limit=1, executor=executor))
+    assert(sample_server.max_in_flight == 1)
+    assert(len(accounts) == 6 * 116)
+    assert([account.source for account in accounts[::116]] == urls)
+
+
+def test_fetch_call_accounts_fetches_concurrently(sample_server):
+    sample_server.delay = 0.05
+    urls = [sample_server.url + '/page/' + str(i) for i in range(6)]
+    asyncio.run(fetch_call_accounts(urls, per_host_limit=3))
+    assert(sample_server.max_in_flight > 1)
+    assert(sample_server.max_in_flight <= 3)
+
+
+def test_fetch_concurrency_is_not_capped_by_default_thread_pool(
+        sample_server):
+    sample_server.delay = 0.2
+    sample_server.body = ONE_ACCOUNT
+    urls = [sample_server.url + '/page/' + str(i) for i in range(40)]
+    accounts = asyncio.run(fetch_call_accounts(urls, per_host_limit=40))
+    assert(len(accounts) == 40)
+    assert(sample_server.max_in_flight > 32)
+
+
+def test_get_call_accounts_from_urls_parses_in_processes(sample_server):
+    urls = [sample_server.url + '/page/' + str(i) for i in range(2)]
+    expected = [account.to_row() for account in get_call_accounts()] * 2
+    for parser in ('html.parser', 'stream'):
+        with ProcessPoolExecutor(2) as executor:
+            accounts = get_call_accounts_from_urls(urls, executor=executor,
+                                                   parser=parser)
+        assert([account.to_row() for account in accounts] == expected)
@@ -0,0 +1,69 @@
+"""Tests batch_ingest.py. """
+
+import shutil
+from datetime import datetime
+from datetime import timezone
+
+from src.batch_ingest import BatchIngester
+from src.batch_ingest import find_snapshot_files
+from src.batch_ingest import snapshot_time
+from src.batch_ingest import SnapshotSeries
+from src.data_provider import _get_call_account_html
+from src.data_provider import SAMPLE_HTML_PATH
+from src.data_provider import STREAM_PARSER
+from src.rate_store import RateStore
+
+JUNE = datetime(2020, 6, 1, tzinfo=timezone.utc)
+JULY = datetime(2020, 7, 17, tzinfo=timezone.utc)
+
+
+def _archive(tmp_path):
+    shutil.copy(SAMPLE_HTML_PATH, tmp_path / 'call_account_2020-07-17.html.gz')
+    (tmp_path / 'call_account_2020-06-01.html').write_text(
+        _get_call_account_html(False), encoding='utf-8')
+    (tmp_path / 'call_account_2020-06-15.html.gz').write_bytes(b'\x1f\x8bnot gzip')
+    (tmp_path / 'notes.txt').write_text('not a page')
+    return tmp_path
+
+
+def test_find_snapshot_files(tmp_path):
+    archive = _archive(tmp_path)
+    assert(len(find_snapshot_files(str(archive))) == 3)
+    assert(len(find_snapshot_files(str(archive / '*-07-*'))) == 1)
+    assert(find_snapshot_files(['a.html']) == ['a.html'])
+
+
+def test_snapshot_time_from_name():
+    assert(snapshot_time('saved/call_account_2020-07-17.html') == JULY)
+
+
+def test_ingest_into_rate_store_in_time_order(tmp_path):
+    progress = []
+    ingester = BatchIngester(workers=2, chunksize=1, parser=STREAM_PARSER,
+                             progress=lambda *args: progress.append(args))
+    with RateStore() as store:
+        failures = ingester.ingest(str(_archive(tmp_path)), store)
+        assert(store.get_snapshot_times() == [JUNE, JULY])
+        assert(len(store.get_accounts_at(JULY)) == 116)
+    assert(len(failures) == 1)
+    assert(failures[0][0].endswith('2020-06-15.html.gz'))
+    assert(ingester.files == 3)
+    assert(ingester.accounts == 232)
+    assert([args[0] for args in progress] == [1, 2, 3])
+
+
+def test_ingest_into_snapshot_series(tmp_path):
+    series = SnapshotSeries()
+    BatchIngester(workers=2).ingest(str(_archive(tmp_path)), series)
+    taken_at, table = series.to_table()
+    assert(len(table) == len(taken_at) == 232)
+    banks = table.indexes_for_institution_type('Banks')
+    assert(len(set(taken_at[banks].tolist())) == 2)
+
+
+def test_iter_accounts_sets_source(tmp_path):
+    records = list(BatchIngester(workers=1).iter_accounts(
+        [str(_archive(tmp_path) / 'call_account_2020-07-17.html.gz')]))
+    assert(len(records) == 116)
+    assert(records[0][0] == JULY)
+    assert(records[0][1].source.endswith('.html.gz'))
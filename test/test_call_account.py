@@ -1,6 +1,13 @@
 """Tests call_account.py. """
 
+import pickle
+
+import pytest
+
 from src.call_account import CallAccount
+from src.call_account import FrozenCallAccount
+from src.credit_rating import rating_ordinal
+from src.credit_rating import UNRATED
 
 
 def test_call_account_constructor():
@@ -10,3 +17,67 @@ def test_call_account_constructor():
     assert(x.name == 'c')
     assert(x.min_deposit == 1)
     assert(x.nominal == 2)
+
+
+def test_call_account_from_fields():
+    x = CallAccount.from_fields('a', 'b', 'c', 1, 2)
+    assert(x == CallAccount(['a', 'b', 'c', 1, 2]))
+    assert(x.movement is None)
+    assert(not hasattr(x, '__dict__'))
+
+
+def test_call_account_interns_institution_and_rating():
+    x = CallAccount([''.join(['A', 'NZ']), ''.join(['AA', '-']), 'c', 1, 2])
+    y = CallAccount.from_fields(''.join(['AN', 'Z']), ''.join(['A', 'A-']),
+                                'c', 1, 2)
+    assert(x.institution is y.institution)
+    assert(x.credit_rating is y.credit_rating)
+
+
+def test_call_account_encodes_rating_ordinal():
+    assert(CallAccount(['a', 'AA-', 'c', 1, 2]).rating_ordinal >
+           CallAccount.from_fields('a', 'BBB', 'c', 1, 2).rating_ordinal)
+    assert(CallAccount(['a', None, 'c', 1, 2]).rating_ordinal == UNRATED)
+    assert(CallAccount(['a', 'A', 'c', 1, 2]).frozen().rating_ordinal ==
+           rating_ordinal('A'))
+
+
+def test_setting_credit_rating_updates_rating_ordinal():
+    x = CallAccount(['a', 'BBB', 'c', 1, 2])
+    x.credit_rating = ''.join(['A', 'A'])
+    assert(x.credit_rating == 'AA')
+    assert(x.rating_ordinal == rating_ordinal('AA'))
+    x.credit_rating = None
+    assert(x.rating_ordinal == UNRATED)
+    with pytest.raises(AttributeError):
+        x.rating_ordinal = 3
+    with pytest.raises(AttributeError):
+        x.frozen().credit_rating = 'AA'
+
+
+def test_call_account_equality_and_hash():
+    x = CallAccount(['a', 'b', 'c', 1, 2], source='http://x')
+    y = CallAccount(['a', 'b', 'c', 1, 2])
+    assert(x == y)
+    assert(len({x: 1, y: 2}) == 1)
+    assert(x != CallAccount(['a', 'b', 'c', 1, 3]))
+
+
+def test_frozen_call_account_is_immutable():
+    x = CallAccount(['a', 'b', 'c', 1, 2]).frozen()
+    assert(isinstance(x, FrozenCallAccount))
+    assert(x == CallAccount(['a', 'b', 'c', 1, 2]))
+    with pytest.raises(AttributeError):
+        x.nominal = 3
+    y = FrozenCallAccount(['a', 'b', 'c', 1, 2], source='http://x')
+    assert(isinstance(y, FrozenCallAccount))
+    assert(y == x and y.source == 'http://x')
+
+
+def test_call_accounts_pickle():
+    for x in (CallAccount(['a', 'b', 'c', 1, 2, 'up'], source='http://x'),
+              FrozenCallAccount(['a', 'b', 'c', 1, 2])):
+        y = pickle.loads(pickle.dumps(x))
+        assert(type(y) is type(x))
+        assert(y == x)
+        assert(y.source == x.source)
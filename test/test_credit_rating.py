@@ -0,0 +1,36 @@
+"""Tests credit_rating.py functions """
+
+import pytest
+
+from src.credit_rating import rating_from_ordinal
+from src.credit_rating import rating_ordinal
+from src.credit_rating import required_rating_ordinal
+from src.credit_rating import UNRATED
+
+
+def test_rating_ordinal_orders_ratings():
+    assert rating_ordinal('AAA') > rating_ordinal('AA-') > rating_ordinal('A')
+    assert rating_ordinal('BBB-') > rating_ordinal('BB+')
+    assert rating_ordinal('D') == 0
+    assert rating_ordinal(' A- ') == rating_ordinal('A-')
+
+
+def test_rating_ordinal_of_unrated():
+    assert rating_ordinal(None) == UNRATED
+    assert rating_ordinal('') == UNRATED
+    assert rating_ordinal('NR') == UNRATED
+    assert UNRATED < rating_ordinal('D')
+
+
+def test_rating_from_ordinal_round_trips():
+    for rating in ('AAA', 'AA-', 'BBB', 'BB+', 'D'):
+        assert rating_from_ordinal(rating_ordinal(rating)) == rating
+    assert rating_from_ordinal(UNRATED) is None
+
+
+def test_required_rating_ordinal_rejects_unrated():
+    assert required_rating_ordinal('A-') == rating_ordinal('A-')
+    with pytest.raises(Exception):
+        required_rating_ordinal(None)
+    with pytest.raises(Exception):
+        required_rating_ordinal('Z')
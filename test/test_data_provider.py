@@ -1,8 +1,22 @@
 """Tests data_provider.py. """
+import io
+
+import pytest
+
+from src import data_provider
 from src.data_provider import get_call_accounts
 from src.data_provider import get_call_accounts_from_html
 from src.data_provider import get_call_account_institution_names
+from src.data_provider import iter_call_accounts
+from src.data_provider import get_call_accounts_by_institution_type
 from src.data_provider import _get_accounts_by_institution_type
+from src.data_provider import _get_call_account_html
+from src.data_provider import CallAccountPage
+from src.data_provider import LXML_PARSER
+from src.data_provider import PARSER_ENV_VAR
+from src.data_provider import resolve_parser
+from src.data_provider import SOUP_PARSER
+from src.data_provider import STREAM_PARSER
 
 
 def test_get_call_accounts():
@@ -44,5 +58,110 @@ def test_get_call_account_institution_names():
 
 
 def test_get_accounts_by_institution_types():
-    chunks = _get_accounts_by_institution_type('')
-    assert(len(chunks) == 5)
+    sections = _get_accounts_by_institution_type(_get_call_account_html(False))
+    assert(list(sections) == ['Banks', 'Brokers', 'Building Societies',
+                              'Credit Unions', 'Finance Companies'])
+    assert(sum(len(accounts) for accounts in sections.values()) == 116)
+    assert(all(account.institution_type == 'Banks'
+               for account in sections['Banks']))
+
+
+def test_get_call_accounts_by_institution_type():
+    sections = get_call_accounts_by_institution_type()
+    assert(len(sections['Credit Unions']) > 0)
+
+
+def test_call_account_page_parses_once():
+    page = CallAccountPage.from_source()
+    assert(page.accounts is page.accounts)
+    assert(len(page.accounts) == 116)
+    assert(len(page.institution_names) == 31)
+    assert(len(page.sections) == 5)
+    assert(page._table_soup is page._table_soup)
+
+
+def test_call_account_page_stream_parser_matches_soup():
+    html = _get_call_account_html(False)
+    soup_page = CallAccountPage(html)
+    stream_page = CallAccountPage(html, STREAM_PARSER)
+    assert(stream_page.rows == soup_page.rows)
+    assert(stream_page.institution_names == soup_page.institution_names)
+
+
+def test_lxml_parser_matches_soup():
+    pytest.importorskip('lxml')
+    html = _get_call_account_html(False)
+    lxml_page = CallAccountPage(html, LXML_PARSER)
+    assert(lxml_page.rows == CallAccountPage(html, SOUP_PARSER).rows)
+    assert(len(lxml_page.sections) == 5)
+
+
+def test_resolve_parser_from_environment(monkeypatch):
+    monkeypatch.setenv(PARSER_ENV_VAR, STREAM_PARSER)
+    assert(resolve_parser() == STREAM_PARSER)
+    assert(resolve_parser(SOUP_PARSER) == SOUP_PARSER)
+    monkeypatch.delenv(PARSER_ENV_VAR)
+    assert(resolve_parser() == SOUP_PARSER)
+
+
+def test_resolve_parser_falls_back_without_lxml(monkeypatch):
+    monkeypatch.setattr(data_provider, '_lxml_available', lambda: False)
+    with pytest.warns(UserWarning):
+        assert(resolve_parser(LXML_PARSER) == SOUP_PARSER)
+
+
+def test_resolve_parser_rejects_unknown_parser():
+    with pytest.raises(Exception):
+        resolve_parser('html5lib')
+
+
+def test_table_soup_reads_same_rows_as_full_soup():
+    html = _get_call_account_html(False)
+    page = CallAccountPage(html, SOUP_PARSER)
+    full_soup = data_provider.BeautifulSoup(html, SOUP_PARSER)
+    assert(data_provider._get_accounts_from_soup(full_soup) == page.rows)
+    assert(page._table_soup.find('footer') is None)
+
+
+def test_iter_call_accounts_from_str_file_and_chunks():
+    html = _get_call_account_html(False)
+    accounts = get_call_accounts()
+    assert(list(iter_call_accounts(html)) == accounts)
+    assert(list(iter_call_accounts(io.StringIO(html))) == accounts)
+    assert(list(iter_call_accounts(io.BytesIO(html.encode('utf-8')))) == accounts)
+    data = html.encode('utf-8')
+    # odd sized chunks split tags, rows and any multi-byte characters
+    chunks = (data[start:start + 997] for start in range(0, len(data), 997))
+    assert(list(iter_call_accounts(chunks)) == accounts)
+
+
+def test_iter_call_accounts_with_chunks_split_inside_nominals():
+    html = _get_call_account_html(False)
+    # boundaries one and two characters into every bold nominal
+    splits = [0]
+    start = html.find('<b>')
+    while start != -1:
+        splits += [start + 4, start + 5]
+        start = html.find('<b>', start + 1)
+    assert(len(splits) > 1)
+    splits.append(len(html))
+    chunks = [html[start:end] for start, end in zip(splits, splits[1:])]
+    assert(list(iter_call_accounts(chunks)) == get_call_accounts())
+
+
+def test_iter_call_accounts_yields_before_source_is_read():
+    html = _get_call_account_html(False)
+    read = []
+
+    def chunks():
+        for start in range(0, len(html), 4096):
+            read.append(start)
+            yield html[start:start + 4096]
+
+    next(iter_call_accounts(chunks()))
+    assert(len(read) < len(html) // 4096)
+
+
+def test_iter_call_accounts_over_concatenated_pages():
+    html = _get_call_account_html(False)
+    assert(sum(1 for _ in iter_call_accounts([html, html])) == 232)
@@ -0,0 +1,116 @@
+"""Tests http_fetcher.py against a local stand-in server. """
+
+import pytest
+
+from src import data_provider
+from src.data_provider import _get_call_account_html
+from src.data_provider import CallAccountPage
+from src.data_provider import get_call_account_institution_names
+from src.data_provider import get_call_accounts
+from src.data_provider import get_call_accounts_by_institution_type
+from src.http_fetcher import PageFetcher
+
+
+@pytest.fixture
+def make_fetcher():
+    """Creates PageFetchers, closing them after the test."""
+
+    fetchers = []
+
+    def make(**kwargs):
+        fetcher = PageFetcher(**kwargs)
+        fetchers.append(fetcher)
+        return fetcher
+
+    yield make
+    for fetcher in fetchers:
+        fetcher.close()
+
+
+def test_fetch_decompresses_gzip_body(sample_server, make_fetcher):
+    result = make_fetcher().fetch(sample_server.url + '/saving/call-account')
+    assert(result.status == 200)
+    assert(not result.not_modified)
+    assert(result.body == _get_call_account_html(False))
+    assert('gzip' in sample_server.requests[0][2]['Accept-Encoding'])
+
+
+def test_fetch_sends_conditional_headers_and_reuses_connection(sample_server,
+                                                               make_fetcher):
+    fetcher = make_fetcher()
+    url = sample_server.url + '/saving/call-account'
+    first = fetcher.fetch(url)
+    second = fetcher.fetch(url)
+    assert(second.status == 304)
+    assert(second.not_modified)
+    assert(second.body == first.body)
+    headers = sample_server.requests[1][2]
+    assert(headers['If-None-Match'] == '"sample-17-07-2020"')
+    assert(headers['If-Modified-Since'] == 'Fri, 17 Jul 2020 00:00:00 GMT')
+    # same client port, so the keep-alive connection was reused
+    assert(sample_server.requests[0][1] == sample_server.requests[1][1])
+
+
+def test_fetch_retries_with_backoff(sample_server, make_fetcher):
+    sample_server.failures = 2
+    result = make_fetcher(backoff=0).fetch(sample_server.url + '/')
+    assert(result.status == 200)
+    assert(len(sample_server.requests) == 3)
+
+
+def test_fetch_gives_up_after_retries(sample_server, make_fetcher):
+    sample_server.failures = 5
+    with pytest.raises(Exception):
+        make_fetcher(retries=1, backoff=0).fetch(sample_server.url + '/')
+    assert(len(sample_server.requests) == 2)
+
+
+def test_fetch_follows_redirects(sample_server, make_fetcher):
+    sample_server.redirects['/a'] = '/b'
+    sample_server.redirects['/b'] = '/saving/call-account'
+    fetcher = make_fetcher()
+    result = fetcher.fetch(sample_server.url + '/a')
+    assert(result.url == sample_server.url + '/saving/call-account')
+    assert(result.body == _get_call_account_html(False))
+    fetcher = make_fetcher(max_redirects=1)
+    with pytest.raises(Exception):
+        fetcher.fetch(sample_server.url + '/a')
+
+
+def test_live_call_accounts_reuse_unmodified_page(sample_server, monkeypatch,
+                                                  make_fetcher):
+    monkeypatch.setattr(data_provider, 'CALL_ACCOUNT_URL',
+                        sample_server.url + '/saving/call-account')
+    monkeypatch.setattr(data_provider, '_live_fetcher', make_fetcher())
+    monkeypatch.setattr(data_provider, '_live_page', None)
+    page = CallAccountPage.from_source(live=True)
+    accounts = get_call_accounts(live=True)
+    assert(len(accounts) == 116)
+    assert(CallAccountPage.from_source(live=True) is page)
+    assert(accounts == page.accounts and accounts is not page.accounts)
+    assert(len(sample_server.requests) == 3)
+
+
+def test_live_accessors_return_copies(sample_server, monkeypatch,
+                                      make_fetcher):
+    monkeypatch.setattr(data_provider, 'CALL_ACCOUNT_URL',
+                        sample_server.url + '/saving/call-account')
+    monkeypatch.setattr(data_provider, '_live_fetcher', make_fetcher())
+    monkeypatch.setattr(data_provider, '_live_page', None)
+    accounts = get_call_accounts(live=True)
+    nominal = accounts[0].nominal
+    accounts[0].nominal = 99
+    accounts.clear()
+    get_call_account_institution_names(live=True).clear()
+    sections = get_call_accounts_by_institution_type(live=True)
+    sections['Banks'][0].nominal = 99
+    sections['Banks'].clear()
+    sections.clear()
+    assert(len(sample_server.requests) == 3)
+    again = get_call_accounts(live=True)
+    assert(len(again) == 116)
+    assert(again[0].nominal == nominal)
+    assert(again[0] is not CallAccountPage.from_source(live=True).accounts[0])
+    assert(len(get_call_account_institution_names(live=True)) > 0)
+    banks = get_call_accounts_by_institution_type(live=True)['Banks']
+    assert(banks[0].nominal != 99)
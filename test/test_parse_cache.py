@@ -0,0 +1,76 @@
+"""Tests parse_cache.py. """
+
+from src.data_provider import _get_call_account_html
+from src.data_provider import get_call_accounts_from_html
+from src.parse_cache import ParseCache
+
+
+def _parse(html):
+    return [[html, 'AA-', 'Saver', 1.0, 0.5]]
+
+
+def test_get_call_accounts_from_html_with_cache():
+    cache = ParseCache()
+    html = _get_call_account_html(False)
+    first = get_call_accounts_from_html(html, cache=cache)
+    first[0].nominal = 99
+    second = get_call_accounts_from_html(html, cache=cache)
+    assert(cache.misses == 1)
+    assert(cache.hits == 1)
+    assert(len(second) == 116)
+    assert(second[0] is not first[0])
+    assert(second[0].nominal != 99)
+
+
+def test_cached_values_are_plain_str():
+    html = _get_call_account_html(False)
+    for parser in ('html.parser', 'stream'):
+        cache = ParseCache()
+        get_call_accounts_from_html(html, parser, cache)
+        rows = cache.get_rows(html, None)
+        assert(cache.hits == 1)
+        for row in rows:
+            assert(all(type(value) is str for value in row
+                       if isinstance(value, str)))
+
+
+def test_cached_rows_are_immutable():
+    cache = ParseCache()
+    rows = cache.get_rows('a', _parse)
+    assert(rows is cache.get_rows('a', _parse))
+    assert(isinstance(rows, tuple))
+    assert(isinstance(rows[0], tuple))
+
+
+def test_evicts_least_recently_used_entry():
+    cache = ParseCache(max_entries=2)
+    cache.get_rows('a', _parse)
+    cache.get_rows('b', _parse)
+    cache.get_rows('a', _parse)
+    cache.get_rows('c', _parse)
+    assert(len(cache) == 2)
+    cache.get_rows('a', _parse)
+    assert(cache.hits == 2)
+    cache.get_rows('b', _parse)
+    assert(cache.misses == 4)
+
+
+def test_evicts_when_max_bytes_exceeded():
+    cache = ParseCache(max_bytes=1000)
+    cache.get_rows('a', _parse)
+    single_entry_bytes = cache.bytes
+    for html in ('b', 'c', 'd', 'e', 'f'):
+        cache.get_rows(html, _parse)
+    assert(cache.bytes <= 1000)
+    assert(len(cache) == 1000 // single_entry_bytes)
+
+
+def test_clear():
+    cache = ParseCache()
+    cache.get_rows('a', _parse)
+    cache.get_rows('a', _parse)
+    cache.clear()
+    assert(len(cache) == 0)
+    assert(cache.bytes == 0)
+    assert(cache.hits == 0)
+    assert(cache.misses == 0)
@@ -0,0 +1,59 @@
+"""Tests rate_store.py. """
+
+from datetime import datetime
+from datetime import timezone
+
+from src.call_account import CallAccount
+from src.data_provider import get_call_accounts
+from src.rate_store import RateStore
+
+MARCH = datetime(2020, 3, 1, tzinfo=timezone.utc)
+APRIL = datetime(2020, 4, 1, tzinfo=timezone.utc)
+MAY = datetime(2020, 5, 1, tzinfo=timezone.utc)
+
+
+def _store_with_two_snapshots():
+    store = RateStore()
+    store.write_snapshot([CallAccount(['Kiwibank', 'A', 'Notice Saver 90 days', 1, 1.4]),
+                          CallAccount(['ANZ', 'AA-', 'Serious Saver', 1, 0.9])], MARCH)
+    store.write_snapshot([CallAccount(['Kiwibank', 'A', 'Notice Saver 90 days', 1, 1.25])],
+                         MAY)
+    return store
+
+
+def test_write_and_read_sample_snapshot():
+    accounts = get_call_accounts()
+    with RateStore() as store:
+        store.write_snapshot(accounts, MARCH)
+        stored = store.get_accounts_at(MARCH)
+    assert(len(stored) == 116)
+    for account, stored_account in zip(accounts, stored):
+        assert(account == stored_account)
+
+
+def test_get_accounts_at_point_in_time():
+    store = _store_with_two_snapshots()
+    assert(store.get_accounts_at(datetime(2020, 2, 1)) == [])
+    assert(len(store.get_accounts_at(APRIL)) == 2)
+    accounts = store.get_accounts_at(APRIL, 'Kiwibank', 'Notice Saver 90 days')
+    assert(len(accounts) == 1)
+    assert(accounts[0].nominal == 1.4)
+    assert(store.get_accounts_at(MAY, 'Kiwibank')[0].nominal == 1.25)
+
+
+def test_get_account_history_over_range():
+    store = _store_with_two_snapshots()
+    history = store.get_account_history('Kiwibank', 'Notice Saver 90 days')
+    assert([taken_at for taken_at, _ in history] == [MARCH, MAY])
+    assert([account.nominal for _, account in history] == [1.4, 1.25])
+    history = store.get_account_history('Kiwibank', start=APRIL, end=MAY)
+    assert(len(history) == 1)
+    assert(history[0][1].nominal == 1.25)
+
+
+def test_get_snapshot_times():
+    store = _store_with_two_snapshots()
+    assert(store.get_snapshot_times() == [MARCH, MAY])
+    assert(store.get_snapshot_times(start=APRIL) == [MAY])
+    # naive datetimes are taken to be UTC
+    assert(store.get_snapshot_times(end=datetime(2020, 3, 1)) == [MARCH])
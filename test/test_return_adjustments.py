@@ -1,8 +1,20 @@
 """Tests return_adjustments.py functions """
 
+from decimal import getcontext
+
+import numpy as np
+import pytest
+
 from src.return_adjustments import after_tax_return
+from src.return_adjustments import after_tax_returns
+from src.return_adjustments import DECIMAL_MODE
+from src.return_adjustments import FLOAT_MODE
 from src.return_adjustments import real_return
 from src.return_adjustments import real_return_from_nominal
+from src.return_adjustments import real_returns
+from src.return_adjustments import real_returns_from_nominal
+from src.return_adjustments import round_significant
+from src.return_adjustments import UNROUNDED_MODE
 
 
 def test_after_tax_return():
@@ -15,3 +27,75 @@ def test_real_return():
 
 def test_real_return_from_nominal():
     assert real_return_from_nominal(0.17, 0.15, 0.025) == 0.1166
+
+
+def test_array_versions_match_scalar_tests():
+    assert after_tax_returns(0.17, 0.15) == 0.1445
+    assert real_returns(0.1445, 0.025) == 0.1166
+    assert real_returns_from_nominal(0.17, 0.15, 0.025) == 0.1166
+    assert real_returns_from_nominal([0.17], 0.15, 0.025).tolist() == [0.1166]
+
+
+def test_array_versions_broadcast_and_match_scalars():
+    generator = np.random.default_rng(23)
+    nominal = generator.uniform(0, 0.1, (50, 1, 1))
+    tax_rate = np.array([0.105, 0.175, 0.30, 0.33, 0.39]).reshape(1, 5, 1)
+    inflation = generator.uniform(-0.01, 0.05, (1, 1, 20))
+    real = real_returns_from_nominal(nominal, tax_rate, inflation)
+    assert real.shape == (50, 5, 20)
+    for (i, j, k), value in np.ndenumerate(real):
+        assert value == real_return_from_nominal(
+            nominal[i, 0, 0], tax_rate[0, j, 0], inflation[0, 0, k])
+
+
+def test_round_significant_matches_decimal():
+    generator = np.random.default_rng(4)
+    values = np.concatenate([
+        generator.uniform(-1, 1, 10000) * 10.0 ** generator.integers(-30, 30, 10000),
+        np.round(generator.uniform(0, 1, 10000), 5),
+        10.0 ** np.arange(-30, 30),
+        np.nextafter(10.0 ** np.arange(-30, 30), 0),
+        [0.12345, 0.00099995, 9.9995, 2.5e-5, 5e-324, 1e308]])
+    rounded = round_significant(values)
+    for value, result in zip(values.tolist(), rounded.tolist()):
+        assert result == after_tax_return(value, 0)
+
+
+def test_round_significant_passes_through_zero_and_non_finite():
+    rounded = round_significant([0.0, -0.0, np.inf, -np.inf, np.nan])
+    assert rounded[:4].tolist() == [0.0, -0.0, np.inf, -np.inf]
+    assert np.signbit(rounded[1])
+    assert np.isnan(rounded[4])
+
+
+def test_global_decimal_context_is_untouched():
+    assert getcontext().prec == 28
+
+
+def test_float_mode_rounds_to_significant_figures():
+    assert after_tax_return(0.17, 0.15, FLOAT_MODE) == 0.1445
+    assert real_return_from_nominal(0.17, 0.15, 0.025, FLOAT_MODE) == 0.1166
+    assert real_return(0.00012345678, 0, FLOAT_MODE) == 0.0001235
+    assert after_tax_returns([0.17, 1e-30], 0.15, FLOAT_MODE).tolist() == [
+        0.1445, 8.5e-31]
+
+
+def test_unrounded_mode():
+    assert after_tax_return(0.17, 0.15, UNROUNDED_MODE) == 0.17 * (1 - 0.15)
+    assert real_returns_from_nominal(0.17, 0.15, 0.025, UNROUNDED_MODE) == (
+        (1 + 0.17 * (1 - 0.15)) / (1 + 0.025)) - 1
+
+
+def test_modes_agree_away_from_ties():
+    generator = np.random.default_rng(24)
+    nominal = generator.uniform(0, 0.05, 1000)
+    for value in nominal.tolist():
+        assert after_tax_return(value, 0.33, FLOAT_MODE) == after_tax_return(
+            value, 0.33, DECIMAL_MODE)
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(Exception):
+        real_return(0.1, 0.02, 'exact')
+    with pytest.raises(Exception):
+        real_returns([0.1], 0.02, 'exact')
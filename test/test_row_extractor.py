@@ -0,0 +1,52 @@
+"""Tests row_extractor.py. """
+
+from src.data_provider import _get_accounts
+from src.data_provider import _get_call_account_html
+from src.data_provider import get_call_accounts_from_html
+from src.data_provider import STREAM_PARSER
+from src.row_extractor import extract_account_rows
+
+
+def test_extract_account_rows_matches_soup_on_sample():
+    html = _get_call_account_html(False)
+    assert(extract_account_rows(html) == _get_accounts(html))
+
+
+def test_extract_account_rows_carries_institution_forward():
+    html = """
+    <tr class="primary_row interest_financial_row_1">
+        <td class="inst-name">
+            <a class="interest_financial_link" title="ICBC ">ICBC </a>
+        </td>
+        <td>A</td><td>Smart Saver</td><td>$1</td><td>0.80</td>
+    </tr>
+    <tr class="interest_financial_row_0">
+        <td class="inst-name"></td>
+        <td></td><td>Other</td><td>$5,000</td><td>0.90</td>
+    </tr>"""
+    rows = extract_account_rows(html)
+    assert(rows == [['ICBC', 'A', 'Smart Saver', 1.0, 0.8, None, None],
+                    ['ICBC', None, 'Other', 5000.0, 0.9, None, None]])
+
+
+def test_extract_account_rows_uses_img_alt_and_indicator():
+    html = """
+    <tr class="primary_row"><td><a href="#" title="Apply"><img alt="TSB Bank" /></a></td>
+    <td>A-</td><td>WebSaver</td><td>$1,000</td>
+    <td><b>0.40<img class="interest_financial_indicator-down" /></b></td></tr>"""
+    assert(extract_account_rows(html) == [
+        ['TSB Bank', 'A-', 'WebSaver', 1000.0, 0.4, 'down', None]])
+
+
+def test_get_call_accounts_from_html_with_stream_parser():
+    accounts = get_call_accounts_from_html(
+        _get_call_account_html(False), STREAM_PARSER)
+    assert(len(accounts) == 116)
+
+
+def test_extract_account_rows_tags_institution_type():
+    html = """
+    <h2 class="pane-title">Banks</h2>
+    <tr class="primary_row"><td><a title="ASB">ASB</a></td>
+    <td>AA-</td><td>Savings</td><td>$0</td><td>0.05</td></tr>"""
+    assert(extract_account_rows(html)[0][6] == 'Banks')
@@ -0,0 +1,67 @@
+"""Tests scenario_grid.py. """
+
+import numpy as np
+import pytest
+
+from src.data_provider import get_call_accounts
+from src.return_adjustments import FLOAT_MODE
+from src.return_adjustments import real_return_from_nominal
+from src.scenario_grid import ACCOUNT_AXIS
+from src.scenario_grid import INFLATION_AXIS
+from src.scenario_grid import NZ_TAX_RATES
+from src.scenario_grid import ScenarioGrid
+from src.scenario_grid import TAX_AXIS
+
+INFLATIONS = (-0.005, 0.0, 0.015, 0.025, 0.04)
+
+
+def test_real_returns_match_scalar_function():
+    accounts = get_call_accounts()
+    grid = ScenarioGrid(accounts, INFLATIONS)
+    real = grid.real_returns()
+    assert(real.shape == (116, len(NZ_TAX_RATES), len(INFLATIONS)))
+    for (i, j, k), value in np.ndenumerate(real):
+        assert(value == real_return_from_nominal(
+            accounts[i].nominal / 100, NZ_TAX_RATES[j], INFLATIONS[k]))
+
+
+def test_small_chunks_give_the_same_grid():
+    accounts = get_call_accounts()
+    whole = ScenarioGrid(accounts, INFLATIONS)
+    chunked = ScenarioGrid(accounts, INFLATIONS, chunk_bytes=1)
+    assert(chunked.chunk_accounts == 1)
+    assert(np.array_equal(chunked.real_returns(), whole.real_returns()))
+    starts = [start for start, _ in ScenarioGrid(
+        accounts, INFLATIONS, chunk_bytes=10 * 64 * 30).iter_chunks()]
+    assert(starts == list(range(0, 116, 10)))
+
+
+def test_reduce_and_argmax_along_every_axis():
+    accounts = get_call_accounts()
+    grid = ScenarioGrid(accounts, INFLATIONS, chunk_bytes=7 * 64 * 30)
+    real = grid.real_returns()
+    for axis in (ACCOUNT_AXIS, TAX_AXIS, INFLATION_AXIS):
+        for ufunc in (np.maximum, np.minimum, np.add):
+            assert(np.allclose(grid.reduce(ufunc, axis),
+                               ufunc.reduce(real, axis=axis)))
+        assert(np.array_equal(grid.argmax(axis), real.argmax(axis=axis)))
+    assert(np.array_equal(grid.reduce(np.maximum, ACCOUNT_AXIS),
+                          real.max(axis=ACCOUNT_AXIS)))
+
+
+def test_best_accounts_per_tax_and_inflation():
+    accounts = get_call_accounts()
+    best = ScenarioGrid(accounts, INFLATIONS, mode=FLOAT_MODE).best_accounts()
+    assert(len(best) == len(NZ_TAX_RATES))
+    assert(all(len(row) == len(INFLATIONS) for row in best))
+    assert(best[0][0].name == 'Christmas Club')
+
+
+def test_empty_grid():
+    grid = ScenarioGrid([], INFLATIONS)
+    assert(grid.real_returns().shape == (0, len(NZ_TAX_RATES), len(INFLATIONS)))
+    assert(grid.reduce(np.maximum, TAX_AXIS).shape == (0, len(INFLATIONS)))
+    with pytest.raises(Exception):
+        grid.argmax(ACCOUNT_AXIS)
+    with pytest.raises(Exception):
+        grid.reduce(np.maximum, ACCOUNT_AXIS)
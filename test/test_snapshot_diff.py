@@ -0,0 +1,56 @@
+"""Tests snapshot_diff.py. """
+
+from src.call_account import CallAccount
+from src.data_provider import get_call_accounts
+from src.snapshot_diff import account_key
+from src.snapshot_diff import diff_accounts
+
+
+def _accounts():
+    return [CallAccount(['ANZ', 'AA-', 'Online', 1, 0.05]),
+            CallAccount(['ANZ', 'AA-', 'Select', 5000, 0.05]),
+            CallAccount(['BNZ', 'AA-', 'Call', 1, 0.01])]
+
+
+def test_diff_of_same_snapshot_is_empty():
+    diff = diff_accounts(get_call_accounts(), get_call_accounts())
+    assert(not diff)
+    assert(diff.added == [] and diff.removed == [] and diff.changed == [])
+
+
+def test_diff_reports_added_removed_and_changed():
+    previous = _accounts()
+    current = _accounts()
+    current[1].nominal = 0.10
+    current[1].movement = 'up'
+    del current[2]
+    current.append(CallAccount(['ASB', 'AA-', 'Saver', 1, 0.2]))
+    diff = diff_accounts(previous, current)
+    assert([account.institution for account in diff.added] == ['ASB'])
+    assert([account.institution for account in diff.removed] == ['BNZ'])
+    assert(diff.changed == [(previous[1], current[1])])
+    assert(diff.indicator_mismatches() == [])
+
+
+def test_indicator_mismatches():
+    previous = _accounts()
+    current = _accounts()
+    current[0].nominal = 0.04
+    current[2].movement = 'down'
+    diff = diff_accounts(previous, current)
+    assert(diff.indicator_mismatches() == [current[0], current[2]])
+
+
+def test_apply_to_updates_only_deltas():
+    previous = _accounts()
+    current = _accounts()[1:]
+    current[0].nominal = 0.5
+    by_key = dict((account_key(account), account) for account in previous)
+    diff_accounts(previous, current).apply_to(by_key)
+    assert(list(by_key.values()) == [current[0], previous[2]])
+
+
+def test_sample_accounts_expose_movement():
+    movements = [account.movement for account in get_call_accounts()]
+    assert(movements.count('down') == 6)
+    assert(movements.count('up') == 0)